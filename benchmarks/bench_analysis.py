@@ -0,0 +1,49 @@
+"""Benchmarks for the position analysis."""
+import random
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from othello.game.analysis import Analysis, get_features, stable_discs
+from othello.game.bitboard import BitBoard
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+
+
+@pytest.fixture
+def endgame() -> GameState:
+    """Returns an 8x8 position after 44 random moves."""
+    rng = random.Random(0)
+    game_state = GameState.new_game(8, BitBoard)
+    for _ in range(44):
+        legal_moves = game_state.legal_moves()
+        move = Move.play(rng.choice(legal_moves)) if legal_moves else Move.pass_turn()
+        game_state = game_state.apply_move(move)
+    return game_state
+
+
+def test_stable_discs(benchmark: BenchmarkFixture, endgame: GameState) -> None:
+    """Benchmark finding stable discs from scratch."""
+    benchmark(stable_discs, *endgame.board.get_masks(Player.BLACK), 8)
+
+
+def test_get_features(benchmark: BenchmarkFixture, endgame: GameState) -> None:
+    """Benchmark computing all features from scratch."""
+    benchmark(get_features, *endgame.board.get_masks(Player.BLACK), 8)
+
+
+def test_analysis_update(benchmark: BenchmarkFixture, endgame: GameState) -> None:
+    """Benchmark following a move and finding stable discs incrementally."""
+    analysis = Analysis(endgame.board)
+    analysis.stable(Player.BLACK)
+    board_undo = endgame.make_move(Move.play(endgame.legal_moves()[0])).board_undo
+    assert board_undo is not None
+
+    def update() -> int:
+        analysis.update(*board_undo)
+        stable = analysis.stable(Player.BLACK)
+        analysis.take_back()
+        return stable
+
+    benchmark(update)
@@ -0,0 +1,13 @@
+"""Benchmarks for batched random games."""
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("numpy")
+
+from othello.game.batch import random_games  # noqa: E402,I100,I202
+
+
+@pytest.mark.parametrize("size", [8, 16], ids=lambda size: f"{size}x{size}")
+def test_random_games(benchmark: BenchmarkFixture, size: int) -> None:
+    """Benchmark a batch of 100 random games."""
+    benchmark.pedantic(random_games, args=(100, size, size), rounds=3)
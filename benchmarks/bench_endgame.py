@@ -0,0 +1,28 @@
+"""Benchmarks for the endgame solver."""
+import random
+
+from _pytest.fixtures import SubRequest
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from othello.game.bitboard import BitBoard
+from othello.game.endgame import solve
+from othello.game.game_state import GameState
+from othello.game.move import Move
+
+
+@pytest.fixture(params=[10, 12, 14], ids=lambda empties: f"{empties}-empties")
+def endgame(request: SubRequest) -> GameState:
+    """Returns an 8x8 position with the given number of empties."""
+    rng = random.Random(request.param)
+    game_state = GameState.new_game(8, BitBoard)
+    for _ in range(60 - request.param):
+        legal_moves = game_state.legal_moves()
+        move = Move.play(rng.choice(legal_moves)) if legal_moves else Move.pass_turn()
+        game_state = game_state.apply_move(move)
+    return game_state
+
+
+def test_solve(benchmark: BenchmarkFixture, endgame: GameState) -> None:
+    """Benchmark solving a random 8x8 endgame exactly."""
+    benchmark.pedantic(solve, args=(endgame,), rounds=3)
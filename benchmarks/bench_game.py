@@ -0,0 +1,112 @@
+"""Benchmarks for the game core hot paths."""
+import random
+from typing import Dict, Tuple, Type
+
+from _pytest.fixtures import SubRequest
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from othello.agent.random_bot import RandomBot
+from othello.game.backends import BACKENDS
+from othello.game.board import Board
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.game.point import Point
+from othello.match import play_game
+
+SIZES = [4, 8, 16, 26]
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"{size}x{size}")
+def size(request: SubRequest) -> int:
+    """Returns a board size."""
+    return request.param
+
+
+@pytest.fixture(params=list(BACKENDS))
+def board_type(request: SubRequest) -> Type[Board]:
+    """Returns a Board implementation."""
+    return BACKENDS[request.param]
+
+
+@pytest.fixture
+def midgame(size: int, board_type: Type[Board]) -> GameState:
+    """Returns a game state with about half of the board filled."""
+    rng = random.Random(size)
+    game_state = GameState.new_game(size, board_type)
+    for _ in range(size * size // 2 - 4):
+        legal_moves = game_state.legal_moves()
+        if not legal_moves:
+            break
+        game_state = game_state.apply_move(Move.play(rng.choice(legal_moves)))
+    return game_state
+
+
+def fresh_state(game_state: GameState) -> GameState:
+    """Returns a copy of a game state that has not generated its moves."""
+    return GameState(
+        game_state.board,
+        game_state.current_player,
+        game_state.last_move,
+        game_state.second_last_move,
+    )
+
+
+def test_get_valid_moves(benchmark: BenchmarkFixture, midgame: GameState) -> None:
+    """Benchmark move generation with flips."""
+    benchmark(midgame.board.get_valid_moves, midgame.current_player)
+
+
+def test_place_disc(benchmark: BenchmarkFixture, midgame: GameState) -> None:
+    """Benchmark a single disc placement on a fresh copy of the board."""
+    point = midgame.legal_moves()[0]
+
+    def setup() -> Tuple[Tuple[Board, Player, Point], Dict[str, object]]:
+        return (midgame.board.copy(), midgame.current_player, point), {}
+
+    benchmark.pedantic(
+        lambda board, player, point: board.place_disc(player, point),
+        setup=setup,
+        rounds=200,
+    )
+
+
+def test_apply_move(benchmark: BenchmarkFixture, midgame: GameState) -> None:
+    """Benchmark an immutable game state transition, including validation."""
+    move = Move.play(midgame.legal_moves()[0])
+
+    def setup() -> Tuple[Tuple[GameState, Move], Dict[str, object]]:
+        return (fresh_state(midgame), move), {}
+
+    benchmark.pedantic(
+        lambda game_state, move: game_state.apply_move(move), setup=setup, rounds=200
+    )
+
+
+def test_legal_moves(benchmark: BenchmarkFixture, midgame: GameState) -> None:
+    """Benchmark listing the legal moves of a game state."""
+
+    def setup() -> Tuple[Tuple[GameState], Dict[str, object]]:
+        return (fresh_state(midgame),), {}
+
+    benchmark.pedantic(
+        lambda game_state: game_state.legal_moves(), setup=setup, rounds=200
+    )
+
+
+def test_count_discs(benchmark: BenchmarkFixture, midgame: GameState) -> None:
+    """Benchmark disc counting."""
+    benchmark(midgame.board.count_discs, Player.BLACK)
+
+
+def test_random_playout(
+    benchmark: BenchmarkFixture, size: int, board_type: Type[Board]
+) -> None:
+    """Benchmark a full game between random bots."""
+
+    def playout() -> GameState:
+        random.seed(size)
+        return play_game(RandomBot(), RandomBot(), size, board_type)
+
+    benchmark.pedantic(playout, rounds=3 if size > 8 else 20)
@@ -0,0 +1,60 @@
+"""Benchmarks for the pattern evaluator."""
+import random
+from typing import Dict, Tuple
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from othello.agent.alphabeta_bot import evaluate
+from othello.agent.pattern import default_weights, PatternEvaluator
+from othello.game.bitboard import BitBoard
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+
+
+@pytest.fixture
+def midgame() -> GameState:
+    """Returns an 8x8 position after 30 random moves."""
+    rng = random.Random(0)
+    game_state = GameState.new_game(8, BitBoard)
+    for _ in range(30):
+        legal_moves = game_state.legal_moves()
+        move = Move.play(rng.choice(legal_moves)) if legal_moves else Move.pass_turn()
+        game_state = game_state.apply_move(move)
+    return game_state
+
+
+@pytest.fixture(scope="module")
+def evaluator() -> PatternEvaluator:
+    """Returns an evaluator with the default 8x8 weights."""
+    return PatternEvaluator(default_weights(8))
+
+
+def test_evaluate_heuristic(benchmark: BenchmarkFixture, midgame: GameState) -> None:
+    """Benchmark the corner, mobility and disc heuristic."""
+
+    def setup() -> Tuple[Tuple[GameState], Dict[str, object]]:
+        # A fresh game state, so that its moves are generated every round.
+        game_state = GameState(midgame.board, midgame.current_player)
+        return (game_state,), {}
+
+    benchmark.pedantic(evaluate, setup=setup, rounds=1000)
+
+
+def test_evaluate_patterns(
+    benchmark: BenchmarkFixture, midgame: GameState, evaluator: PatternEvaluator
+) -> None:
+    """Benchmark pattern evaluation with indices kept up to date."""
+    indices = evaluator.indices(*midgame.board.get_masks(Player.BLACK))
+    benchmark(evaluator.evaluate, midgame, indices)
+
+
+def test_update_indices(
+    benchmark: BenchmarkFixture, midgame: GameState, evaluator: PatternEvaluator
+) -> None:
+    """Benchmark updating pattern indices after a move."""
+    indices = evaluator.indices(*midgame.board.get_masks(Player.BLACK))
+    undo = midgame.make_move(Move.play(midgame.legal_moves()[0]))
+    assert undo.board_undo is not None
+    benchmark(evaluator.update, indices, undo.board_undo)
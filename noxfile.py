@@ -7,7 +7,7 @@ from nox.sessions import Session
 
 
 nox.options.sessions = "lint", "safety", "mypy", "tests"
-locations = "othello", "tests", "noxfile.py", "docs/conf.py"
+locations = "othello", "tests", "benchmarks", "noxfile.py", "docs/conf.py"
 
 
 def install_with_constraints(session: Session, *args: str, **kwargs: Any) -> None:
@@ -73,7 +73,7 @@ def safety(session: Session) -> None:
 def tests(session: Session) -> None:
     """Type-check using mypy."""
     args = session.posargs or ["--cov"]
-    session.run("poetry", "install", "--no-dev", external=True)
+    session.run("poetry", "install", "--no-dev", "--extras=numpy", external=True)
     install_with_constraints(
         session, "coverage[toml]", "pytest", "pytest-cov", "pytest-mock"
     )
@@ -88,6 +88,31 @@ def mypy(session: Session) -> None:
     session.run("mypy", *args)
 
 
+@nox.session(python="3.8")
+def benchmarks(session: Session) -> None:
+    """Run the benchmarks, comparing with a local baseline if asked to."""
+    # Timings only mean something on the machine and interpreter that took
+    # them, so baselines stay out of the repository. Record one with
+    # "nox -s benchmarks -- --benchmark-save=baseline", then pass "compare"
+    # to fail on regressions against the newest one.
+    args = session.posargs
+    if args[:1] == ["compare"]:
+        args = [
+            "--benchmark-compare",
+            "--benchmark-compare-fail=mean:25%",
+            *args[1:],
+        ]
+    session.run("poetry", "install", "--no-dev", "--extras=numpy", external=True)
+    install_with_constraints(session, "pytest", "pytest-benchmark")
+    session.run(
+        "pytest",
+        "benchmarks",
+        "--override-ini=python_files=bench_*.py",
+        "--benchmark-storage=benchmarks/baselines",
+        *args,
+    )
+
+
 @nox.session(python="3.8")
 def docs(session: Session) -> None:
     """Build the documentation."""
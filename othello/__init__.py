@@ -1,11 +1,23 @@
 """Othello board game."""
-try:
-    from importlib.metadata import version, PackageNotFoundError  # type: ignore
-except ImportError:  # pragma: no cover
-    from importlib_metadata import version, PackageNotFoundError  # type: ignore
 
 
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "unknown"
+def __getattr__(name: str) -> str:
+    """Look the package version up on first access.
+
+    Finding it with importlib.metadata takes longer than importing the
+    rest of the package, so it is read from the plugin index instead.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        Version string, "unknown" if the package is not installed.
+
+    Raises:
+        AttributeError: If the attribute is not the package version.
+    """
+    if name == "__version__":
+        from othello import plugins
+
+        return plugins.get_index().version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
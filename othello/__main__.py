@@ -1,15 +1,42 @@
-"""Command-line interface."""
+"""Command-line interface.
+
+Modules that only some commands need are imported by those commands, to
+keep startup fast.
+"""
+from __future__ import annotations
+
 import argparse
+import contextlib
+import random
 import time
-from typing import Dict, List, Type
-
-import pkg_resources
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TYPE_CHECKING,
+)
 
-from othello import __version__
-from othello.agent.base import Agent
+from othello import __version__, plugins
+from othello.agent.base import Agent, create_agent
 from othello.agent.human import Human
+from othello.agent.random_bot import RandomBot
+from othello.game.backends import get_backend_names, get_board_type
+from othello.game.board import BoardSizeError
 from othello.game.game_state import GameState, InvalidMoveError
+from othello.game.move import Move
 from othello.game.player import Player
+from othello.instrument import Instrument
+from othello.match import play_game, run_match
+from othello.record import GameRecord, read_records, RecordFormatError, RecordWriter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from othello.tournament import GameOutcome
 
 
 def get_parser(agent_choices: List[str]) -> argparse.ArgumentParser:
@@ -17,7 +44,9 @@ def get_parser(agent_choices: List[str]) -> argparse.ArgumentParser:
 
     Parser has two command-line flags, one for each color. For each color,
     an agent corresponding to an entrypoint name can be supplied. By default,
-    human is passed for both colors.
+    human is passed for both colors. A per-move time limit can also be given
+    for bots that search. Subcommands run headless matches and tournaments
+    between bots instead of an interactive game.
 
     Args:
         agent_choices: List of possible agent choices.
@@ -45,19 +74,311 @@ def get_parser(agent_choices: List[str]) -> argparse.ArgumentParser:
         choices=agent_choices,
         default="human",
     )
+    _add_time_limit_argument(parser, None)
+    _add_agent_arguments(parser, None)
+
+    subparsers = parser.add_subparsers(dest="command", title="commands")
+    _add_match_parser(subparsers, agent_choices)
+    _add_tournament_parser(subparsers, agent_choices)
+    _add_perft_parser(subparsers)
+    _add_simulate_parser(subparsers)
+    _add_book_parser(subparsers, agent_choices)
+    _add_solve_parser(subparsers)
+    _add_dataset_parser(subparsers)
+    _add_serve_parser(subparsers)
+    _add_loadgen_parser(subparsers)
     return parser
 
 
-def get_agents() -> Dict[str, Type[Agent]]:
-    """Returns dict of agents.
+def _add_match_parser(
+    subparsers: argparse._SubParsersAction, agent_choices: List[str]
+) -> None:
+    parser = subparsers.add_parser(
+        "match", help="Play headless games between two agents"
+    )
+    parser.add_argument("first", help="First agent", choices=agent_choices)
+    parser.add_argument("second", help="Second agent", choices=agent_choices)
+    parser.add_argument("--games", "-n", help="Number of games", type=int, default=100)
+    parser.add_argument("--size", "-s", help="Board size", type=int, default=8)
+    _add_record_argument(parser)
+    parser.add_argument(
+        "--stats",
+        help="Write per-move search statistics to this file",
+        default=None,
+    )
+    parser.add_argument(
+        "--profile-ply",
+        help="Profile this ply of every game into the statistics path plus .prof",
+        type=int,
+        default=None,
+    )
+    _add_time_limit_argument(parser, argparse.SUPPRESS)
+    _add_agent_arguments(parser, argparse.SUPPRESS)
+
+
+def _add_tournament_parser(
+    subparsers: argparse._SubParsersAction, agent_choices: List[str]
+) -> None:
+    parser = subparsers.add_parser(
+        "tournament", help="Play a round robin or gauntlet over worker processes"
+    )
+    parser.add_argument(
+        "entrants", help="Agents taking part", choices=agent_choices, nargs="+"
+    )
+    parser.add_argument(
+        "--games", "-n", help="Number of games per pairing", type=int, default=10
+    )
+    parser.add_argument(
+        "--gauntlet",
+        "-g",
+        help="Only pair this agent against every other entrant",
+        choices=agent_choices,
+        default=None,
+    )
+    parser.add_argument(
+        "--jobs", "-j", help="Worker processes (default: one per core)", type=int
+    )
+    parser.add_argument(
+        "--seed", help="Base seed for per-game seeding", type=int, default=0
+    )
+    parser.add_argument("--size", "-s", help="Board size", type=int, default=8)
+    _add_record_argument(parser)
+    _add_time_limit_argument(parser, argparse.SUPPRESS)
+    _add_agent_arguments(parser, argparse.SUPPRESS)
+
+
+def _add_perft_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "perft", help="Count game tree leaves to benchmark move generation"
+    )
+    parser.add_argument("--depth", "-d", help="Search depth", type=int, default=6)
+    parser.add_argument("--size", "-s", help="Board size", type=int, default=8)
+    parser.add_argument(
+        "--backend",
+        help="Board implementation",
+        choices=get_backend_names(),
+        default="grid",
+    )
+    parser.add_argument(
+        "--divide", help="Print leaf counts per root move", action="store_true"
+    )
+
+
+def _add_simulate_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "simulate", help="Play random games in a batch to benchmark playouts"
+    )
+    parser.add_argument("--games", "-n", help="Number of games", type=int, default=1000)
+    parser.add_argument("--size", "-s", help="Board size", type=int, default=8)
+    parser.add_argument("--seed", help="Random seed", type=int, default=None)
+    parser.add_argument(
+        "--sequential",
+        help="Play the games one at a time with RandomBot for comparison",
+        action="store_true",
+    )
+    _add_record_argument(parser)
+
+
+def _add_book_parser(
+    subparsers: argparse._SubParsersAction, agent_choices: List[str]
+) -> None:
+    parser = subparsers.add_parser(
+        "book", help="Build an opening book from self-play games"
+    )
+    parser.add_argument("output", help="Path of the book file to write")
+    parser.add_argument(
+        "--agent", "-a", help="Self-play agent", choices=agent_choices, default="random"
+    )
+    parser.add_argument("--games", "-n", help="Number of games", type=int, default=100)
+    parser.add_argument(
+        "--plies", "-p", help="Opening plies kept per game", type=int, default=12
+    )
+    parser.add_argument(
+        "--random-plies",
+        help="Random moves opening each game",
+        type=int,
+        default=4,
+    )
+    parser.add_argument("--size", "-s", help="Board size", type=int, default=8)
+    parser.add_argument("--seed", help="Random seed", type=int, default=0)
+    _add_time_limit_argument(parser, argparse.SUPPRESS)
+
+
+def _add_solve_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "solve", help="Find the exact result and best move of an endgame position"
+    )
+    parser.add_argument(
+        "position",
+        help="Squares row by row: X for black, O for white and - for empty",
+    )
+    parser.add_argument(
+        "--player",
+        "-p",
+        help="Player to move",
+        choices=["black", "white"],
+        default="black",
+    )
+
+
+def _add_dataset_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "dataset", help="Export the positions of recorded games for training"
+    )
+    parser.add_argument("records", help="Path of the game record file to read")
+    parser.add_argument("output", help="Path of the dataset file to write")
+    parser.add_argument("--size", "-s", help="Board size", type=int, default=8)
+
+
+def _add_serve_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "serve", help="Host games against the bots for remote clients"
+    )
+    parser.add_argument("--host", help="Address to listen on", default="127.0.0.1")
+    parser.add_argument("--port", "-p", help="Port to listen on", type=int)
+    parser.add_argument(
+        "--workers", help="Processes selecting the bots' moves", type=int
+    )
+    _add_time_limit_argument(parser, argparse.SUPPRESS)
+    _add_agent_arguments(parser, argparse.SUPPRESS)
+
+
+def _add_loadgen_parser(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser(
+        "loadgen", help="Measure the throughput of a game server"
+    )
+    parser.add_argument("--host", help="Address of the server", default="127.0.0.1")
+    parser.add_argument("--port", "-p", help="Port of the server", type=int)
+    parser.add_argument(
+        "--sessions", "-c", help="Concurrent sessions", type=int, default=100
+    )
+    parser.add_argument(
+        "--games", "-n", help="Number of games per session", type=int, default=1
+    )
+    parser.add_argument("--agent", "-a", help="Bot to play against", default="random")
+    parser.add_argument("--size", "-s", help="Board size", type=int, default=8)
+    parser.add_argument("--seed", help="Random seed", type=int, default=None)
+
+
+def _add_time_limit_argument(parser: argparse.ArgumentParser, default: object) -> None:
+    parser.add_argument(
+        "--time-limit",
+        "-t",
+        help="Seconds per move for searching bots",
+        type=float,
+        default=default,
+    )
+
+
+def _add_agent_arguments(parser: argparse.ArgumentParser, default: object) -> None:
+    parser.add_argument(
+        "--book",
+        help="Opening book file for the bots that play from one",
+        default=default,
+    )
+    parser.add_argument(
+        "--weights",
+        help="Pattern weights file for the bots that evaluate with them",
+        default=default,
+    )
+    parser.add_argument(
+        "--search-jobs",
+        help="Processes each bot that searches in parallel uses",
+        type=int,
+        default=default,
+    )
+
+
+def _add_record_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--record",
+        help="Append every finished game to this record file (.gz to compress)",
+        default=None,
+    )
+
+
+def open_record(path: Optional[str]) -> ContextManager[Optional[RecordWriter]]:
+    """Open a record file for appending, if one was requested.
+
+    Args:
+        path: Path of the record file, None to record nothing.
+
+    Returns:
+        Context manager giving a RecordWriter, or None without a path.
+    """
+    if path is None:
+        return contextlib.nullcontext()
+    return RecordWriter(path, append=True)
+
+
+@contextlib.contextmanager
+def open_agent_options(args: argparse.Namespace) -> Iterator[Dict[str, Any]]:
+    """Open the files of the agent options given on the command line.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Yields:
+        Options for create_agent, open until the context exits.
+
+    Raises:
+        SystemExit: If a file cannot be read.
+    """
+    options: Dict[str, Any] = {}
+    with contextlib.ExitStack() as stack:
+        if args.book is not None:
+            from othello.book import BookFormatError, OpeningBook
+
+            try:
+                options["book"] = stack.enter_context(OpeningBook(args.book))
+            except (OSError, BookFormatError) as error:
+                raise SystemExit(f"Cannot read opening book: {error}")
+        if args.weights is not None:
+            from othello.agent.pattern import (
+                PatternEvaluator,
+                read_weights,
+                WeightsFormatError,
+            )
+
+            try:
+                options["evaluator"] = PatternEvaluator(read_weights(args.weights))
+            except (OSError, WeightsFormatError) as error:
+                raise SystemExit(f"Cannot read pattern weights: {error}")
+        if args.search_jobs is not None:
+            options["jobs"] = args.search_jobs
+        yield options
+
+
+def open_instrument(
+    path: Optional[str], profile_ply: Optional[int]
+) -> ContextManager[Optional[Instrument]]:
+    """Open a statistics file for the moves of a match, if one was requested.
+
+    Args:
+        path: Path of the statistics file, None to record nothing.
+        profile_ply: Ply of every game to profile, None to profile nothing.
 
     Returns:
-        Dictionary mapping agent entrypoints name to Agent instances.
+        Context manager giving an Instrument, or None without a path.
+
+    Raises:
+        SystemExit: If profiling is requested without a statistics file.
     """
-    agents = {}
-    for entry_point in pkg_resources.iter_entry_points("agents"):
-        agents[entry_point.name] = entry_point.load()
-    return agents
+    if path is None:
+        if profile_ply is not None:
+            raise SystemExit("--profile-ply requires --stats")
+        return contextlib.nullcontext()
+    return Instrument(path, profile_ply)
+
+
+def get_agents() -> Mapping[str, Type[Agent]]:
+    """Returns the registered agents.
+
+    Returns:
+        Mapping of agent entry point names to Agent types, each imported
+        when first looked up.
+    """
+    return plugins.Agents(plugins.get_index().agents)
 
 
 def main() -> None:
@@ -67,9 +388,300 @@ def main() -> None:
     parser = get_parser(list(agents.keys()))
     args = parser.parse_args()
 
+    if args.command == "match":
+        with open_record(args.record) as writer, open_instrument(
+            args.stats, args.profile_ply
+        ) as instrument, open_agent_options(args) as options:
+            result = run_match(
+                agents[args.first],
+                agents[args.second],
+                args.games,
+                args.size,
+                args.time_limit,
+                on_game=writer.write if writer else None,
+                instrument=instrument,
+                names=(args.first, args.second),
+                options=options,
+            )
+        print(result)
+    elif args.command == "tournament":
+        from othello import tournament
+
+        names = args.entrants + ([args.gauntlet] if args.gauntlet else [])
+        entrants = {name: agents[name] for name in names}
+        with open_record(args.record) as writer, open_agent_options(args) as options:
+            crosstable = tournament.run(
+                entrants,
+                args.games,
+                args.gauntlet,
+                args.jobs,
+                args.seed,
+                args.size,
+                args.time_limit,
+                on_outcome=outcome_handler(args.size, writer),
+                options=options,
+            )
+        print(crosstable)
+    elif args.command == "perft":
+        run_perft(args.size, args.depth, args.backend, args.divide)
+    elif args.command == "simulate":
+        with open_record(args.record) as writer:
+            run_simulate(args.games, args.size, args.seed, args.sequential, writer)
+    elif args.command == "book":
+        from othello import book
+
+        records = book.self_play(
+            agents[args.agent],
+            args.games,
+            args.size,
+            args.random_plies,
+            args.time_limit,
+            args.seed,
+        )
+        count = book.write_book(records, args.output, args.size, args.plies)
+        print(f"Wrote {count} book moves to {args.output}")
+    elif args.command == "solve":
+        run_solve(read_position(parser, args.position, args.player))
+    elif args.command == "dataset":
+        run_dataset(args.records, args.output, args.size)
+    elif args.command == "serve":
+        from othello import server
+
+        port = server.DEFAULT_PORT if args.port is None else args.port
+        with open_agent_options(args) as options:
+            server.serve(
+                agents, args.host, port, args.time_limit, args.workers, options
+            )
+    elif args.command == "loadgen":
+        run_loadgen(args)
+    else:
+        with open_agent_options(args) as options:
+            play(agents[args.black], agents[args.white], args.time_limit, options)
+
+
+def print_outcome(outcome: GameOutcome) -> None:
+    """Print the result of a finished tournament game.
+
+    Args:
+        outcome: Finished game.
+    """
+    print(
+        f"Game {outcome.number + 1}: {outcome.black} (black) "
+        f"{outcome.black_discs}-{outcome.white_discs} {outcome.white} (white)"
+    )
+
+
+def outcome_handler(
+    board_size: int, writer: Optional[RecordWriter]
+) -> Callable[[GameOutcome], None]:
+    """Returns a callback printing and recording finished tournament games.
+
+    Args:
+        board_size: Board size of the tournament.
+        writer: Writer for the game records, None to only print.
+
+    Returns:
+        Callback taking a GameOutcome.
+    """
+    if writer is None:
+        return print_outcome
+
+    def handle(outcome: GameOutcome) -> None:
+        print_outcome(outcome)
+        writer.write(outcome.to_record(board_size))
+
+    return handle
+
+
+def run_perft(board_size: int, depth: int, backend: str, show_divide: bool) -> None:
+    """Run perft from the initial position and print throughput.
+
+    Args:
+        board_size: Board size.
+        depth: Search depth.
+        backend: Name of the board implementation.
+        show_divide: Whether to print leaf counts per root move.
+    """
+    from othello.game.perft import divide
+
+    game_state = GameState.new_game(board_size, get_board_type(backend))
+    start = time.perf_counter()
+    counts = divide(game_state, depth)
+    seconds = time.perf_counter() - start
+    if show_divide:
+        for move, count in counts:
+            notation = Human.point_to_notation(move.point) if move.point else "pass"
+            print(f"{notation}: {count}")
+    nodes = sum(count for _, count in counts)
+    rate = nodes / seconds if seconds > 0 else 0.0
+    print(f"Nodes: {nodes}")
+    print(f"Time: {seconds:.3f}s ({rate:.0f} nodes/s)")
+
+
+def run_simulate(
+    games: int,
+    board_size: int,
+    seed: Optional[int],
+    sequential: bool,
+    writer: Optional[RecordWriter] = None,
+) -> None:
+    """Play random games from the initial position and print throughput.
+
+    Args:
+        games: Number of games.
+        board_size: Board size.
+        seed: Random seed.
+        sequential: Whether to play one game at a time instead of a batch.
+        writer: Writer for the game records, None to record nothing.
+
+    Raises:
+        SystemExit: If batches are requested and numpy is not installed.
+    """
+    start = time.perf_counter()
+    if sequential:
+        random.seed(seed)
+        differentials = []
+        for _ in range(games):
+            moves: List[Move] = []
+            game_state = play_game(RandomBot(), RandomBot(), board_size, moves=moves)
+            board = game_state.board
+            differentials.append(
+                board.count_discs(Player.BLACK) - board.count_discs(Player.WHITE)
+            )
+            if writer is not None:
+                record = GameRecord.from_game(game_state, moves, "random", "random")
+                writer.write(record)
+    else:
+        try:
+            from othello.game.batch import random_games
+        except ImportError:
+            raise SystemExit("Batched simulation requires the numpy extra")
+        result = random_games(games, board_size, seed, record=writer is not None)
+        differentials = (result.black_discs - result.white_discs).tolist()
+        if writer is not None:
+            for game, (black, white) in enumerate(
+                zip(result.black_discs.tolist(), result.white_discs.tolist())
+            ):
+                moves = result.game_moves(game)
+                record = GameRecord(board_size, "random", "random", moves, black, white)
+                writer.write(record)
+    seconds = time.perf_counter() - start
+    black_wins = sum(differential > 0 for differential in differentials)
+    white_wins = sum(differential < 0 for differential in differentials)
+    rate = games / seconds if seconds > 0 else 0.0
+    print(
+        f"Black wins: {black_wins}, white wins: {white_wins}, "
+        f"draws: {games - black_wins - white_wins}"
+    )
+    print(f"Games: {games}")
+    print(f"Time: {seconds:.3f}s ({rate:.0f} games/s)")
+
+
+def read_position(
+    parser: argparse.ArgumentParser, position: str, player_name: str
+) -> GameState:
+    """Parse the position given to the solve command.
+
+    Args:
+        parser: Parser reporting invalid positions.
+        position: Squares row by row.
+        player_name: Color of the player to move.
+
+    Returns:
+        GameState instance.
+    """
+    from othello.game.endgame import parse_position
+
+    player = Player.WHITE if player_name == "white" else Player.BLACK
+    try:
+        return parse_position(position, player)
+    except (ValueError, BoardSizeError) as error:
+        parser.error(str(error))
+
+
+def run_solve(game_state: GameState) -> None:
+    """Solve a position exactly and print the result and throughput.
+
+    Args:
+        game_state: Position to solve.
+    """
+    from othello.game.endgame import solve
+
+    start = time.perf_counter()
+    solution = solve(game_state)
+    seconds = time.perf_counter() - start
+    if solution.move is not None:
+        print(f"Best move: {Human.point_to_notation(solution.move)}")
+    else:
+        print("Best move: pass")
+    print(f"Score: {solution.score:+d}")
+    rate = solution.nodes / seconds if seconds > 0 else 0.0
+    print(f"Nodes: {solution.nodes}")
+    print(f"Time: {seconds:.3f}s ({rate:.0f} nodes/s)")
+
+
+def run_dataset(records_path: str, output: str, board_size: int) -> None:
+    """Export the positions of recorded games to a dataset file.
+
+    Args:
+        records_path: Path of the game record file.
+        output: Path of the dataset file.
+        board_size: Board size of the recorded games.
+
+    Raises:
+        SystemExit: If the records cannot be read or exported.
+    """
+    from othello.dataset import write_dataset
+
+    try:
+        count = write_dataset(read_records(records_path), output, board_size)
+    except (OSError, RecordFormatError, ValueError) as error:
+        raise SystemExit(f"Cannot export {records_path}: {error}")
+    print(f"Wrote {count} positions to {output}")
+
+
+def run_loadgen(args: argparse.Namespace) -> None:
+    """Play concurrent sessions against a game server and print throughput.
+
+    Args:
+        args: Arguments of the loadgen command.
+
+    Raises:
+        SystemExit: If the server cannot be reached or misbehaves.
+    """
+    import asyncio
+
+    from othello import loadgen
+    from othello.server import DEFAULT_PORT
+
+    port = DEFAULT_PORT if args.port is None else args.port
+    load = loadgen.run_load(
+        args.host, port, args.sessions, args.games, args.agent, args.size, args.seed
+    )
+    try:
+        result = asyncio.run(load)
+    except (OSError, loadgen.ServerError) as error:
+        raise SystemExit(f"Load test failed: {error}")
+    print(result)
+
+
+def play(
+    black: Type[Agent],
+    white: Type[Agent],
+    time_limit: Optional[float],
+    options: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """Play an interactive game, displaying the board after every move.
+
+    Args:
+        black: Agent type for black.
+        white: Agent type for white.
+        time_limit: Seconds per move for searching bots.
+        options: Options offered to the agent constructors.
+    """
     player = {}
-    player[Player.BLACK] = agents[args.black]()
-    player[Player.WHITE] = agents[args.white]()
+    player[Player.BLACK] = create_agent(black, time_limit, options)
+    player[Player.WHITE] = create_agent(white, time_limit, options)
 
     game_state = GameState.new_game()
 
@@ -77,6 +689,9 @@ def main() -> None:
         # ANSI escape sequence to erase display
         print(chr(27) + "[2J")
 
+        last_search = player[game_state.current_player.other].last_search
+        if last_search is not None:
+            print(f"Last search: {last_search}")
         print(game_state.board)
         print(f"Player turn: {game_state.current_player}")
         valid_moves = game_state.legal_moves()
@@ -97,6 +712,8 @@ def main() -> None:
 
         # prevent bots from moving too fast
         time.sleep(0.5)
+    for agent in player.values():
+        agent.close()
     winner = game_state.winner()
     if winner:
         print(f"The winner is {winner}")
@@ -0,0 +1,322 @@
+"""Alpha-beta search agent module."""
+import functools
+import time
+from typing import Dict, List, Optional, Tuple
+
+from othello.agent.base import Agent, SearchInfo
+from othello.agent.pattern import PatternEvaluator
+from othello.agent.transposition import get_bound, TranspositionTable
+from othello.book import OpeningBook
+from othello.game import endgame
+from othello.game.bitboard import BitBoard
+from othello.game.game_state import GameState, StateUndo
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.game.point import Point
+
+DEFAULT_TIME_LIMIT = 1.0
+DEFAULT_SOLVE_EMPTIES = 10
+WIN_SCORE = 10000
+# Heuristic scores are clamped below the score of any won game, so that the
+# search never prefers an evaluation to a certain win.
+MAX_HEURISTIC = WIN_SCORE - 1
+CORNER_WEIGHT = 50
+MOBILITY_WEIGHT = 10
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+    pass
+
+
+@functools.lru_cache(maxsize=None)
+def get_square_weights(size: int) -> Dict[Point, int]:
+    """Returns a static ordering weight for each square.
+
+    Corners are the most valuable squares, edges come next, and squares
+    next to a corner are the least valuable since they can give the
+    corner away.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Dictionary mapping points to weights.
+    """
+    last = size - 1
+    weights = {}
+    for row in range(size):
+        for col in range(size):
+            on_row_edge = row in (0, last)
+            on_col_edge = col in (0, last)
+            near_row_edge = row in (1, last - 1)
+            near_col_edge = col in (1, last - 1)
+            if on_row_edge and on_col_edge:
+                weight = 4
+            elif (on_row_edge or near_row_edge) and (on_col_edge or near_col_edge):
+                weight = -2
+            elif on_row_edge or on_col_edge:
+                weight = 2
+            else:
+                weight = 0
+            weights[Point(row, col)] = weight
+    return weights
+
+
+def evaluate(game_state: GameState) -> int:
+    """Static evaluation of a game state.
+
+    Combines corner ownership, mobility and disc difference.
+
+    Args:
+        game_state: Game state to evaluate.
+
+    Returns:
+        Score from the point of view of the player to move.
+    """
+    board = game_state.board
+    player = game_state.current_player
+    opponent = player.other
+    last = board.size - 1
+    corners = 0
+    for point in (Point(0, 0), Point(0, last), Point(last, 0), Point(last, last)):
+        owner = board.get_player(point)
+        if owner == player:
+            corners += 1
+        elif owner == opponent:
+            corners -= 1
+    mobility = len(game_state.valid_moves()) - len(board.get_valid_moves(opponent))
+    discs = board.count_discs(player) - board.count_discs(opponent)
+    return CORNER_WEIGHT * corners + MOBILITY_WEIGHT * mobility + discs
+
+
+def final_score(game_state: GameState) -> int:
+    """Exact score of a finished game.
+
+    Args:
+        game_state: Game state with no moves left for either player.
+
+    Returns:
+        Score from the point of view of the player to move.
+    """
+    board = game_state.board
+    player = game_state.current_player
+    discs = board.count_discs(player) - board.count_discs(player.other)
+    if discs > 0:
+        return WIN_SCORE + discs
+    if discs < 0:
+        return -WIN_SCORE + discs
+    return 0
+
+
+class AlphaBetaBot(Agent):
+    """Negamax alpha-beta agent with iterative deepening.
+
+    Searches one ply deeper at a time until the time limit runs out and
+    plays the best move of the deepest completed search. The search runs on
+    a BitBoard copy of the game's board, whatever its implementation.
+    Results are kept in a transposition table that persists between moves.
+    Positions found in the opening book are played without searching, and
+    positions with few empty squares are solved exactly by the endgame
+    solver. The solver ignores the time limit and runs to the end, so
+    solve_empties should stay small enough for the solver to finish within
+    the time given to a move. Leaves are scored by evaluate unless a
+    pattern evaluator for the board size is given, whose indices are then
+    updated move by move along the search. Leaf scores are clamped to
+    MAX_HEURISTIC so that they never reach the scores of finished games.
+
+    Attributes:
+        time_limit: Seconds to think per move, one second if None.
+        max_depth: Maximum search depth, None for no limit.
+        table: Transposition table shared by all searches of this agent.
+        book: Opening book, None to always search.
+        solve_empties: Largest number of empty squares solved exactly.
+        evaluator: Pattern evaluator, None to use evaluate. Boards of
+            another size than its weights are scored by evaluate.
+    """
+
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        max_depth: Optional[int] = None,
+        memory_mb: float = 16,
+        book: Optional[OpeningBook] = None,
+        solve_empties: int = DEFAULT_SOLVE_EMPTIES,
+        evaluator: Optional[PatternEvaluator] = None,
+    ) -> None:
+        """Default constructor for AlphaBetaBot.
+
+        Args:
+            time_limit: Seconds to think per move.
+            max_depth: Maximum search depth, None for no limit.
+            memory_mb: Approximate memory cap of the transposition table.
+            book: Opening book, None to always search.
+            solve_empties: Largest number of empty squares solved exactly,
+                0 to never use the endgame solver. The solver ignores the
+                time limit.
+            evaluator: Pattern evaluator, None to use evaluate. Boards of
+                another size than its weights are scored by evaluate.
+        """
+        super().__init__(time_limit)
+        self.max_depth = max_depth
+        self.table = TranspositionTable(memory_mb)
+        self.book = book
+        self.solve_empties = solve_empties
+        self.evaluator = evaluator
+        self._evaluator: Optional[PatternEvaluator] = None
+        self._nodes = 0
+        self._deadline = 0.0
+        self._indices: List[List[int]] = []
+
+    def select_move(self, game_state: GameState) -> Move:
+        """Choose the best move found within the time limit.
+
+        Args:
+            game_state: Current game state.
+
+        Returns:
+            Move instance.
+        """
+        start = time.perf_counter()
+        time_limit = DEFAULT_TIME_LIMIT if self.time_limit is None else self.time_limit
+        self._deadline = start + time_limit
+        self._nodes = 0
+        candidates = game_state.legal_moves()
+        if not candidates:
+            self.last_search = SearchInfo(0, time.perf_counter() - start)
+            return Move.pass_turn()
+        book_move = None if self.book is None else self.book.best_move(game_state)
+        if book_move is not None and book_move in candidates:
+            self.last_search = SearchInfo(0, time.perf_counter() - start)
+            return Move.play(book_move)
+
+        board = BitBoard.from_board(game_state.board)
+        empties = board.size ** 2 - sum(board.count_discs(p) for p in Player)
+        if empties <= self.solve_empties:
+            solution = endgame.solve(game_state)
+            self.last_search = SearchInfo(
+                solution.nodes, time.perf_counter() - start, empties, solution.score
+            )
+            return Move.play(solution.move or candidates[0])
+
+        state = GameState(
+            board,
+            game_state.current_player,
+            game_state.last_move,
+            game_state.second_last_move,
+        )
+        self._evaluator = self.evaluator
+        if self._evaluator is not None and self._evaluator.weights.size != board.size:
+            self._evaluator = None
+        if self._evaluator is not None:
+            self._indices = [self._evaluator.indices(*board.get_masks(Player.BLACK))]
+        max_depth = empties if self.max_depth is None else min(self.max_depth, empties)
+        weights = get_square_weights(board.size)
+        ordered = sorted(candidates, key=lambda point: -weights[point])
+        best: Tuple[Point, int] = (ordered[0], 0)
+        depth = 0
+        for next_depth in range(1, max_depth + 1):
+            try:
+                scores = self._search_root(state, ordered, next_depth)
+            except SearchTimeout:
+                break
+            depth = next_depth
+            ordered.sort(key=lambda point: -scores[point])
+            best = (ordered[0], scores[ordered[0]])
+
+        self.last_search = SearchInfo(
+            self._nodes, time.perf_counter() - start, depth, best[1]
+        )
+        return Move.play(best[0])
+
+    def _search_root(
+        self, state: GameState, ordered: List[Point], depth: int
+    ) -> Dict[Point, int]:
+        scores = {}
+        alpha = -WIN_SCORE * 2
+        for point in ordered:
+            undo = self._play(state, point)
+            score = -self._negamax(state, depth - 1, -WIN_SCORE * 2, -alpha)
+            self._take_back(state, undo)
+            scores[point] = score
+            alpha = max(alpha, score)
+        return scores
+
+    def _negamax(self, state: GameState, depth: int, alpha: int, beta: int) -> int:
+        self._nodes += 1
+        if not self._nodes & 31 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        moves = state.legal_moves()
+        if not moves:
+            return self._negamax_pass(state, depth, alpha, beta)
+        if depth <= 0:
+            return self._evaluate(state)
+
+        key = state.zobrist_hash
+        entry = self.table.probe(key)
+        hash_move = None
+        if entry is not None:
+            hash_move = entry.move
+            alpha, beta = entry.narrow(depth, alpha, beta)
+            if alpha >= beta:
+                return entry.score
+
+        original_alpha = alpha
+        best = -WIN_SCORE * 2
+        best_move = None
+        for point in self._order_moves(moves, state.board.size, hash_move):
+            undo = self._play(state, point)
+            score = -self._negamax(state, depth - 1, -beta, -alpha)
+            self._take_back(state, undo)
+            if score > best:
+                best = score
+                best_move = point
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    break
+
+        bound = get_bound(best, original_alpha, beta)
+        self.table.store(key, depth, best, bound, best_move)
+        return best
+
+    def _evaluate(self, state: GameState) -> int:
+        if self._evaluator is not None:
+            score = self._evaluator.evaluate(state, self._indices[-1])
+        else:
+            score = evaluate(state)
+        return max(-MAX_HEURISTIC, min(MAX_HEURISTIC, score))
+
+    def _negamax_pass(
+        self, state: GameState, depth: int, alpha: int, beta: int
+    ) -> int:
+        if state.last_move is not None and state.last_move.is_pass:
+            return final_score(state)
+        undo = state.make_move(Move.pass_turn())
+        score = -self._negamax(state, depth, -beta, -alpha)
+        state.unmake_move(undo)
+        return score
+
+    def _play(self, state: GameState, point: Point) -> StateUndo:
+        undo = state.make_move(Move.play(point))
+        if self._evaluator is not None and undo.board_undo is not None:
+            indices = self._evaluator.update(self._indices[-1], undo.board_undo)
+            self._indices.append(indices)
+        return undo
+
+    def _take_back(self, state: GameState, undo: StateUndo) -> None:
+        state.unmake_move(undo)
+        if self._evaluator is not None:
+            self._indices.pop()
+
+    @staticmethod
+    def _order_moves(
+        moves: List[Point], size: int, hash_move: Optional[Point]
+    ) -> List[Point]:
+        weights = get_square_weights(size)
+        moves.sort(key=lambda point: -weights[point])
+        if hash_move in moves:
+            moves.remove(hash_move)
+            moves.insert(0, hash_move)
+        return moves
@@ -1,14 +1,106 @@
 """Abstract base class for agents."""
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Type
 
 from othello.game.game_state import GameState
 from othello.game.move import Move
 
 
+@dataclass
+class SearchInfo:
+    """Statistics about the search behind the last selected move.
+
+    Attributes:
+        nodes: Number of positions visited.
+        seconds: Wall time spent searching.
+        depth: Deepest completed search depth, if applicable.
+        score: Score of the selected move from the mover's point of view.
+    """
+
+    nodes: int
+    seconds: float
+    depth: Optional[int] = None
+    score: Optional[float] = None
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Returns the search throughput.
+
+        Returns:
+            Nodes visited per second.
+        """
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        """Short human readable summary.
+
+        Returns:
+            String representation.
+        """
+        summary = f"{self.nodes} nodes in {self.seconds:.2f}s"
+        summary += f" ({self.nodes_per_second:.0f} nodes/s)"
+        if self.depth is not None:
+            summary += f", depth {self.depth}"
+        if self.score is not None:
+            summary += f", score {self.score:g}"
+        return summary
+
+
 class Agent(ABC):
-    """Agent abstract base class."""
+    """Agent abstract base class.
+
+    Attributes:
+        time_limit: Seconds the agent may think per move, None to use the
+            agent's own default. Agents that do not search ignore it.
+        last_search: Statistics about the last move selection, None if the
+            agent does not search.
+    """
+
+    last_search: Optional[SearchInfo] = None
+
+    def __init__(self, time_limit: Optional[float] = None) -> None:
+        """Default constructor for Agent.
+
+        Args:
+            time_limit: Seconds the agent may think per move.
+        """
+        self.time_limit = time_limit
 
     @abstractmethod
     def select_move(self, game_state: GameState) -> Move:
         """Select move given game state."""
         pass
+
+    def close(self) -> None:  # noqa: B027
+        """Release the resources held by the agent, such as processes."""
+        pass
+
+
+def create_agent(
+    agent_type: Type[Agent],
+    time_limit: Optional[float] = None,
+    options: Optional[Mapping[str, Any]] = None,
+) -> Agent:
+    """Create an agent, passing it the options its constructor takes.
+
+    Options such as an opening book are given for all agents at once, so
+    every agent type only receives the options named by the parameters of
+    its constructor and ignores the others.
+
+    Args:
+        agent_type: Agent type.
+        time_limit: Seconds the agent may think per move.
+        options: Keyword arguments offered to the constructor.
+
+    Returns:
+        Agent instance.
+    """
+    if not options:
+        return agent_type(time_limit=time_limit)
+    # Imported here as only agents created with options need it.
+    import inspect
+
+    parameters = inspect.signature(agent_type).parameters
+    accepted = {name: value for name, value in options.items() if name in parameters}
+    return agent_type(time_limit=time_limit, **accepted)
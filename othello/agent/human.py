@@ -56,6 +56,20 @@ class Human(Agent):
         number: str = str(point.row + 1)
         return f"{letter}{number}"
 
+    @staticmethod
+    def move_to_notation(move: Move) -> str:
+        """Convert Move instance to notation string.
+
+        Args:
+            move: Move to be converted.
+
+        Returns:
+            Notation of the point played, pass or resign.
+        """
+        if move.point is not None:
+            return Human.point_to_notation(move.point)
+        return "pass" if move.is_pass else "resign"
+
     @staticmethod
     def notation_to_move(move_input: str) -> Move:
         """Convert notation string to Point instance.
@@ -0,0 +1,362 @@
+"""Monte Carlo tree search agent module."""
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+import math
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from othello.agent.base import Agent, SearchInfo
+from othello.book import OpeningBook
+from othello.game.bitboard import BitBoard
+from othello.game.game_state import GameState, StateUndo
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.game.point import Point
+
+DEFAULT_TIME_LIMIT = 1.0
+DEFAULT_EXPLORATION = 1.4
+
+# Root statistics of a search: visits and wins per root move.
+RootStats = Dict[Optional[Point], Tuple[int, float]]
+
+
+def _to_move(point: Optional[Point]) -> Move:
+    return Move.pass_turn() if point is None else Move.play(point)
+
+
+class Node:
+    """Node of the search tree.
+
+    Moves are stored as points, with None standing for a pass. Wins are
+    counted for the player who made the move leading to the node, so a
+    parent picks the child with the best win rate for itself.
+
+    Attributes:
+        key: Zobrist hash of the position.
+        player: Player who moved into the position.
+        parent: Parent node, None for the root.
+        children: Child nodes by move.
+        untried: Moves without a child node yet.
+        visits: Number of playouts through the node.
+        wins: Playouts won by player, draws counting half.
+    """
+
+    def __init__(self, state: GameState, parent: Optional[Node] = None) -> None:
+        """Default constructor for Node.
+
+        Args:
+            state: Position of the node.
+            parent: Parent node, None for the root.
+        """
+        self.key = state.zobrist_hash
+        self.player = state.current_player.other
+        self.parent = parent
+        self.children: Dict[Optional[Point], Node] = {}
+        self.untried: List[Optional[Point]] = []
+        if not state.is_over():
+            self.untried = list(state.legal_moves()) or [None]
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration: float) -> Tuple[Optional[Point], Node]:
+        """Pick the child with the highest UCT value.
+
+        Args:
+            exploration: Exploration constant.
+
+        Returns:
+            Tuple of the move and the child node.
+        """
+        log_visits = math.log(self.visits)
+
+        def uct(item: Tuple[Optional[Point], Node]) -> float:
+            child = item[1]
+            return child.wins / child.visits + exploration * math.sqrt(
+                log_visits / child.visits
+            )
+
+        return max(self.children.items(), key=uct)
+
+    def update(self, winner: Optional[Player]) -> None:
+        """Record the result of a playout through the node.
+
+        Args:
+            winner: Winner of the playout, None for a draw.
+        """
+        self.visits += 1
+        if winner is None:
+            self.wins += 0.5
+        elif winner == self.player:
+            self.wins += 1
+
+    def root_stats(self) -> RootStats:
+        """Returns the visits and wins of every child.
+
+        Returns:
+            Dictionary mapping moves to visits and wins.
+        """
+        return {
+            move: (child.visits, child.wins) for move, child in self.children.items()
+        }
+
+
+def playout(state: GameState, rng: random.Random) -> Optional[Player]:
+    """Play random moves to the end of the game and take them back.
+
+    Args:
+        state: Position to play from, restored before returning.
+        rng: Random number generator.
+
+    Returns:
+        Winner of the game, None for a draw.
+    """
+    undos = []
+    while not state.is_over():
+        moves = state.legal_moves()
+        move = Move.play(rng.choice(moves)) if moves else Move.pass_turn()
+        undos.append(state.make_move(move))
+    winner = state.winner()
+    for undo in reversed(undos):
+        state.unmake_move(undo)
+    return winner
+
+
+def search(
+    root: Node,
+    state: GameState,
+    exploration: float,
+    deadline: float,
+    playouts: Optional[int],
+    rng: random.Random,
+) -> Tuple[int, int]:
+    """Grow the tree with playouts until the deadline or playout budget.
+
+    Every iteration selects a path by UCT, expands one untried move, plays
+    a random game from there and updates the statistics along the path.
+
+    Args:
+        root: Root node, matching state.
+        state: Position of the root, restored before returning.
+        exploration: Exploration constant.
+        deadline: Value of time.perf_counter at which to stop.
+        playouts: Maximum number of playouts, None for no limit.
+        rng: Random number generator.
+
+    Returns:
+        Tuple of the number of playouts and the deepest path length.
+    """
+    count = 0
+    max_depth = 0
+    while playouts is None or count < playouts:
+        if count and time.perf_counter() > deadline:
+            break
+        node = root
+        undos: List[StateUndo] = []
+        while not node.untried and node.children:
+            move, node = node.select_child(exploration)
+            undos.append(state.make_move(_to_move(move)))
+        if node.untried:
+            move = node.untried.pop(rng.randrange(len(node.untried)))
+            undos.append(state.make_move(_to_move(move)))
+            node.children[move] = Node(state, node)
+            node = node.children[move]
+
+        winner = playout(state, rng)
+        walk: Optional[Node] = node
+        while walk is not None:
+            walk.update(winner)
+            walk = walk.parent
+        for undo in reversed(undos):
+            state.unmake_move(undo)
+        count += 1
+        max_depth = max(max_depth, len(undos))
+    return count, max_depth
+
+
+def search_worker(
+    state: GameState,
+    exploration: float,
+    deadline: float,
+    playouts: Optional[int],
+    seed: int,
+) -> RootStats:
+    """Search a fresh tree and return its root statistics.
+
+    Module-level so that it can be sent to worker processes.
+
+    Args:
+        state: Position to search.
+        exploration: Exploration constant.
+        deadline: Value of time.time at which to stop, shared with the
+            process that submitted the search.
+        playouts: Maximum number of playouts, None for no limit.
+        seed: Seed for the random number generator.
+
+    Returns:
+        Dictionary mapping root moves to visits and wins.
+    """
+    root = Node(state)
+    # perf_counter has no meaning across processes, so the deadline is on
+    # the wall clock and converted here.
+    deadline = time.perf_counter() + deadline - time.time()
+    search(root, state, exploration, deadline, playouts, random.Random(seed))
+    return root.root_stats()
+
+
+class MCTSBot(Agent):
+    """Monte Carlo tree search agent using UCT and random playouts.
+
+    Searches on a BitBoard copy of the game's board. The tree is kept
+    between moves: when the next position is a grandchild of the previous
+    root, that subtree becomes the new root instead of starting over.
+    With more than one job, extra worker processes search independent
+    trees from the same root and their root statistics are added up
+    before choosing the most visited move (root parallelization). The
+    worker processes are started on the first move and kept until the
+    agent is closed, so use it as a context manager or call close.
+    Positions found in the opening book are played without searching.
+
+    Attributes:
+        time_limit: Seconds to think per move, one second if None.
+        exploration: UCT exploration constant.
+        playouts: Maximum playouts per move over all jobs, None for no
+            limit.
+        jobs: Number of processes searching, including this one.
+        root: Root of the last search tree.
+        book: Opening book, None to always search.
+    """
+
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        exploration: float = DEFAULT_EXPLORATION,
+        playouts: Optional[int] = None,
+        jobs: int = 1,
+        seed: Optional[int] = None,
+        book: Optional[OpeningBook] = None,
+    ) -> None:
+        """Default constructor for MCTSBot.
+
+        Args:
+            time_limit: Seconds to think per move.
+            exploration: UCT exploration constant.
+            playouts: Maximum playouts per move, None for no limit.
+            jobs: Number of processes searching, including this one.
+            seed: Seed for the random number generator, None to draw one
+                from the random module, so that seeding it reproduces the
+                agent's games.
+            book: Opening book, None to always search.
+        """
+        super().__init__(time_limit)
+        self.exploration = exploration
+        self.playouts = playouts
+        self.jobs = jobs
+        self.root: Optional[Node] = None
+        self._rng = random.Random(random.getrandbits(32) if seed is None else seed)
+        self.book = book
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> MCTSBot:
+        """Use the agent as a context manager that closes it on exit.
+
+        Returns:
+            The agent itself.
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the agent."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def select_move(self, game_state: GameState) -> Move:
+        """Choose the most visited move after searching.
+
+        Args:
+            game_state: Current game state.
+
+        Returns:
+            Move instance.
+        """
+        start = time.perf_counter()
+        time_limit = DEFAULT_TIME_LIMIT if self.time_limit is None else self.time_limit
+        candidates = game_state.legal_moves()
+        if not candidates:
+            self.last_search = SearchInfo(0, time.perf_counter() - start)
+            return Move.pass_turn()
+        book_move = None if self.book is None else self.book.best_move(game_state)
+        if book_move is not None and book_move in candidates:
+            self.last_search = SearchInfo(0, time.perf_counter() - start)
+            return Move.play(book_move)
+
+        state = GameState(
+            BitBoard.from_board(game_state.board),
+            game_state.current_player,
+            game_state.last_move,
+            game_state.second_last_move,
+        )
+        root = self._reuse_root(state) or Node(state)
+        playouts = self.playouts
+        if playouts is not None:
+            playouts = max(1, playouts // self.jobs)
+
+        deadline = time.time() + time_limit - (time.perf_counter() - start)
+        futures = self._submit_workers(state, deadline, playouts)
+        nodes, depth = search(
+            root, state, self.exploration, start + time_limit, playouts, self._rng
+        )
+        stats = root.root_stats()
+        for future in futures:
+            for move, (visits, wins) in future.result().items():
+                total_visits, total_wins = stats.get(move, (0, 0.0))
+                stats[move] = (total_visits + visits, total_wins + wins)
+                nodes += visits
+
+        point, (visits, wins) = max(stats.items(), key=lambda item: item[1][0])
+        self.root = root
+        self.last_search = SearchInfo(
+            nodes, time.perf_counter() - start, depth, wins / visits
+        )
+        return _to_move(point)
+
+    def _submit_workers(
+        self, state: GameState, deadline: float, playouts: Optional[int]
+    ) -> List[Future]:
+        """Start the searches of the worker processes, none with one job."""
+        if self.jobs == 1:
+            return []
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.jobs - 1)
+        # Submitted arguments are pickled in the background while this
+        # process searches state, so the workers get a copy of their own.
+        state = state.copy()
+        return [
+            self._executor.submit(
+                search_worker,
+                state,
+                self.exploration,
+                deadline,
+                playouts,
+                self._rng.getrandbits(32),
+            )
+            for _ in range(self.jobs - 1)
+        ]
+
+    def _reuse_root(self, state: GameState) -> Optional[Node]:
+        """Find the node of state two plies below the previous root."""
+        node = self.root
+        for move in (state.second_last_move, state.last_move):
+            if node is None or move is None or move.is_resign:
+                return None
+            node = node.children.get(move.point)
+        if node is None or node.key != state.zobrist_hash:
+            return None
+        node.parent = None
+        return node
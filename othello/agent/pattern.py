@@ -0,0 +1,333 @@
+"""Pattern evaluation module.
+
+A pattern is a list of squares, such as an edge or the block of squares
+around a corner. Each configuration of discs on its squares has a ternary
+index, with digit 0 for an empty square, 1 for black and 2 for white, the
+first square being the least significant digit. The images of a pattern
+under the board symmetries are its instances, and they share one table of
+weights, indexed by configuration, from black's point of view.
+
+Indices are linear in the discs, so moves update them in place of a
+recount: placing a disc adds its digit times the square's power of 3, and
+flipping one adds the difference of the digits. Evaluating a position then
+takes one table lookup per instance, plus mobility and stability terms.
+
+Weight files hold a header with the board size and the mobility and
+stability weights, followed by the tables of every pattern as
+little-endian 16-bit integers, in the order given by get_patterns.
+"""
+from __future__ import annotations
+
+import array
+import functools
+import struct
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from othello.game.analysis import stable_discs
+from othello.game.bitboard import popcount, valid_moves_mask
+from othello.game.board import Undo
+from othello.game.game_state import GameState
+from othello.game.player import Player
+from othello.game.symmetry import get_permutations
+
+MAGIC = b"OTHP"
+HEADER = struct.Struct("<4sBxhh")
+DEFAULT_MOBILITY = 10
+DEFAULT_STABILITY = 20
+# Longest edge or diagonal a pattern spans, which keeps tables small on
+# large boards.
+MAX_SPAN = 8
+
+# Configuration tables of one instance per byte of a disc mask: the shift
+# of the byte and the sum of the powers of 3 of the instance squares set
+# in each byte value.
+ByteTables = Tuple[Tuple[int, Tuple[int, ...]], ...]
+
+
+class WeightsFormatError(Exception):
+    """Raised when opening a file that is not a pattern weights file."""
+
+    pass
+
+
+class Patterns(NamedTuple):
+    """Pattern instances of a board size.
+
+    Attributes:
+        size: Board size.
+        names: Name of every pattern.
+        lengths: Number of squares of every pattern.
+        instances: Pattern number and squares of every instance.
+        square_refs: For every square, the instance numbers containing it
+            with the square's power of 3 in each.
+        byte_tables: Tables giving the index of every instance from the
+            bytes of a disc mask.
+    """
+
+    size: int
+    names: Tuple[str, ...]
+    lengths: Tuple[int, ...]
+    instances: Tuple[Tuple[int, Tuple[int, ...]], ...]
+    square_refs: Tuple[Tuple[Tuple[int, int], ...], ...]
+    byte_tables: Tuple[ByteTables, ...]
+
+
+def _base_patterns(size: int) -> Dict[str, List[Tuple[int, int]]]:
+    """Squares of every pattern next to the top left corner."""
+    span = min(size, MAX_SPAN)
+    patterns = {
+        "edge": [(0, col) for col in range(span)] + [(1, 1), (1, span - 2)],
+        "corner": [(row, col) for row in range(3) for col in range(3)],
+        "diagonal": [(index, index) for index in range(span)],
+    }
+    if size >= 6:
+        patterns["rectangle"] = [(row, col) for row in range(2) for col in range(5)]
+    return patterns
+
+
+def _byte_tables(size: int, squares: Tuple[int, ...]) -> ByteTables:
+    """Tabulate the index contribution of every byte the squares touch."""
+    tables = []
+    for shift in range(0, size * size, 8):
+        powers = [0] * 8
+        for digit, square in enumerate(squares):
+            if shift <= square < shift + 8:
+                powers[square - shift] = 3 ** digit
+        if any(powers):
+            table = [0] * 256
+            for byte in range(1, 256):
+                low = byte & -byte
+                table[byte] = table[byte ^ low] + powers[low.bit_length() - 1]
+            tables.append((shift, tuple(table)))
+    return tuple(tables)
+
+
+@functools.lru_cache(maxsize=None)
+def get_patterns(size: int) -> Patterns:
+    """Returns the pattern instances of a board size.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Patterns instance.
+    """
+    names = []
+    lengths = []
+    instances: List[Tuple[int, Tuple[int, ...]]] = []
+    for number, (name, points) in enumerate(_base_patterns(size).items()):
+        names.append(name)
+        lengths.append(len(points))
+        seen = set()
+        for permutation in get_permutations(size):
+            squares = tuple(permutation[row * size + col] for row, col in points)
+            if frozenset(squares) not in seen:
+                seen.add(frozenset(squares))
+                instances.append((number, squares))
+    square_refs: List[List[Tuple[int, int]]] = [[] for _ in range(size * size)]
+    for instance, (_, squares) in enumerate(instances):
+        for digit, square in enumerate(squares):
+            square_refs[square].append((instance, 3 ** digit))
+    return Patterns(
+        size,
+        tuple(names),
+        tuple(lengths),
+        tuple(instances),
+        tuple(map(tuple, square_refs)),
+        tuple(_byte_tables(size, squares) for _, squares in instances),
+    )
+
+
+class PatternWeights(NamedTuple):
+    """Weights of a pattern evaluator.
+
+    Attributes:
+        size: Board size.
+        mobility: Weight of each legal move more than the opponent.
+        stability: Weight of each stable disc more than the opponent.
+        tables: Table of weights for every pattern, indexed by
+            configuration, from black's point of view.
+    """
+
+    size: int
+    mobility: int
+    stability: int
+    tables: Tuple[array.array, ...]
+
+
+def _square_value(size: int, square: int) -> int:
+    """Positional value of a black disc on a square."""
+    last = size - 1
+    distances = sorted(min(line, last - line) for line in divmod(square, size))
+    values = {(0, 0): 40, (0, 1): -10, (1, 1): -20}
+    return values.get((distances[0], distances[1]), 10 if distances[0] == 0 else 1)
+
+
+def default_weights(size: int = 8) -> PatternWeights:
+    """Returns hand-made weights that score squares by their position.
+
+    Corners are worth the most and the squares next to them the least.
+    Each square's value is shared between the instances containing it.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        PatternWeights instance.
+    """
+    patterns = get_patterns(size)
+    tables = []
+    for number in range(len(patterns.names)):
+        squares = next(
+            squares for pattern, squares in patterns.instances if pattern == number
+        )
+        values = [
+            _square_value(size, square) / len(patterns.square_refs[square])
+            for square in squares
+        ]
+        scores = [0.0]
+        for value in reversed(values):
+            scores = [score + step for score in scores for step in (0, value, -value)]
+        tables.append(array.array("h", map(round, scores)))
+    return PatternWeights(size, DEFAULT_MOBILITY, DEFAULT_STABILITY, tuple(tables))
+
+
+def write_weights(weights: PatternWeights, path: str) -> None:
+    """Write pattern weights to a file.
+
+    Args:
+        weights: Weights to write.
+        path: Path of the weights file.
+    """
+    with open(path, "wb") as weights_file:
+        weights_file.write(
+            HEADER.pack(MAGIC, weights.size, weights.mobility, weights.stability)
+        )
+        for table in weights.tables:
+            if sys.byteorder == "big":
+                table = array.array("h", table)
+                table.byteswap()
+            table.tofile(weights_file)
+
+
+def read_weights(path: str) -> PatternWeights:
+    """Read pattern weights from a file written by write_weights.
+
+    Args:
+        path: Path of the weights file.
+
+    Returns:
+        PatternWeights instance.
+
+    Raises:
+        WeightsFormatError: If the file is not a weights file.
+    """
+    with open(path, "rb") as weights_file:
+        data = weights_file.read()
+    if len(data) < HEADER.size:
+        raise WeightsFormatError(f"{path} is not a pattern weights file")
+    magic, size, mobility, stability = HEADER.unpack_from(data)
+    lengths = get_patterns(size).lengths if magic == MAGIC and size else ()
+    if not lengths or len(data) != HEADER.size + 2 * sum(3 ** n for n in lengths):
+        raise WeightsFormatError(f"{path} is not a pattern weights file")
+    tables = []
+    offset = HEADER.size
+    for length in lengths:
+        table = array.array("h")
+        table.frombytes(data[offset : offset + 2 * 3 ** length])
+        if sys.byteorder == "big":
+            table.byteswap()
+        tables.append(table)
+        offset += 2 * 3 ** length
+    return PatternWeights(size, mobility, stability, tuple(tables))
+
+
+class PatternEvaluator:
+    """Static evaluation from pattern weights, mobility and stability.
+
+    Attributes:
+        weights: Weights of the evaluator.
+        patterns: Pattern instances of the board size of the weights.
+    """
+
+    def __init__(self, weights: PatternWeights) -> None:
+        """Default constructor for PatternEvaluator.
+
+        Args:
+            weights: Weights of the evaluator.
+        """
+        self.weights = weights
+        self.patterns = get_patterns(weights.size)
+        self._tables = [weights.tables[number] for number, _ in self.patterns.instances]
+
+    def indices(self, black: int, white: int) -> List[int]:
+        """Returns the configuration index of every instance.
+
+        Args:
+            black: Mask of black discs.
+            white: Mask of white discs.
+
+        Returns:
+            List of indices in instance order.
+        """
+        indices = []
+        for tables in self.patterns.byte_tables:
+            index = 0
+            for shift, table in tables:
+                index += table[black >> shift & 255] + 2 * table[white >> shift & 255]
+            indices.append(index)
+        return indices
+
+    def update(self, indices: List[int], undo: Undo) -> List[int]:
+        """Returns the indices after a disc placement.
+
+        Args:
+            indices: Indices before the placement.
+            undo: Undo token of the placement, as returned by make_move.
+
+        Returns:
+            New list of indices.
+        """
+        size = self.weights.size
+        square_refs = self.patterns.square_refs
+        digit = undo.player.value
+        flip = digit - undo.player.other.value
+        updated = indices.copy()
+        point = undo.point
+        for instance, power in square_refs[point.row * size + point.col]:
+            updated[instance] += digit * power
+        for point in undo.flips:
+            for instance, power in square_refs[point.row * size + point.col]:
+                updated[instance] += flip * power
+        return updated
+
+    def evaluate(
+        self, game_state: GameState, indices: Optional[List[int]] = None
+    ) -> int:
+        """Static evaluation of a game state.
+
+        Args:
+            game_state: Game state to evaluate.
+            indices: Indices of the position if already known.
+
+        Returns:
+            Score from the point of view of the player to move.
+        """
+        board = game_state.board
+        size = board.size
+        player = game_state.current_player
+        own, opp = board.get_masks(player)
+        if indices is None:
+            indices = self.indices(*board.get_masks(Player.BLACK))
+        score = sum(table[index] for table, index in zip(self._tables, indices))
+        if player == Player.WHITE:
+            score = -score
+        mobility = popcount(valid_moves_mask(own, opp, size)) - popcount(
+            valid_moves_mask(opp, own, size)
+        )
+        stability = popcount(stable_discs(own, opp, size)) - popcount(
+            stable_discs(opp, own, size)
+        )
+        weights = self.weights
+        return score + weights.mobility * mobility + weights.stability * stability
@@ -0,0 +1,181 @@
+"""Transposition table module."""
+import enum
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from othello.game.point import Point
+
+# Rough size of one stored entry in CPython: the tuple itself, its fields
+# and a share of the slot lists.
+ENTRY_BYTES = 200
+
+
+class Bound(enum.Enum):
+    """How a stored score relates to the true score of the position."""
+
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+
+def get_bound(score: int, alpha: int, beta: int) -> Bound:
+    """Classify a fail-soft alpha-beta result.
+
+    Args:
+        score: Score returned by the search.
+        alpha: Lower bound of the search window.
+        beta: Upper bound of the search window.
+
+    Returns:
+        Bound of the score.
+    """
+    if score <= alpha:
+        return Bound.UPPER
+    if score >= beta:
+        return Bound.LOWER
+    return Bound.EXACT
+
+
+class Entry(NamedTuple):
+    """Stored search result for one position.
+
+    Attributes:
+        key: Zobrist hash of the position.
+        depth: Remaining search depth the score was computed with.
+        score: Score from the point of view of the player to move.
+        bound: Whether the score is exact or a lower or upper bound.
+        move: Best move found, None if unknown.
+    """
+
+    key: int
+    depth: int
+    score: int
+    bound: Bound
+    move: Optional[Point]
+
+    def narrow(self, depth: int, alpha: int, beta: int) -> Tuple[int, int]:
+        """Narrow a search window using the stored score.
+
+        The stored score is only used if it was searched at least as deep
+        as requested. If the returned window is empty, the stored score
+        can be returned without searching.
+
+        Args:
+            depth: Remaining depth of the search probing the table.
+            alpha: Lower bound of the search window.
+            beta: Upper bound of the search window.
+
+        Returns:
+            Tuple of narrowed alpha and beta.
+        """
+        if self.depth < depth:
+            return alpha, beta
+        if self.bound == Bound.EXACT:
+            return self.score, self.score
+        if self.bound == Bound.LOWER:
+            return max(alpha, self.score), beta
+        return alpha, min(beta, self.score)
+
+
+class TranspositionTable:
+    """Fixed-size hash table of search results.
+
+    Every bucket has two slots. The depth-preferred slot only gives way to
+    results searched at least as deep, so expensive results survive; the
+    other slot always takes the newest result that did not fit in the
+    first one.
+
+    Attributes:
+        buckets: Number of buckets.
+        hits: Number of probes that found the position.
+        misses: Number of probes that did not find the position.
+        collisions: Number of misses where the bucket held other positions.
+    """
+
+    def __init__(self, memory_mb: float = 16) -> None:
+        """Default constructor for TranspositionTable.
+
+        Args:
+            memory_mb: Approximate memory cap in megabytes.
+        """
+        self.buckets = max(1, int(memory_mb * 2 ** 20) // (2 * ENTRY_BYTES))
+        self._deep: List[Optional[Entry]] = [None] * self.buckets
+        self._recent: List[Optional[Entry]] = [None] * self.buckets
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+
+    def __len__(self) -> int:
+        """Number of stored entries.
+
+        Returns:
+            Entry count.
+        """
+        return sum(e is not None for e in self._deep) + sum(
+            e is not None for e in self._recent
+        )
+
+    def probe(self, key: int) -> Optional[Entry]:
+        """Look up the stored result for a position.
+
+        Args:
+            key: Zobrist hash of the position.
+
+        Returns:
+            Stored entry, None if the position is not in the table.
+        """
+        index = key % self.buckets
+        deep = self._deep[index]
+        if deep is not None and deep.key == key:
+            self.hits += 1
+            return deep
+        recent = self._recent[index]
+        if recent is not None and recent.key == key:
+            self.hits += 1
+            return recent
+        self.misses += 1
+        if deep is not None or recent is not None:
+            self.collisions += 1
+        return None
+
+    def store(
+        self, key: int, depth: int, score: int, bound: Bound, move: Optional[Point]
+    ) -> None:
+        """Store a search result.
+
+        Args:
+            key: Zobrist hash of the position.
+            depth: Remaining search depth the score was computed with.
+            score: Score from the point of view of the player to move.
+            bound: Whether the score is exact or a bound.
+            move: Best move found, None if unknown.
+        """
+        index = key % self.buckets
+        entry = Entry(key, depth, score, bound, move)
+        deep = self._deep[index]
+        if deep is None or deep.key == key or depth >= deep.depth:
+            self._deep[index] = entry
+            recent = self._recent[index]
+            if recent is not None and recent.key == key:
+                self._recent[index] = None
+        else:
+            self._recent[index] = entry
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._deep = [None] * self.buckets
+        self._recent = [None] * self.buckets
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the probe counters.
+
+        Returns:
+            Dictionary of hits, misses and collisions.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "collisions": self.collisions,
+        }
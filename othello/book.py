@@ -0,0 +1,275 @@
+"""Opening book module.
+
+A book maps positions to the moves played from them in earlier games,
+with how often each move was played and how well it scored. Positions
+are keyed by the Zobrist hash of their canonical form, so rotated and
+mirrored transpositions share entries.
+
+Books are stored as a header followed by fixed-width records sorted by
+key. Lookups memory-map the file and binary search it, so no part of the
+book is loaded into Python objects until it is needed.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import random
+import struct
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+from othello.agent.base import Agent
+from othello.game import symmetry
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.game.point import get_points, Point
+
+MAGIC = b"OTHB"
+HEADER = struct.Struct("<4sBxxxI")
+# Canonical key, canonical square of the move, games and points (2 per win,
+# 1 per draw) for the player making the move. Points take up to twice the
+# maximum game count.
+RECORD = struct.Struct("<QHHI")
+MAX_COUNT = 2 ** 16 - 1
+
+
+class BookFormatError(Exception):
+    """Raised when opening a file that is not an opening book."""
+
+    pass
+
+
+def canonical_move(game_state: GameState, point: Point) -> Tuple[int, int]:
+    """Returns the canonical hash of a position and square of a move from it.
+
+    When the position is symmetric, moves that are mirror images of each
+    other get the same canonical square.
+
+    Args:
+        game_state: Position the move is played from.
+        point: Point of the move.
+
+    Returns:
+        Tuple of the canonical hash and the canonical square index.
+    """
+    size = game_state.board.size
+    key, _ = symmetry.canonical_key(game_state)
+    black, white = game_state.board.get_masks(Player.BLACK)
+    square = point.row * size + point.col
+    permutations = symmetry.get_permutations(size)
+    return key, min(
+        permutations[index][square]
+        for index in symmetry.get_symmetries(black, white, size)
+    )
+
+
+class BookMove(NamedTuple):
+    """A book move from a position.
+
+    Attributes:
+        point: Point to play.
+        games: Number of book games that played the move.
+        score: Average score of the move for its player, 1 for a win and
+            0.5 for a draw.
+    """
+
+    point: Point
+    games: int
+    score: float
+
+
+class OpeningBook:
+    """Memory-mapped opening book.
+
+    A book sent to another process is opened again there from its path.
+
+    Attributes:
+        path: Path of the book file.
+        size: Board size of the book positions.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Default constructor for OpeningBook.
+
+        Args:
+            path: Path of a book file written by write_book.
+
+        Raises:
+            BookFormatError: If the file is not an opening book.
+        """
+        self.path = path
+        with open(path, "rb") as book_file:
+            if os.fstat(book_file.fileno()).st_size < HEADER.size:
+                raise BookFormatError(f"{path} is not an opening book")
+            self._mmap = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size, self._count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or len(self._mmap) != HEADER.size + self._count * RECORD.size:
+            self._mmap.close()
+            raise BookFormatError(f"{path} is not an opening book")
+
+    def __len__(self) -> int:
+        """Number of book moves.
+
+        Returns:
+            Record count.
+        """
+        return self._count
+
+    def __reduce__(self) -> Tuple[Type[OpeningBook], Tuple[str]]:
+        """Pickle the book as its path.
+
+        Returns:
+            The class and the arguments that open the book again.
+        """
+        return OpeningBook, (self.path,)
+
+    def __enter__(self) -> OpeningBook:
+        """Use the book as a context manager that closes it on exit.
+
+        Returns:
+            The book itself.
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the book."""
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the book file."""
+        self._mmap.close()
+
+    def _record_at(self, position: int) -> Tuple[int, int, int, int]:
+        offset = HEADER.size + position * RECORD.size
+        key, square, games, points = RECORD.unpack_from(self._mmap, offset)
+        return key, square, games, points
+
+    def lookup(self, game_state: GameState) -> List[BookMove]:
+        """Find the book moves of a position.
+
+        Args:
+            game_state: Position to look up.
+
+        Returns:
+            List of BookMove instances, empty if the position is not in
+            the book.
+        """
+        if game_state.board.size != self.size:
+            return []
+        key, transform = symmetry.canonical_key(game_state)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record_at(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        points = get_points(self.size)
+        moves: List[BookMove] = []
+        for position in range(low, self._count):
+            record_key, square, games, points_won = self._record_at(position)
+            if record_key != key:
+                break
+            score = points_won / games / 2
+            point = symmetry.inverse_point(points[square], transform, self.size)
+            moves.append(BookMove(point, games, score))
+        return moves
+
+    def best_move(self, game_state: GameState) -> Optional[Point]:
+        """Pick the most played book move of a position.
+
+        Ties are broken by score.
+
+        Args:
+            game_state: Position to look up.
+
+        Returns:
+            Point of the book move, None if the position is not in the book.
+        """
+        moves = self.lookup(game_state)
+        if not moves:
+            return None
+        return max(moves, key=lambda move: (move.games, move.score)).point
+
+
+def self_play(
+    agent_type: Type[Agent],
+    games: int,
+    board_size: int = 8,
+    random_plies: int = 4,
+    time_limit: Optional[float] = None,
+    seed: int = 0,
+) -> Iterator[List[Move]]:
+    """Play games of an agent against itself and yield their moves.
+
+    The first plies of every game are random so that the games differ.
+
+    Args:
+        agent_type: Agent type playing both colors.
+        games: Number of games.
+        board_size: Board size.
+        random_plies: Number of random moves opening each game.
+        time_limit: Seconds per move for searching agents.
+        seed: Seed for the random number generator.
+
+    Yields:
+        List of the moves of each game.
+    """
+    rng = random.Random(seed)
+    for _ in range(games):
+        agent = agent_type(time_limit=time_limit)
+        game_state = GameState.new_game(board_size)
+        moves: List[Move] = []
+        while not game_state.is_over():
+            candidates = game_state.legal_moves()
+            if len(moves) < random_plies and candidates:
+                move = Move.play(rng.choice(candidates))
+            else:
+                move = agent.select_move(game_state)
+            game_state = game_state.apply_move(move)
+            moves.append(move)
+        yield moves
+
+
+def write_book(
+    records: Iterable[List[Move]], path: str, board_size: int = 8, plies: int = 12
+) -> int:
+    """Build a book from game records and write it to a file.
+
+    Every play among the first plies of a game, up to the first pass, is
+    credited with the game's result for the player who made it. A move
+    stops being counted once it reaches the maximum game count, so that
+    its score stays the average of the games counted.
+
+    Args:
+        records: Moves of each game, starting from the initial position.
+        path: Path of the book file to write.
+        board_size: Board size of the games.
+        plies: Number of opening plies to keep per game.
+
+    Returns:
+        Number of book moves written.
+    """
+    stats: Dict[Tuple[int, int], List[int]] = {}
+    for moves in records:
+        game_state = GameState.new_game(board_size)
+        opening: List[Tuple[int, int, Player]] = []
+        recording = True
+        for move in moves:
+            recording = recording and move.point is not None and len(opening) < plies
+            if recording and move.point is not None:
+                key, square = canonical_move(game_state, move.point)
+                opening.append((key, square, game_state.current_player))
+            game_state = game_state.apply_move(move)
+        winner = game_state.winner()
+        for key, square, player in opening:
+            entry = stats.setdefault((key, square), [0, 0])
+            if entry[0] < MAX_COUNT:
+                entry[0] += 1
+                entry[1] += 1 if winner is None else 2 if winner == player else 0
+
+    with open(path, "wb") as book_file:
+        book_file.write(HEADER.pack(MAGIC, board_size, len(stats)))
+        for (key, square), (games, points) in sorted(stats.items()):
+            book_file.write(RECORD.pack(key, square, games, points))
+    return len(stats)
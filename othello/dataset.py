@@ -0,0 +1,111 @@
+"""Position dataset module.
+
+Datasets hold positions from recorded games for training evaluation
+functions. Every position before the end of a game is stored from the
+point of view of the player to move, with the disc difference that player
+ended the game with.
+
+Files are a header followed by fixed-width little-endian records, so they
+can be memory-mapped as an array without any parsing, see
+othello.numpy_dataset. Masks put square (row, col) at bit
+``row * size + col`` and only fit boards of size 8 or less.
+"""
+import struct
+from typing import Iterable, Iterator, Tuple
+
+from othello.game.bitboard import BitBoard
+from othello.game.player import Player
+from othello.record import GameRecord
+
+MAGIC = b"OTHD"
+HEADER = struct.Struct("<4sBxxx")
+# Discs of the player to move and of the opponent, player to move and
+# final disc difference for the player to move.
+RECORD = struct.Struct("<QQBb")
+MAX_SIZE = 8
+
+Position = Tuple[int, int, int, int]
+
+
+class DatasetFormatError(Exception):
+    """Raised when opening a file that is not a position dataset."""
+
+    pass
+
+
+def positions(record: GameRecord) -> Iterator[Position]:
+    """Replay a game record and yield its positions as dataset records.
+
+    Args:
+        record: Game record.
+
+    Yields:
+        Tuples of the discs of the player to move, the discs of the
+        opponent, the value of the player to move and the disc difference
+        that player finished the game with.
+    """
+    difference = record.black_discs - record.white_discs
+    for game_state in record.states(BitBoard):
+        if game_state.is_over():
+            break
+        player = game_state.current_player
+        own, opp = game_state.board.get_masks(player)
+        score = difference if player == Player.BLACK else -difference
+        yield own, opp, player.value, score
+
+
+def write_dataset(records: Iterable[GameRecord], path: str, board_size: int = 8) -> int:
+    """Write the positions of game records to a dataset file.
+
+    Args:
+        records: Game records, usually streamed from read_records.
+        path: Path of the dataset file to write.
+        board_size: Board size of the games.
+
+    Returns:
+        Number of positions written.
+
+    Raises:
+        ValueError: If the board size does not fit the masks, or a record
+            was played on another board size.
+    """
+    if board_size > MAX_SIZE:
+        raise ValueError(f"Datasets hold boards of size {MAX_SIZE} or less")
+    count = 0
+    with open(path, "wb") as dataset_file:
+        dataset_file.write(HEADER.pack(MAGIC, board_size))
+        for record in records:
+            if record.board_size != board_size:
+                raise ValueError(
+                    f"Record of a {record.board_size}x{record.board_size} game "
+                    f"in a {board_size}x{board_size} dataset"
+                )
+            for position in positions(record):
+                dataset_file.write(RECORD.pack(*position))
+                count += 1
+    return count
+
+
+def read_header(path: str) -> Tuple[int, int]:
+    """Read the board size and position count of a dataset file.
+
+    Args:
+        path: Path of a dataset file written by write_dataset.
+
+    Returns:
+        Tuple of the board size and the number of positions.
+
+    Raises:
+        DatasetFormatError: If the file is not a position dataset.
+    """
+    with open(path, "rb") as dataset_file:
+        header = dataset_file.read(HEADER.size)
+        dataset_file.seek(0, 2)
+        length = dataset_file.tell()
+    if len(header) < HEADER.size:
+        raise DatasetFormatError(f"{path} is not a position dataset")
+    magic, size = HEADER.unpack(header)
+    count, remainder = divmod(length - HEADER.size, RECORD.size)
+    if magic != MAGIC or remainder:
+        raise DatasetFormatError(f"{path} is not a position dataset")
+    return size, count
@@ -0,0 +1,350 @@
+"""Position analysis module.
+
+Evaluation features of a position computed from disc masks with bit
+operations, in the square layout of BitBoard:
+
+- Mobility: squares where a player can place a disc.
+- Potential mobility: empty squares next to opponent discs, where moves
+  may open up later.
+- Frontier: discs next to an empty square, which tend to give the
+  opponent moves.
+- Stability: discs that can never be flipped again.
+
+Stable discs stay stable and full lines stay full for the rest of the
+game, so an Analysis that follows the moves of a game or search starts
+every stability computation from what it already knows about the
+previous position instead of from scratch.
+"""
+from __future__ import annotations
+
+import functools
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from othello.game.bitboard import get_shifts, popcount, Shift, valid_moves_mask
+from othello.game.board import Board
+from othello.game.player import Player
+from othello.game.point import Point
+
+# Masks of the full lines of the board along each of the four axes.
+FullLines = Tuple[int, ...]
+
+# Indices into get_shifts of the opposite directions along each axis:
+# rows, columns, diagonals and anti-diagonals.
+AXIS_SHIFTS = ((3, 4), (1, 6), (0, 7), (2, 5))
+
+
+@functools.lru_cache(maxsize=None)
+def get_lines(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """Returns the masks of all lines of the board, grouped by axis.
+
+    The axes are rows, columns, diagonals and anti-diagonals. Lines of a
+    single square are included so that every square is on one line of
+    every axis.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of four tuples of line masks.
+    """
+    axes: List[Dict[int, int]] = [{}, {}, {}, {}]
+    for square in range(size * size):
+        row, col = divmod(square, size)
+        for axis, line in enumerate((row, col, row - col, row + col)):
+            axes[axis][line] = axes[axis].get(line, 0) | 1 << square
+    return tuple(tuple(lines.values()) for lines in axes)
+
+
+@functools.lru_cache(maxsize=None)
+def get_square_lines(size: int) -> Tuple[FullLines, ...]:
+    """Returns the line of every axis through each square.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of four line masks per square index.
+    """
+    lines = get_lines(size)
+    return tuple(
+        tuple(next(line for line in axis if line >> square & 1) for axis in lines)
+        for square in range(size * size)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_edges(size: int) -> FullLines:
+    """Returns the squares on the edge of the board along each axis.
+
+    A square is on the edge along an axis when one of the two steps along
+    the axis leaves the board.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of four masks.
+    """
+    full_board = (1 << size * size) - 1
+    shifts = get_shifts(size)
+    edges = []
+    for forward, backward in AXIS_SHIFTS:
+        inner = shift(full_board, shifts[forward]) & shift(full_board, shifts[backward])
+        edges.append(full_board & ~inner)
+    return tuple(edges)
+
+
+def shift(mask: int, step: Shift) -> int:
+    """Move every bit one step along a direction from get_shifts.
+
+    Args:
+        mask: Bitmask.
+        step: Shift amount and wrap mask of the direction.
+
+    Returns:
+        Shifted mask.
+    """
+    amount, wrap = step
+    if amount > 0:
+        return (mask << amount) & wrap
+    return (mask >> -amount) & wrap
+
+
+def neighbours(mask: int, size: int) -> int:
+    """Find the squares next to any square of a mask.
+
+    Args:
+        mask: Bitmask.
+        size: Board size.
+
+    Returns:
+        Mask of squares one step away in any direction.
+    """
+    grown = 0
+    for step in get_shifts(size):
+        grown |= shift(mask, step)
+    return grown
+
+
+def full_lines(occupied: int, size: int) -> FullLines:
+    """Find the lines of the board that have no empty square.
+
+    Args:
+        occupied: Mask of all discs.
+        size: Board size.
+
+    Returns:
+        Mask of the full lines along each axis.
+    """
+    full = []
+    for lines in get_lines(size):
+        axis = 0
+        for line in lines:
+            if occupied & line == line:
+                axis |= line
+        full.append(axis)
+    return tuple(full)
+
+
+def stable_discs(
+    own: int,
+    opp: int,
+    size: int,
+    known: int = 0,
+    full: Optional[FullLines] = None,
+) -> int:
+    """Find discs that can never be flipped.
+
+    A disc is stable when, along each of the four axes, its line is full,
+    it is on the edge of the board, or it is next to a stable disc of the
+    same color. Starting from the known stable discs, the rule is applied
+    until nothing changes, which finds the corners and the discs anchored
+    to them but misses some stable discs.
+
+    Args:
+        own: Mask of the discs to check.
+        opp: Mask of the other player's discs.
+        size: Board size.
+        known: Mask of discs already found stable, in this position or an
+            earlier one of the same game.
+        full: Full lines of the position if already known.
+
+    Returns:
+        Mask of stable discs among own.
+    """
+    if full is None:
+        full = full_lines(own | opp, size)
+    shifts = get_shifts(size)
+    safe = [
+        (lines | edges, shifts[forward], shifts[backward])
+        for lines, edges, (forward, backward) in zip(full, get_edges(size), AXIS_SHIFTS)
+    ]
+    stable = known & own
+    while True:
+        grown = own
+        for fixed, ahead, behind in safe:
+            grown &= fixed | shift(stable, ahead) | shift(stable, behind)
+        grown |= stable
+        if grown == stable:
+            return stable
+        stable = grown
+
+
+class Features(NamedTuple):
+    """Evaluation features of one player.
+
+    Attributes:
+        mobility: Number of legal disc placements.
+        potential_mobility: Number of empty squares next to opponent discs.
+        frontier: Number of own discs next to an empty square.
+        stable: Number of own discs that can never be flipped.
+    """
+
+    mobility: int
+    potential_mobility: int
+    frontier: int
+    stable: int
+
+
+def get_features(
+    own: int, opp: int, size: int, stable: Optional[int] = None
+) -> Features:
+    """Compute the evaluation features of a player.
+
+    Args:
+        own: Mask of the player's discs.
+        opp: Mask of the opponent's discs.
+        size: Board size.
+        stable: Mask of the player's stable discs if already known.
+
+    Returns:
+        Features instance.
+    """
+    empty = ((1 << size * size) - 1) & ~(own | opp)
+    if stable is None:
+        stable = stable_discs(own, opp, size)
+    return Features(
+        popcount(valid_moves_mask(own, opp, size)),
+        popcount(empty & neighbours(opp, size)),
+        popcount(own & neighbours(empty, size)),
+        popcount(stable),
+    )
+
+
+class _Position(NamedTuple):
+    """Masks of one position followed by an Analysis."""
+
+    black: int
+    white: int
+    full: FullLines
+    stable: Dict[Player, int]
+
+
+class Analysis:
+    """Features of a board kept up to date as discs are placed.
+
+    Call update with every placement made on the board, such as the Undo
+    returned by make_move, and take_back when it is undone. Stable discs
+    are only computed when asked for, starting from those of the closest
+    earlier position where they were.
+
+    Attributes:
+        size: Board size.
+    """
+
+    def __init__(self, board: Board) -> None:
+        """Default constructor for Analysis.
+
+        Args:
+            board: Board to follow.
+        """
+        self.size = board.size
+        black, white = board.get_masks(Player.BLACK)
+        full = full_lines(black | white, self.size)
+        self._positions = [_Position(black, white, full, {})]
+
+    def update(self, player: Player, point: Point, flips: List[Point]) -> None:
+        """Follow a disc placement.
+
+        Args:
+            player: Player who placed the disc.
+            point: Point of the placed disc.
+            flips: Points of the flipped discs.
+        """
+        black, white, full, _ = self._positions[-1]
+        square = point.row * self.size + point.col
+        flipped = 0
+        for row, col in flips:
+            flipped |= 1 << row * self.size + col
+        if player == Player.BLACK:
+            black, white = black | 1 << square | flipped, white ^ flipped
+        else:
+            black, white = black ^ flipped, white | 1 << square | flipped
+        occupied = black | white
+        lines = get_square_lines(self.size)[square]
+        full = tuple(
+            axis | line if occupied & line == line else axis
+            for axis, line in zip(full, lines)
+        )
+        self._positions.append(_Position(black, white, full, {}))
+
+    def take_back(self) -> None:
+        """Return to the position before the last followed placement.
+
+        Raises:
+            ValueError: If no placement is left to take back.
+        """
+        if len(self._positions) == 1:
+            raise ValueError("No placement to take back")
+        self._positions.pop()
+
+    def get_masks(self, player: Player) -> Tuple[int, int]:
+        """Returns the disc masks of the current position.
+
+        Args:
+            player: Player whose discs come first.
+
+        Returns:
+            Masks of the player's discs and of the opponent's discs.
+        """
+        position = self._positions[-1]
+        if player == Player.BLACK:
+            return position.black, position.white
+        return position.white, position.black
+
+    def stable(self, player: Player) -> int:
+        """Returns the stable discs of a player in the current position.
+
+        Args:
+            player: Player whose discs are checked.
+
+        Returns:
+            Mask of stable discs.
+        """
+        position = self._positions[-1]
+        if player not in position.stable:
+            known = next(
+                (
+                    earlier.stable[player]
+                    for earlier in reversed(self._positions)
+                    if player in earlier.stable
+                ),
+                0,
+            )
+            own, opp = self.get_masks(player)
+            position.stable[player] = stable_discs(
+                own, opp, self.size, known, position.full
+            )
+        return position.stable[player]
+
+    def features(self, player: Player) -> Features:
+        """Returns the evaluation features of a player.
+
+        Args:
+            player: Player whose features are computed.
+
+        Returns:
+            Features instance.
+        """
+        own, opp = self.get_masks(player)
+        return get_features(own, opp, self.size, self.stable(player))
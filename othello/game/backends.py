@@ -0,0 +1,60 @@
+"""Board backend registry module.
+
+Backends are imported when first requested, so that listing them does not
+import NumPy.
+"""
+import importlib
+import importlib.util
+from typing import Dict, List, Type
+
+from othello.game.board import Board
+
+# Module and class name of every backend.
+_BACKENDS = {
+    "grid": ("othello.game.board", "Board"),
+    "bitboard": ("othello.game.bitboard", "BitBoard"),
+    "numpy": ("othello.game.numpy_board", "NumpyBoard"),
+}
+
+
+def get_backend_names() -> List[str]:
+    """Returns the names of the available backends without importing them.
+
+    Returns:
+        List of names, including numpy only if it is installed.
+    """
+    names = ["grid", "bitboard"]
+    if importlib.util.find_spec("numpy") is not None:
+        names.append("numpy")
+    return names
+
+
+def get_board_type(name: str) -> Type[Board]:
+    """Returns the Board implementation registered under the given name.
+
+    Args:
+        name: Backend name.
+
+    Returns:
+        Board subclass.
+    """
+    module_name, class_name = _BACKENDS[name]
+    board_type: Type[Board] = getattr(importlib.import_module(module_name), class_name)
+    return board_type
+
+
+def __getattr__(name: str) -> Dict[str, Type[Board]]:
+    """Import every available backend on first access to BACKENDS.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        Dictionary mapping backend names to Board implementations.
+
+    Raises:
+        AttributeError: If the attribute is not BACKENDS.
+    """
+    if name == "BACKENDS":
+        return {name: get_board_type(name) for name in get_backend_names()}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,206 @@
+"""Batched simulation module.
+
+Plays many random games in lockstep with NumPy, one vectorized step per
+ply for all games at once. Requires the optional numpy dependency,
+installed with the numpy extra.
+"""
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.numpy_board import get_neighbours
+from othello.game.player import Player
+from othello.game.point import get_points
+
+# Entries of the recorded move array that are not squares.
+PASS = -1
+FINISHED = -2
+
+
+class BatchResult(NamedTuple):
+    """Final disc counts of a batch of games.
+
+    Attributes:
+        black_discs: Black discs at the end of each game.
+        white_discs: White discs at the end of each game.
+        moves: Array of shape (plies, games) of the square index
+            ``row * size + col`` played at each ply, PASS for passes and
+            FINISHED once the game is over. None unless recorded.
+        size: Board size.
+    """
+
+    black_discs: np.ndarray
+    white_discs: np.ndarray
+    moves: Optional[np.ndarray]
+    size: int
+
+    def scores(self, player: Player) -> np.ndarray:
+        """Returns the game scores from a player's point of view.
+
+        Args:
+            player: Player whose scores are returned.
+
+        Returns:
+            Array of 1 for a win, 0.5 for a draw and 0 for a loss per game.
+        """
+        own, opp = self.black_discs, self.white_discs
+        if player == Player.WHITE:
+            own, opp = opp, own
+        return (np.sign(own - opp) + 1) / 2
+
+    def game_moves(self, game: int) -> List[Move]:
+        """Returns the moves played in one game.
+
+        Args:
+            game: Index of the game in the batch.
+
+        Returns:
+            List of Move instances.
+
+        Raises:
+            ValueError: If the moves were not recorded.
+        """
+        if self.moves is None:
+            raise ValueError("Moves were not recorded")
+        points = get_points(self.size)
+        moves = []
+        for square in self.moves[:, game].tolist():
+            if square == FINISHED:
+                break
+            if square == PASS:
+                moves.append(Move.pass_turn())
+            else:
+                moves.append(Move.play(points[square]))
+        return moves
+
+
+def _to_arrays(
+    game_states: Sequence[GameState], size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack the discs of the player to move and of the opponent per game."""
+    own = np.zeros((len(game_states), size * size + 1), dtype=bool)
+    opp = np.zeros_like(own)
+    for game, game_state in enumerate(game_states):
+        board = game_state.board
+        if board.size != size:
+            raise ValueError("All games in a batch must have the same board size")
+        for index, point in enumerate(get_points(size)):
+            player = board.get_player(point)
+            if player == game_state.current_player:
+                own[game, index] = True
+            elif player is not None:
+                opp[game, index] = True
+    return own, opp
+
+
+def _initial_passes(game_state: GameState) -> int:
+    if game_state.is_over():
+        return 2
+    last_move = game_state.last_move
+    return 1 if last_move is not None and last_move.is_pass else 0
+
+
+def _get_flips(
+    own: np.ndarray, opp: np.ndarray, size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find flipped discs and the placement flipping them, per game and direction."""
+    neighbours = get_neighbours(size)
+    ends = np.where(opp[:, np.newaxis], neighbours, np.arange(neighbours.shape[1]))
+    for _ in range((size - 1).bit_length()):
+        ends = np.take_along_axis(ends, ends, axis=2)
+    empty = ~(own | opp)
+    empty[:, -1] = False
+    origins = ends[:, ::-1]
+    flipped = opp[:, np.newaxis] & np.take_along_axis(own[:, np.newaxis], ends, 2)
+    flipped &= np.take_along_axis(empty[:, np.newaxis], origins, 2)
+    return flipped, origins
+
+
+def _step(
+    own: np.ndarray, opp: np.ndarray, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Play a random move in every game in place, returning squares or PASS."""
+    flipped, origins = _get_flips(own, opp, size)
+    legal = np.zeros(own.shape, dtype=bool)
+    games, directions, discs = np.nonzero(flipped)
+    legal[games, origins[games, directions, discs]] = True
+    keys = rng.random(own.shape)
+    keys[~legal] = -1
+    choices = np.where(legal.any(axis=1), keys.argmax(axis=1), PASS)
+
+    moved = np.flatnonzero(choices != PASS)
+    flips = flipped[moved] & (origins[moved] == choices[moved, None, None])
+    flips = flips.any(axis=1)
+    own[moved] |= flips
+    own[moved, choices[moved]] = True
+    opp[moved] &= ~flips
+    return choices
+
+
+def simulate(
+    game_states: Sequence[GameState], seed: Optional[int] = None, record: bool = False
+) -> BatchResult:
+    """Play random games to the end from the given positions.
+
+    Every ply, legal moves are generated and a uniformly random one is
+    played in all unfinished games at once, so the cost per ply hardly
+    depends on the number of games. Moves follow the same rules as Board,
+    including passes when there is no legal move.
+
+    Args:
+        game_states: Starting positions, all with the same board size.
+        seed: Seed for the random number generator.
+        record: Whether to record the moves played.
+
+    Returns:
+        BatchResult instance.
+    """
+    size = game_states[0].board.size
+    own, opp = _to_arrays(game_states, size)
+    black_to_move = np.array(
+        [game_state.current_player == Player.BLACK for game_state in game_states]
+    )
+    passes = np.array([_initial_passes(game_state) for game_state in game_states])
+    rng = np.random.default_rng(seed)
+    history = []
+    while True:
+        active = np.flatnonzero(passes < 2)
+        if not len(active):
+            break
+        active_own, active_opp = own[active], opp[active]
+        choices = _step(active_own, active_opp, size, rng)
+        own[active], opp[active] = active_opp, active_own
+        passes[active] = np.where(choices == PASS, passes[active] + 1, 0)
+        if record:
+            moves = np.full(len(game_states), FINISHED)
+            moves[active] = choices
+            history.append(moves)
+        black_to_move[active] = ~black_to_move[active]
+
+    black = np.where(black_to_move[:, np.newaxis], own, opp)
+    white = np.where(black_to_move[:, np.newaxis], opp, own)
+    return BatchResult(
+        black.sum(axis=1),
+        white.sum(axis=1),
+        np.array(history).reshape(-1, len(game_states)) if record else None,
+        size,
+    )
+
+
+def random_games(
+    count: int, board_size: int = 8, seed: Optional[int] = None, record: bool = False
+) -> BatchResult:
+    """Play random games from the initial position.
+
+    Args:
+        count: Number of games.
+        board_size: Board size.
+        seed: Seed for the random number generator.
+        record: Whether to record the moves played.
+
+    Returns:
+        BatchResult instance.
+    """
+    return simulate([GameState.new_game(board_size)] * count, seed, record)
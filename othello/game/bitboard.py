@@ -0,0 +1,354 @@
+"""Bitboard module."""
+from __future__ import annotations
+
+import copy
+import functools
+from typing import Dict, List, Optional, Tuple
+
+from othello.game import disc
+from othello.game.board import Board, InvalidDiscPlacementError, Undo, validate_size
+from othello.game.disc import Disc
+from othello.game.player import Player
+from othello.game.point import get_points, Point
+
+Shift = Tuple[int, int]
+
+
+@functools.lru_cache(maxsize=None)
+def get_shifts(size: int) -> Tuple[Shift, ...]:
+    """Returns the shift amount and wrap mask for each of the 8 directions.
+
+    Square (row, col) is stored in bit ``row * size + col``. Moving one
+    step in a direction is a left shift for positive amounts and a right
+    shift for negative ones, followed by a mask clearing the bits that
+    wrapped around to the opposite edge of the board.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of (shift, mask) pairs.
+    """
+    full = (1 << size * size) - 1
+    first_col = 0
+    last_col = 0
+    for row in range(size):
+        first_col |= 1 << row * size
+        last_col |= 1 << row * size + size - 1
+    shifts = []
+    for row_dir in (-1, 0, 1):
+        for col_dir in (-1, 0, 1):
+            if row_dir == 0 and col_dir == 0:
+                continue
+            mask = full
+            if col_dir == 1:
+                mask &= ~first_col
+            elif col_dir == -1:
+                mask &= ~last_col
+            shifts.append((row_dir * size + col_dir, mask))
+    return tuple(shifts)
+
+
+def popcount(mask: int) -> int:
+    """Count set bits in mask.
+
+    Args:
+        mask: Bitmask.
+
+    Returns:
+        Number of set bits.
+    """
+    return bin(mask).count("1")
+
+
+def valid_moves_mask(own: int, opp: int, size: int) -> int:
+    """Compute the mask of squares where a disc can legally be placed.
+
+    Runs of opponent discs adjacent to own discs are grown in every
+    direction at once, and the empty square at the end of each run is a
+    legal placement.
+
+    Args:
+        own: Mask of the moving player's discs.
+        opp: Mask of the opponent's discs.
+        size: Board size.
+
+    Returns:
+        Mask of legal placements.
+    """
+    empty = ~(own | opp)
+    moves = 0
+    for shift, mask in get_shifts(size):
+        run_mask = mask & opp
+        if shift > 0:
+            run = (own << shift) & run_mask
+            while run:
+                grown = run | (run << shift) & run_mask
+                if grown == run:
+                    break
+                run = grown
+            moves |= (run << shift) & mask
+        else:
+            shift = -shift
+            run = (own >> shift) & run_mask
+            while run:
+                grown = run | (run >> shift) & run_mask
+                if grown == run:
+                    break
+                run = grown
+            moves |= (run >> shift) & mask
+    return moves & empty
+
+
+def flips_mask(own: int, opp: int, move: int, size: int) -> int:
+    """Compute the discs outflanked by placing a disc on the move bit.
+
+    Args:
+        own: Mask of the moving player's discs.
+        opp: Mask of the opponent's discs.
+        move: Single bit mask of the placed disc.
+        size: Board size.
+
+    Returns:
+        Mask of discs that would be flipped.
+    """
+    flips = 0
+    for shift, mask in get_shifts(size):
+        run = 0
+        if shift > 0:
+            square = (move << shift) & mask
+            while square & opp:
+                run |= square
+                square = (square << shift) & mask
+        else:
+            shift = -shift
+            square = (move >> shift) & mask
+            while square & opp:
+                run |= square
+                square = (square >> shift) & mask
+        if square & own:
+            flips |= run
+    return flips
+
+
+class BitBoard(Board):
+    """Othello board backed by one bitmask per player.
+
+    Behaves like Board, but move generation and flipping are computed
+    with shift-and-mask operations on whole bitmasks instead of walking
+    the grid one square at a time.
+
+    Attributes:
+        size: Board size.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Default constructor for BitBoard.
+
+        Args:
+            size: Board size.
+        """
+        validate_size(size)
+
+        self.size = size
+
+        center = size // 2 - 1
+        self._black = 1 << center * size + center + 1
+        self._black |= 1 << (center + 1) * size + center
+        self._white = 1 << center * size + center
+        self._white |= 1 << (center + 1) * size + center + 1
+        self.zobrist_hash = self._hash_discs()
+
+    @classmethod
+    def from_board(cls, board: Board) -> BitBoard:
+        """Constructor for a BitBoard holding the same discs as another board.
+
+        Args:
+            board: Board of any implementation.
+
+        Returns:
+            BitBoard instance.
+        """
+        if isinstance(board, BitBoard):
+            return board.copy()
+        bitboard = cls(board.size)
+        bitboard._black, bitboard._white = board.get_masks(Player.BLACK)
+        bitboard.zobrist_hash = board.zobrist_hash
+        return bitboard
+
+    @classmethod
+    def from_masks(cls, size: int, black: int, white: int) -> BitBoard:
+        """Constructor for a BitBoard holding the discs of the given masks.
+
+        Args:
+            size: Board size.
+            black: Mask of black discs.
+            white: Mask of white discs.
+
+        Returns:
+            BitBoard instance.
+        """
+        bitboard = cls(size)
+        bitboard._black = black
+        bitboard._white = white
+        bitboard.zobrist_hash = bitboard._hash_discs()
+        return bitboard
+
+    def _rows(self) -> List[List[Disc]]:
+        blank = disc.get_disc()
+        black = disc.get_disc(Player.BLACK)
+        white = disc.get_disc(Player.WHITE)
+        rows = []
+        bit = 1
+        for _ in range(self.size):
+            row = []
+            for _ in range(self.size):
+                if self._black & bit:
+                    row.append(black)
+                elif self._white & bit:
+                    row.append(white)
+                else:
+                    row.append(blank)
+                bit <<= 1
+            rows.append(row)
+        return rows
+
+    def get_masks(self, player: Player) -> Tuple[int, int]:
+        """Returns the disc masks from the given player's point of view.
+
+        Args:
+            player: Player whose discs make up the first mask.
+
+        Returns:
+            Tuple of player's disc mask and opponent's disc mask.
+        """
+        if player == Player.BLACK:
+            return self._black, self._white
+        return self._white, self._black
+
+    def count_discs(self, player: Player) -> int:
+        """Count discs on board corresponding to the given player.
+
+        Args:
+            player: Player whose discs are counted.
+
+        Returns:
+            Disc count.
+        """
+        return popcount(self.get_masks(player)[0])
+
+    def get_player(self, point: Point) -> Optional[Player]:
+        """Returns the player whose disc is at the given point.
+
+        Args:
+            point: Point on the board.
+
+        Returns:
+            Player owning the disc, None if the point is empty.
+        """
+        bit = 1 << point.row * self.size + point.col
+        if self._black & bit:
+            return Player.BLACK
+        if self._white & bit:
+            return Player.WHITE
+        return None
+
+    def copy(self) -> BitBoard:
+        """Returns an independent copy of the board.
+
+        Returns:
+            BitBoard instance with the same discs.
+        """
+        return copy.copy(self)
+
+    def place_disc(
+        self, player: Player, point: Point, flips: Optional[List[Point]] = None
+    ) -> List[Point]:
+        """Place disc corresponding to player at the given point.
+
+        Args:
+            player: The disc placed corresponds to this player.
+            point: The disc will be placed at this point.
+            flips: Discs flipped by the placement if already known from
+                get_valid_moves.
+
+        Returns:
+            Points of the discs that were flipped.
+
+        Raises:
+            InvalidDiscPlacementError: If disc cannot legally be placed
+                at the given point.
+        """
+        own, opp = self.get_masks(player)
+        move = 1 << point.row * self.size + point.col
+        if flips is not None:
+            flipped = self._to_mask(flips)
+            self._set_masks(player, own | move | flipped, opp ^ flipped)
+            self._update_hash(player, point, flips)
+            return flips
+        flipped = 0
+        if self._is_on_grid(point) and not (own | opp) & move:
+            flipped = flips_mask(own, opp, move, self.size)
+        if not flipped:
+            raise InvalidDiscPlacementError(f"{point} is not a valid move!")
+
+        self._set_masks(player, own | move | flipped, opp ^ flipped)
+        flips = self._to_points(flipped)
+        self._update_hash(player, point, flips)
+        return flips
+
+    def undo_move(self, undo: Undo) -> None:
+        """Take back a placement made with make_move.
+
+        Args:
+            undo: Token returned by make_move.
+        """
+        own, opp = self.get_masks(undo.player)
+        flips = self._to_mask(undo.flips)
+        move = 1 << undo.point.row * self.size + undo.point.col
+        self._set_masks(undo.player, own ^ (move | flips), opp | flips)
+        self._update_hash(undo.player, undo.point, undo.flips)
+
+    def _set_masks(self, player: Player, own: int, opp: int) -> None:
+        if player == Player.BLACK:
+            self._black, self._white = own, opp
+        else:
+            self._white, self._black = own, opp
+
+    def get_valid_moves(self, player: Player) -> Dict[Point, List[Point]]:
+        """Get valid moves and their captures.
+
+        Args:
+            player: Player whose moves are considered.
+
+        Returns:
+            Dictionary mapping valid disc placements to discs captured by the
+            move.
+        """
+        own, opp = self.get_masks(player)
+        moves = valid_moves_mask(own, opp, self.size)
+        valid_moves = {}
+        while moves:
+            move = moves & -moves
+            moves ^= move
+            flips = flips_mask(own, opp, move, self.size)
+            valid_moves[self._to_point(move)] = self._to_points(flips)
+        return valid_moves
+
+    def _to_mask(self, points: List[Point]) -> int:
+        mask = 0
+        for row, col in points:
+            mask |= 1 << row * self.size + col
+        return mask
+
+    def _to_point(self, bit: int) -> Point:
+        return get_points(self.size)[bit.bit_length() - 1]
+
+    def _to_points(self, mask: int) -> List[Point]:
+        table = get_points(self.size)
+        points = []
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            points.append(table[bit.bit_length() - 1])
+        return points
@@ -1,15 +1,31 @@
 """Board module."""
+from __future__ import annotations
+
+import copy
+import functools
 import itertools
 import string
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 
-from othello.game import disc
+from othello.game import disc, zobrist
+from othello.game.disc import Disc
 from othello.game.player import Player
-from othello.game.point import Point
+from othello.game.point import get_points, Point
 
 MIN_BOARD_SIZE = 4
 MAX_BOARD_SIZE = 26
 
+# Grid value of an empty square; occupied squares hold the owner's value.
+EMPTY = 0
+_PLAYERS = (None, Player.BLACK, Player.WHITE)
+# Tables translating grid values to b"1" for one player's discs, b"0" else.
+_MASK_DIGITS = {
+    player: bytes(
+        ord("1") if value == player.value else ord("0") for value in range(256)
+    )
+    for player in Player
+}
+
 
 class BoardSizeError(Exception):
     """Raised when initializing Board object with invalid board size."""
@@ -23,13 +39,110 @@ class InvalidDiscPlacementError(Exception):
     pass
 
 
+def validate_size(size: int) -> None:
+    """Check that the given board size is supported.
+
+    Args:
+        size: Board size.
+
+    Raises:
+        BoardSizeError: Invalid board size.
+    """
+    if not MIN_BOARD_SIZE <= size or not MAX_BOARD_SIZE >= size or size % 2 != 0:
+        raise BoardSizeError(f"{size} is invalid size!")
+
+
+@functools.lru_cache(maxsize=None)
+def get_neighbour_indices(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """Returns the indices of the squares adjacent to every square.
+
+    Square (row, col) has index ``row * size + col``.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of neighbour indices per square index.
+    """
+    neighbours = []
+    for row in range(size):
+        for col in range(size):
+            neighbours.append(
+                tuple(
+                    next_row * size + next_col
+                    for next_row in range(max(row - 1, 0), min(row + 2, size))
+                    for next_col in range(max(col - 1, 0), min(col + 2, size))
+                    if next_row != row or next_col != col
+                )
+            )
+    return tuple(neighbours)
+
+
+# Direction order of the rays, which is also the order Board lists flips in.
+# Other backends may list the same flips in another order, BitBoard for
+# instance lists them square by square.
+DIRECTIONS = ((-1, 1), (0, 1), (1, 1), (-1, 0), (1, 0), (-1, -1), (0, -1), (1, -1))
+
+
+@functools.lru_cache(maxsize=None)
+def get_rays(size: int) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """Returns the rays of squares leading from every square to the edges.
+
+    A ray lists the indices of the squares met when walking from a square
+    in one direction until the edge of the board, nearest first. Rays
+    shorter than two squares are left out since they cannot outflank
+    anything. Walking the rays needs no bounds checks.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of rays per square index.
+    """
+    rays = []
+    for row in range(size):
+        for col in range(size):
+            square_rays = []
+            for row_dir, col_dir in DIRECTIONS:
+                ray = []
+                next_row, next_col = row + row_dir, col + col_dir
+                while 0 <= next_row < size and 0 <= next_col < size:
+                    ray.append(next_row * size + next_col)
+                    next_row += row_dir
+                    next_col += col_dir
+                if len(ray) > 1:
+                    square_rays.append(tuple(ray))
+            rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+class Undo(NamedTuple):
+    """Information needed to take back a disc placement.
+
+    Attributes:
+        player: Player who placed the disc.
+        point: Point the disc was placed at.
+        flips: Points of the discs that were flipped by the placement.
+    """
+
+    player: Player
+    point: Point
+    flips: List[Point]
+
+
 class Board:
     """Othello board.
 
-    Board instances keep track of what color discs are on what locations.
+    Board instances keep track of what color discs are on what locations,
+    in a flat grid with one byte per square. Disc counts and the frontier,
+    the set of empty squares next to an occupied square, are kept up to
+    date as discs are placed and flipped, since only frontier squares can
+    be valid moves.
 
     Attributes:
         size: Board size.
+        zobrist_hash: Zobrist hash of the disc placement, updated as discs
+            are placed and flipped.
     """
 
     def __init__(self, size: int) -> None:
@@ -43,18 +156,26 @@ class Board:
 
         Raises:
             BoardSizeError: Invalid board size.
+
+        # noqa: DAR402 BoardSizeError
         """
-        if not MIN_BOARD_SIZE <= size or not MAX_BOARD_SIZE >= size or size % 2 != 0:
-            raise BoardSizeError(f"{size} is invalid size!")
+        validate_size(size)
 
         self.size = size
 
         center = size // 2 - 1
-        self._grid = [[disc.get_disc()] * size for _ in range(size)]
-        self._grid[center][center] = disc.get_disc(Player.WHITE)
-        self._grid[center][center + 1] = disc.get_disc(Player.BLACK)
-        self._grid[center + 1][center] = disc.get_disc(Player.BLACK)
-        self._grid[center + 1][center + 1] = disc.get_disc(Player.WHITE)
+        corner = center * size + center
+        self._grid = bytearray(size * size)
+        self._grid[corner] = Player.WHITE.value
+        self._grid[corner + 1] = Player.BLACK.value
+        self._grid[corner + size] = Player.BLACK.value
+        self._grid[corner + size + 1] = Player.WHITE.value
+
+        self._counts = {Player.BLACK: 2, Player.WHITE: 2}
+        self._frontier: Set[int] = set()
+        for index in (corner, corner + 1, corner + size, corner + size + 1):
+            self._add_to_frontier(index)
+        self.zobrist_hash = self._hash_discs()
 
     def __str__(self) -> str:
         """ASCII graphical representation of Board.
@@ -65,12 +186,19 @@ class Board:
         rowline = f" +{'-' * (self.size * 2 - 1)}+"
         rowlines = [rowline] * (self.size + 1)
 
-        rows = [f"{i+1}|{'|'.join(row)}|" for i, row in enumerate(self._grid)]
+        rows = [f"{i+1}|{'|'.join(row)}|" for i, row in enumerate(self._rows())]
         columns = string.ascii_lowercase[: self.size]
         rows.append(f"  {' '.join(columns)} ")
 
         return "\n".join(itertools.chain(*zip(rowlines, rows)))
 
+    def _rows(self) -> List[List[Disc]]:
+        discs = [disc.get_disc(player) for player in _PLAYERS]
+        return [
+            [discs[value] for value in self._grid[start : start + self.size]]
+            for start in range(0, self.size * self.size, self.size)
+        ]
+
     def count_discs(self, player: Player) -> int:
         """Count discs on board corresponding to the given player.
 
@@ -80,15 +208,63 @@ class Board:
         Returns:
             Disc count.
         """
-        count = 0
-        player_disc = disc.get_disc(player)
-        for i in range(self.size):
-            for j in range(self.size):
-                if self._grid[i][j] == player_disc:
-                    count += 1
-        return count
-
-    def place_disc(self, player: Player, point: Point) -> None:
+        return self._counts[player]
+
+    def get_player(self, point: Point) -> Optional[Player]:
+        """Returns the player whose disc is at the given point.
+
+        Args:
+            point: Point on the board.
+
+        Returns:
+            Player owning the disc, None if the point is empty.
+        """
+        return _PLAYERS[self._grid[point.row * self.size + point.col]]
+
+    def get_masks(self, player: Player) -> Tuple[int, int]:
+        """Returns the disc masks from the given player's point of view.
+
+        Square (row, col) is stored in bit ``row * size + col``.
+
+        Args:
+            player: Player whose discs make up the first mask.
+
+        Returns:
+            Tuple of player's disc mask and opponent's disc mask.
+        """
+        own = self._grid.translate(_MASK_DIGITS[player])[::-1]
+        opp = self._grid.translate(_MASK_DIGITS[player.other])[::-1]
+        return int(own, 2), int(opp, 2)
+
+    def _hash_discs(self) -> int:
+        keys = zobrist.get_keys(self.size)
+        zobrist_hash = 0
+        for index, point in enumerate(get_points(self.size)):
+            owner = self.get_player(point)
+            if owner == Player.BLACK:
+                zobrist_hash ^= keys.black[index]
+            elif owner == Player.WHITE:
+                zobrist_hash ^= keys.white[index]
+        return zobrist_hash
+
+    def copy(self) -> Board:
+        """Returns an independent copy of the board.
+
+        The grid is a flat bytearray, so copying it is a single
+        allocation.
+
+        Returns:
+            Board instance with the same discs.
+        """
+        clone = copy.copy(self)
+        clone._grid = self._grid[:]
+        clone._counts = self._counts.copy()
+        clone._frontier = self._frontier.copy()
+        return clone
+
+    def place_disc(
+        self, player: Player, point: Point, flips: Optional[List[Point]] = None
+    ) -> List[Point]:
         """Place disc corresponding to player at the given point.
 
         If the move is valid, the Board instance will be updated to
@@ -98,20 +274,85 @@ class Board:
         Args:
             player: The disc placed corresponds to this player.
             point: The disc will be placed at this point.
+            flips: Discs flipped by the placement, as returned by
+                get_valid_moves for this position, to skip looking them
+                up again. They are trusted without checking.
+
+        Returns:
+            Points of the discs that were flipped.
 
         Raises:
             InvalidDiscPlacementError: If disc cannot legally be placed
                 at the given point.
         """
-        valid_moves = self.get_valid_moves(player)
+        outflanks = self._get_outflanks(player, point) if flips is None else flips
 
-        if point not in valid_moves:
+        if not outflanks:
             raise InvalidDiscPlacementError(f"{point} is not a valid move!")
 
-        self._grid[point.row][point.col] = disc.get_disc(player)
-        outflanks = valid_moves[point]
+        index = point.row * self.size + point.col
+        self._grid[index] = player.value
         for row, col in outflanks:
-            self._grid[row][col] = disc.get_disc(player)
+            self._grid[row * self.size + col] = player.value
+
+        self._counts[player] += len(outflanks) + 1
+        self._counts[player.other] -= len(outflanks)
+        self._frontier.discard(index)
+        self._add_to_frontier(index)
+        self._update_hash(player, point, outflanks)
+        return outflanks
+
+    def make_move(
+        self, player: Player, point: Point, flips: Optional[List[Point]] = None
+    ) -> Undo:
+        """Place a disc in place and return how to take it back.
+
+        Works like place_disc, raising InvalidDiscPlacementError on
+        illegal placements, but returns an Undo token that can be passed
+        to undo_move to restore the previous position without copying
+        the board.
+
+        Args:
+            player: The disc placed corresponds to this player.
+            point: The disc will be placed at this point.
+            flips: Discs flipped by the placement if already known.
+
+        Returns:
+            Undo token for the placement.
+        """
+        return Undo(player, point, self.place_disc(player, point, flips))
+
+    def undo_move(self, undo: Undo) -> None:
+        """Take back a placement made with make_move.
+
+        Placements must be undone in the reverse order they were made.
+
+        Args:
+            undo: Token returned by make_move.
+        """
+        grid = self._grid
+        opponent = undo.player.other.value
+        index = undo.point.row * self.size + undo.point.col
+        grid[index] = EMPTY
+        for row, col in undo.flips:
+            grid[row * self.size + col] = opponent
+
+        self._counts[undo.player] -= len(undo.flips) + 1
+        self._counts[undo.player.other] += len(undo.flips)
+        self._update_hash(undo.player, undo.point, undo.flips)
+        self._frontier.add(index)
+        neighbours = get_neighbour_indices(self.size)
+        for neighbour in neighbours[index]:
+            if neighbour in self._frontier and not any(
+                grid[square] for square in neighbours[neighbour]
+            ):
+                self._frontier.remove(neighbour)
+
+    def _update_hash(self, player: Player, point: Point, flips: List[Point]) -> None:
+        flip_keys = zobrist.get_keys(self.size).flip
+        self.zobrist_hash ^= zobrist.disc_key(self.size, player, point)
+        for row, col in flips:
+            self.zobrist_hash ^= flip_keys[row * self.size + col]
 
     def get_valid_moves(self, player: Player) -> Dict[Point, List[Point]]:
         """Get valid moves and their captures.
@@ -123,56 +364,38 @@ class Board:
             Dictionary mapping valid disc placements to discs captured by the
             move.
         """
+        points = get_points(self.size)
         valid_moves = {}
-        for row in range(self.size):
-            for col in range(self.size):
-                point = Point(row, col)
-                outflanks = self._get_outflanks(player, point)
-                if outflanks:
-                    valid_moves[point] = outflanks
+        for index in sorted(self._frontier):
+            outflanks = self._get_outflanks(player, points[index])
+            if outflanks:
+                valid_moves[points[index]] = outflanks
         return valid_moves
 
-    def _get_outflanks(self, player: Player, point: Point) -> List[Point]:
-        directions = [
-            (-1, 1),
-            (0, 1),
-            (1, 1),
-            (-1, 0),
-            (1, 0),
-            (-1, -1),
-            (0, -1),
-            (1, -1),
-        ]
-        outflanks = []
-        if (
-            self._is_on_grid(point)
-            and self._grid[point.row][point.col] == disc.get_disc()
-        ):
-            for direction in directions:
-                tmp = self._get_outflanks_in_dir(player, point, direction)
-                if tmp:
-                    outflanks.extend(tmp)
-        return outflanks
+    def _add_to_frontier(self, index: int) -> None:
+        for neighbour in get_neighbour_indices(self.size)[index]:
+            if self._grid[neighbour] == EMPTY:
+                self._frontier.add(neighbour)
 
-    def _get_outflanks_in_dir(
-        self, player: Player, point: Point, direction: Tuple[int, int]
-    ) -> List[Point]:
+    def _get_outflanks(self, player: Player, point: Point) -> List[Point]:
         outflanks: List[Point] = []
-        next_point = point
-        row_dir, col_dir = direction
-        while True:
-            next_point = Point(next_point.row + row_dir, next_point.col + col_dir)
-            if self._is_on_grid(next_point):
-                next_value = self._grid[next_point.row][next_point.col]
-                if next_value != disc.get_disc():
-                    if next_value == disc.get_disc(player):
-                        return outflanks
-                    outflanks.append(next_point)
-                else:
+        if not self._is_on_grid(point):
+            return outflanks
+        index = point.row * self.size + point.col
+        grid = self._grid
+        if grid[index] != EMPTY:
+            return outflanks
+        own = player.value
+        points = get_points(self.size)
+        for ray in get_rays(self.size)[index]:
+            for distance, square in enumerate(ray):
+                value = grid[square]
+                if value == own:
+                    outflanks.extend([points[flip] for flip in ray[:distance]])
                     break
-            else:
-                break
-        return []
+                if value == EMPTY:
+                    break
+        return outflanks
 
     def _is_on_grid(self, point: Point) -> bool:
         return 0 <= point.row < self.size and 0 <= point.col < self.size
@@ -15,12 +15,18 @@ class Disc(str):
     __slots__ = ()
 
 
+# Discs are immutable, so every caller shares these instances.
+_BLANK = Disc(BLANK_DISC)
+_BLACK = Disc(BLACK_DISC)
+_WHITE = Disc(WHITE_DISC)
+
+
 def get_disc(player: Optional[Player] = None) -> Disc:
     """Returns Disc object based on given player.
 
     Returns the Disc object corresponding to the player color
     if a Player type is passed, or a blank Disc if no argument
-    is passed.
+    is passed. The same Disc instances are returned on every call.
 
     Args:
         player: Disc will be made for this player (blank disc if None).
@@ -29,8 +35,8 @@ def get_disc(player: Optional[Player] = None) -> Disc:
         Corresponding Disc object.
     """
     if player == Player.BLACK:
-        return Disc(BLACK_DISC)
+        return _BLACK
     elif player == Player.WHITE:
-        return Disc(WHITE_DISC)
+        return _WHITE
     else:
-        return Disc(BLANK_DISC)
+        return _BLANK
@@ -0,0 +1,412 @@
+"""Endgame solver module.
+
+With few empty squares left, the game tree can be searched to the end to
+find the exact final disc differential. The solver works on the disc
+masks of a BitBoard, with the empty squares kept in a list so that the
+nodes near the leaves do not need full move generation.
+
+Moves are searched with principal variation search. Far from the end
+they are ordered fastest-first, fewest opponent replies first, with
+solved positions kept in a table. Close to the end, moves into regions
+with an odd number of empties are tried first (parity ordering). A
+position is cut off without searching when the discs the opponent can
+never lose already rule out beating alpha (stability cutoff).
+"""
+
+import functools
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from othello.game.analysis import stable_discs
+from othello.game.bitboard import BitBoard, popcount, valid_moves_mask
+from othello.game.board import get_neighbour_indices, get_rays
+from othello.game.game_state import GameState
+from othello.game.player import Player
+from othello.game.point import get_points, Point
+
+# Characters of a position written as text, as in endgame test suites.
+BLACK_SQUARES = "Xx*"
+WHITE_SQUARES = "Oo"
+EMPTY_SQUARES = "-."
+
+# Positions with at least this many empties order moves fastest-first and
+# are kept in the table, positions with fewer use parity ordering.
+FASTEST_FIRST_EMPTIES = 7
+# Positions with at least this many empties try the stability cutoff.
+STABILITY_EMPTIES = 5
+
+# Neighbour mask, ascending and descending ray masks of a square.
+Rays = Tuple[int, Tuple[int, ...], Tuple[int, ...]]
+# Bounds of a table entry and the square index of the best move.
+Entry = Tuple[int, int, int]
+
+
+class Solution(NamedTuple):
+    """Exact result of a position.
+
+    Attributes:
+        score: Final disc differential for the player to move with best
+            play from both sides.
+        move: Best move, None if the player to move has to pass or the
+            game is over.
+        nodes: Number of positions searched.
+    """
+
+    score: int
+    move: Optional[Point]
+    nodes: int
+
+
+@functools.lru_cache(maxsize=None)
+def get_ray_masks(size: int) -> Tuple[Rays, ...]:
+    """Returns the neighbours and rays of every square as masks.
+
+    Rays are split by walking direction: the first tuple of a square holds
+    the rays walking towards higher bit indices, the second the rays
+    walking towards lower ones, so that the first square of a ray that is
+    not an opponent disc can be found with one bit operation.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of neighbour mask, ascending and descending ray masks per
+        square index.
+    """
+    masks = []
+    for square, rays in enumerate(get_rays(size)):
+        ascending: List[int] = []
+        descending: List[int] = []
+        for ray in rays:
+            mask = sum(1 << index for index in ray)
+            (ascending if ray[0] > square else descending).append(mask)
+        neighbours = sum(1 << index for index in get_neighbour_indices(size)[square])
+        masks.append((neighbours, tuple(ascending), tuple(descending)))
+    return tuple(masks)
+
+
+@functools.lru_cache(maxsize=None)
+def get_quadrants(size: int) -> Tuple[int, ...]:
+    """Returns the quadrant of every square, used for parity ordering.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of quadrant numbers from 0 to 3 per square index.
+    """
+    half = size // 2
+    return tuple(
+        (row >= half) * 2 + (col >= half) for row in range(size) for col in range(size)
+    )
+
+
+def get_flips(own: int, opp: int, square: int, size: int) -> int:
+    """Compute the discs outflanked by placing a disc on a square.
+
+    Args:
+        own: Mask of the moving player's discs.
+        opp: Mask of the opponent's discs.
+        square: Index of the empty square.
+        size: Board size.
+
+    Returns:
+        Mask of discs that would be flipped, 0 if the move is illegal.
+    """
+    return _get_flips(own, opp, get_ray_masks(size)[square])
+
+
+def _get_flips(own: int, opp: int, rays: Rays) -> int:
+    neighbours, ascending, descending = rays
+    if not neighbours & opp:
+        return 0
+    flips = 0
+    for ray in ascending:
+        outflank = ray & ~opp
+        outflank &= -outflank
+        if outflank & own:
+            flips |= ray & (outflank - 1)
+    for ray in descending:
+        outflank = ray & ~opp
+        if outflank:
+            outflank = 1 << outflank.bit_length() - 1
+            if outflank & own:
+                flips |= ray & -(outflank << 1)
+    return flips
+
+
+class _Solver:
+    """Search state of one solve call."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.squares = size * size
+        self.quadrants = get_quadrants(size)
+        self.rays = get_ray_masks(size)
+        last = size * size - 1
+        self.corners = 1 | 1 << size - 1 | 1 << last - size + 1 | 1 << last
+        self.nodes = 0
+        self.table: Dict[Tuple[int, int], Entry] = {}
+
+    def search(
+        self, own: int, opp: int, empties: List[int], alpha: int, beta: int
+    ) -> int:
+        """Score a position exactly within the window (alpha, beta).
+
+        Scores outside the window are bounds: at most alpha on a fail low
+        and at least beta on a fail high.
+
+        Args:
+            own: Mask of the discs of the player to move.
+            opp: Mask of the opponent's discs.
+            empties: Indices of the empty squares.
+            alpha: Lower end of the window.
+            beta: Upper end of the window.
+
+        Returns:
+            Final disc differential for the player to move.
+        """
+        self.nodes += 1
+        count = len(empties)
+        if count == 2:
+            return self._search_two(own, opp, empties[0], empties[1], alpha, beta)
+
+        if count >= STABILITY_EMPTIES and alpha >= self.squares - 2 * popcount(opp):
+            bound = self.squares - 2 * popcount(stable_discs(opp, own, self.size))
+            if bound <= alpha:
+                return bound
+
+        if count < FASTEST_FIRST_EMPTIES:
+            moves = self._parity_order(own, opp, empties)
+            return self.search_moves(own, opp, empties, moves, alpha, beta)[0]
+
+        default = (-self.squares, self.squares, -1)
+        lower, upper, hash_square = self.table.get((own, opp), default)
+        if lower >= beta or lower == upper:
+            return lower
+        if upper <= alpha:
+            return upper
+        alpha = max(alpha, lower)
+        beta = min(beta, upper)
+        moves = self.fastest_first(own, opp, empties, hash_square)
+        best, square = self.search_moves(own, opp, empties, moves, alpha, beta)
+        if best > alpha:
+            lower = best
+        if best < beta:
+            upper = best
+        self.table[(own, opp)] = (lower, upper, square)
+        return best
+
+    def search_moves(
+        self,
+        own: int,
+        opp: int,
+        empties: List[int],
+        moves: List[Tuple[int, int]],
+        alpha: int,
+        beta: int,
+    ) -> Tuple[int, int]:
+        """Search the moves of a position in order with a null window after the first.
+
+        Args:
+            own: Mask of the discs of the player to move.
+            opp: Mask of the opponent's discs.
+            empties: Indices of the empty squares.
+            moves: Square indices and flips of the legal moves.
+            alpha: Lower end of the window.
+            beta: Upper end of the window.
+
+        Returns:
+            Tuple of the score and the best move's square index, -1 when
+            passing or when the game is over.
+        """
+        if not moves:
+            if not valid_moves_mask(opp, own, self.size):
+                return popcount(own) - popcount(opp), -1
+            return -self.search(opp, own, empties, -beta, -alpha), -1
+
+        best = -self.squares - 1
+        best_square = -1
+        for square, flips in moves:
+            children = [empty for empty in empties if empty != square]
+            next_own = opp ^ flips
+            next_opp = own | flips | 1 << square
+            if best_square < 0:
+                score = -self.search(next_own, next_opp, children, -beta, -alpha)
+            else:
+                score = -self.search(next_own, next_opp, children, -alpha - 1, -alpha)
+                if alpha < score < beta:
+                    score = -self.search(next_own, next_opp, children, -beta, -score)
+            if score > best:
+                best = score
+                best_square = square
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best, best_square
+
+    def _search_two(
+        self, own: int, opp: int, first: int, second: int, alpha: int, beta: int
+    ) -> int:
+        """Score a position with two empty squares left without recursing."""
+        best = None
+        for square, last in ((first, second), (second, first)):
+            flips = _get_flips(own, opp, self.rays[square])
+            if flips:
+                self.nodes += 1
+                score = -self._search_last(opp ^ flips, own | flips | 1 << square, last)
+                if best is None or score > best:
+                    best = score
+                    if best >= beta:
+                        return best
+        if best is not None:
+            return best
+        if _get_flips(opp, own, self.rays[first]) or _get_flips(
+            opp, own, self.rays[second]
+        ):
+            self.nodes += 1
+            return -self._search_two(opp, own, first, second, -beta, -alpha)
+        return popcount(own) - popcount(opp)
+
+    def _search_last(self, own: int, opp: int, square: int) -> int:
+        """Score a position with one empty square left without recursing."""
+        self.nodes += 1
+        filled = self.squares - 1
+        own_count = popcount(own)
+        rays = self.rays[square]
+        flips = _get_flips(own, opp, rays)
+        if flips:
+            return 2 * (own_count + popcount(flips)) + 1 - filled
+        flips = _get_flips(opp, own, rays)
+        if flips:
+            return 2 * (own_count - popcount(flips)) - 1 - filled
+        return 2 * own_count - filled
+
+    def fastest_first(
+        self, own: int, opp: int, empties: List[int], first: int
+    ) -> List[Tuple[int, int]]:
+        """List the legal moves, fewest opponent replies first.
+
+        Replies on corners count twice.
+
+        Args:
+            own: Mask of the discs of the player to move.
+            opp: Mask of the opponent's discs.
+            empties: Indices of the empty squares.
+            first: Square index of a move to put first, such as the best
+                move of an earlier search.
+
+        Returns:
+            List of square indices and flips.
+        """
+        size = self.size
+        legal = valid_moves_mask(own, opp, size)
+        scored = []
+        for square in empties:
+            if legal >> square & 1:
+                flips = _get_flips(own, opp, self.rays[square])
+                replies = valid_moves_mask(opp ^ flips, own | flips | 1 << square, size)
+                mobility = popcount(replies) + popcount(replies & self.corners)
+                if square == first:
+                    mobility = -1
+                scored.append((mobility, square, flips))
+        scored.sort(key=lambda move: move[0])
+        return [(square, flips) for _, square, flips in scored]
+
+    def _parity_order(
+        self, own: int, opp: int, empties: List[int]
+    ) -> List[Tuple[int, int]]:
+        """List the legal moves, moves into regions with odd empties first."""
+        parity = 0
+        for square in empties:
+            parity ^= 1 << self.quadrants[square]
+        odd = []
+        even = []
+        for square in empties:
+            flips = _get_flips(own, opp, self.rays[square])
+            if flips:
+                if parity >> self.quadrants[square] & 1:
+                    odd.append((square, flips))
+                else:
+                    even.append((square, flips))
+        return odd + even
+
+
+def _empty_order(size: int) -> List[int]:
+    """Order squares corners first and squares next to corners last."""
+    last = size - 1
+
+    def priority(square: int) -> int:
+        row, col = divmod(square, size)
+        near_row = min(row, last - row)
+        near_col = min(col, last - col)
+        if near_row == near_col == 0:
+            return 0
+        if near_row <= 1 and near_col <= 1:
+            return 2
+        return 1
+
+    return sorted(range(size * size), key=priority)
+
+
+def solve(game_state: GameState) -> Solution:
+    """Find the exact final disc differential and best move of a position.
+
+    The search time grows quickly with the number of empty squares: on
+    an 8x8 board, positions up to about 14 to 16 empties are practical.
+    The search has no time limit and always runs to the end.
+
+    Args:
+        game_state: Position to solve, left unchanged.
+
+    Returns:
+        Solution instance.
+    """
+    board = BitBoard.from_board(game_state.board)
+    size = board.size
+    own, opp = board.get_masks(game_state.current_player)
+    solver = _Solver(size)
+    if game_state.is_over():
+        return Solution(popcount(own) - popcount(opp), None, 0)
+
+    occupied = own | opp
+    empties = [square for square in _empty_order(size) if not occupied >> square & 1]
+    moves = solver.fastest_first(own, opp, empties, -1)
+    solver.nodes += 1
+    score, square = solver.search_moves(
+        own, opp, empties, moves, -solver.squares - 1, solver.squares + 1
+    )
+    move = get_points(size)[square] if square >= 0 else None
+    return Solution(score, move, solver.nodes)
+
+
+def parse_position(text: str, player: Player = Player.BLACK) -> GameState:
+    """Read a position written with one character per square.
+
+    Squares are listed row by row, with ``X`` for black discs, ``O`` for
+    white discs and ``-`` for empty squares, as in the positions of common
+    endgame test suites. Whitespace is ignored.
+
+    Args:
+        text: Position text.
+        player: Player to move.
+
+    Returns:
+        GameState instance backed by a BitBoard.
+
+    Raises:
+        ValueError: If the text does not describe a square board.
+    """
+    squares = "".join(text.split())
+    size = int(round(len(squares) ** 0.5))
+    if size * size != len(squares):
+        raise ValueError(f"{len(squares)} squares do not make a square board")
+    black = white = 0
+    for square, character in enumerate(squares):
+        if character in BLACK_SQUARES:
+            black |= 1 << square
+        elif character in WHITE_SQUARES:
+            white |= 1 << square
+        elif character not in EMPTY_SQUARES:
+            raise ValueError(f"{character!r} is not a disc or an empty square")
+    return GameState(BitBoard.from_masks(size, black, white), player)
@@ -1,10 +1,10 @@
 """Game state module."""
 from __future__ import annotations
 
-import copy
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional, Type
 
-from othello.game.board import Board, InvalidDiscPlacementError
+from othello.game import zobrist
+from othello.game.board import Board, InvalidDiscPlacementError, Undo
 from othello.game.move import Move
 from othello.game.player import Player
 from othello.game.point import Point
@@ -16,9 +16,33 @@ class InvalidMoveError(Exception):
     pass
 
 
+class StateUndo(NamedTuple):
+    """Information needed to take back a move made with make_move.
+
+    Attributes:
+        board_undo: Undo token for the disc placement, None if no disc
+            was placed.
+        last_move: Last Move played before the move was made.
+        second_last_move: Second to last Move played before the move
+            was made.
+        valid_moves: Memoized valid moves before the move was made.
+    """
+
+    board_undo: Optional[Undo]
+    last_move: Optional[Move]
+    second_last_move: Optional[Move]
+    valid_moves: Optional[Dict[Point, List[Point]]] = None
+
+
 class GameState:
     """An Othello game state.
 
+    The valid moves of the current player and the discs each one flips
+    are generated on first use and memoized, so that displaying the legal
+    moves, letting an agent choose one and applying it only generate
+    them once. The board must therefore only be changed through the
+    methods of the state.
+
     Attributes:
         board: Board instance reflecting current state.
         current_player: Player whose turn it is.
@@ -45,6 +69,7 @@ class GameState:
         self.current_player = current_player
         self.last_move = move
         self.second_last_move = prev_move
+        self._valid_moves: Optional[Dict[Point, List[Point]]] = None
 
     def apply_move(self, move: Move) -> GameState:
         """Apply Move to GameState.
@@ -59,9 +84,10 @@ class GameState:
             InvalidMoveError: If the move is illegal given the game state.
         """
         if move.is_play and move.point is not None:
-            next_board = copy.deepcopy(self.board)
+            flips = self._known_flips(move.point)
+            next_board = self.board.copy()
             try:
-                next_board.place_disc(self.current_player, move.point)
+                next_board.place_disc(self.current_player, move.point, flips)
             except InvalidDiscPlacementError:
                 raise InvalidMoveError(f"Cannot place the disc at {move.point}")
         else:
@@ -70,13 +96,115 @@ class GameState:
             next_board = self.board
         return GameState(next_board, self.current_player.other, move, self.last_move)
 
+    def make_move(self, move: Move) -> StateUndo:
+        """Apply Move to GameState in place.
+
+        Unlike apply_move, no new GameState or Board is created, which
+        makes this suitable for search. The board is updated in place,
+        so it must not be shared with other states: apply_move reuses
+        the board on passes and resignations, so call copy first when
+        searching from a state that is still in use elsewhere.
+
+        Args:
+            move: Move to be applied.
+
+        Returns:
+            Token to pass to unmake_move to restore the state.
+
+        Raises:
+            InvalidMoveError: If the move is illegal given the game state.
+        """
+        board_undo = None
+        if move.is_play and move.point is not None:
+            flips = self._known_flips(move.point)
+            try:
+                board_undo = self.board.make_move(
+                    self.current_player, move.point, flips
+                )
+            except InvalidDiscPlacementError:
+                raise InvalidMoveError(f"Cannot place the disc at {move.point}")
+        elif move.is_pass and self.legal_moves():
+            raise InvalidMoveError("Cannot pass when there are legal moves!")
+        undo = StateUndo(
+            board_undo, self.last_move, self.second_last_move, self._valid_moves
+        )
+        self.current_player = self.current_player.other
+        self.second_last_move = self.last_move
+        self.last_move = move
+        self._valid_moves = None
+        return undo
+
+    def unmake_move(self, undo: StateUndo) -> None:
+        """Take back a move made with make_move.
+
+        Moves must be taken back in the reverse order they were made.
+
+        Args:
+            undo: Token returned by make_move.
+        """
+        if undo.board_undo is not None:
+            self.board.undo_move(undo.board_undo)
+        self.current_player = self.current_player.other
+        self.last_move = undo.last_move
+        self.second_last_move = undo.second_last_move
+        self._valid_moves = undo.valid_moves
+
+    def copy(self) -> GameState:
+        """Returns a copy of the state with its own board.
+
+        Returns:
+            GameState instance that can be modified with make_move
+            without affecting this one.
+        """
+        clone = GameState(
+            self.board.copy(),
+            self.current_player,
+            self.last_move,
+            self.second_last_move,
+        )
+        clone._valid_moves = self._valid_moves
+        return clone
+
+    @property
+    def zobrist_hash(self) -> int:
+        """Zobrist hash of the position including the player to move.
+
+        Returns:
+            64-bit hash.
+        """
+        if self.current_player == Player.WHITE:
+            return self.board.zobrist_hash ^ zobrist.get_keys(self.board.size).side
+        return self.board.zobrist_hash
+
+    def valid_moves(self) -> Dict[Point, List[Point]]:
+        """Returns the legal plays of the current player and their flips.
+
+        The moves are generated on the first call and memoized. The
+        dictionary is shared by every caller and must not be modified.
+
+        Returns:
+            Dictionary mapping legal disc placements to the discs they
+            flip.
+        """
+        if self._valid_moves is None:
+            self._valid_moves = self.board.get_valid_moves(self.current_player)
+        return self._valid_moves
+
     def legal_moves(self) -> List[Point]:
         """Returns list of legal plays for the current player.
 
         Returns:
             List of Point instances that are legal plays.
         """
-        return list(self.board.get_valid_moves(self.current_player).keys())
+        return list(self.valid_moves())
+
+    def _known_flips(self, point: Point) -> Optional[List[Point]]:
+        """Flips of a play if the valid moves are memoized, None otherwise."""
+        if self._valid_moves is None:
+            return None
+        if point not in self._valid_moves:
+            raise InvalidMoveError(f"Cannot place the disc at {point}")
+        return self._valid_moves[point]
 
     def is_over(self) -> bool:
         """Returns whether game is over given the current state.
@@ -115,14 +243,17 @@ class GameState:
             return None
 
     @classmethod
-    def new_game(cls, board_size: int = 8) -> GameState:
+    def new_game(
+        cls, board_size: int = 8, board_type: Type[Board] = Board
+    ) -> GameState:
         """Constructor for initial game state.
 
         Args:
             board_size: Board size.
+            board_type: Board implementation to play on.
 
         Returns:
             Initial game state.
         """
-        board = Board(board_size)
+        board = board_type(board_size)
         return cls(board, Player.BLACK)
@@ -0,0 +1,310 @@
+"""NumPy board module.
+
+Requires the optional numpy dependency, installed with the numpy extra.
+"""
+from __future__ import annotations
+
+import copy
+import functools
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from othello.game import disc
+from othello.game.board import Board, InvalidDiscPlacementError, Undo, validate_size
+from othello.game.disc import Disc
+from othello.game.player import Player
+from othello.game.point import get_points, Point
+
+DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+@functools.lru_cache(maxsize=None)
+def get_neighbours(size: int) -> np.ndarray:
+    """Returns the neighbour of every square in each of the 8 directions.
+
+    Square (row, col) has index ``row * size + col``. Index ``size * size``
+    is an off-board sentinel: steps leaving the board lead to it and it is
+    its own neighbour. Directions are ordered like DIRECTIONS, so direction
+    ``7 - d`` is the opposite of direction ``d``.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Integer array of shape (8, size * size + 1).
+    """
+    sentinel = size * size
+    neighbours = np.full((len(DIRECTIONS), sentinel + 1), sentinel, dtype=np.intp)
+    rows, cols = np.divmod(np.arange(sentinel), size)
+    for index, (row_dir, col_dir) in enumerate(DIRECTIONS):
+        next_rows = rows + row_dir
+        next_cols = cols + col_dir
+        on_grid = (next_rows >= 0) & (next_rows < size)
+        on_grid &= (next_cols >= 0) & (next_cols < size)
+        neighbours[index, :sentinel] = np.where(
+            on_grid, next_rows * size + next_cols, sentinel
+        )
+    return neighbours
+
+
+@functools.lru_cache(maxsize=None)
+def get_rays(size: int) -> np.ndarray:
+    """Returns the squares seen from every square in each of the 8 directions.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Integer array of shape (size * size, 8, size), nearest square
+        first and padded with the off-board sentinel, so every ray ends
+        with at least one sentinel.
+    """
+    neighbours = get_neighbours(size)
+    rays = np.empty((size * size, len(DIRECTIONS), size), dtype=np.intp)
+    squares = np.broadcast_to(np.arange(size * size), (len(DIRECTIONS), size * size))
+    for step in range(size):
+        squares = np.take_along_axis(neighbours, squares, axis=1)
+        rays[:, :, step] = squares.T
+    return rays
+
+
+def run_ends(opp: np.ndarray, size: int) -> np.ndarray:
+    """Find where the run of opponent discs starting at each square ends.
+
+    For every direction and square, walks from the square over opponent
+    discs and stops at the first square without one. All 8 directions are
+    walked at once by pointer jumping, which takes a logarithmic number of
+    array gathers instead of one per step.
+
+    Args:
+        opp: Flat boolean array of opponent discs, sentinel included.
+        size: Board size.
+
+    Returns:
+        Integer array of shape (8, size * size + 1) of end squares. Squares
+        without an opponent disc are their own end.
+    """
+    neighbours = get_neighbours(size)
+    ends = np.where(opp, neighbours, np.arange(neighbours.shape[1]))
+    for _ in range((size - 1).bit_length()):
+        ends = np.take_along_axis(ends, ends, axis=1)
+    return ends
+
+
+def get_flips(own: np.ndarray, opp: np.ndarray, size: int) -> np.ndarray:
+    """Compute every legal placement and the discs it flips.
+
+    An opponent disc is flipped by a placement if the run of opponent
+    discs through it ends at an own disc in one direction and at the empty
+    square of the placement in the opposite direction.
+
+    Args:
+        own: Flat boolean array of the moving player's discs.
+        opp: Flat boolean array of the opponent's discs.
+        size: Board size.
+
+    Returns:
+        Integer array of shape (2, k) pairing the square of each placement
+        with a disc it flips, sorted by placement and then by disc.
+    """
+    ends = run_ends(opp, size)
+    empty = ~(own | opp)
+    empty[-1] = False
+    origins = ends[::-1]
+    flipped = opp & own[ends] & empty[origins]
+    directions, discs = np.nonzero(flipped)
+    moves = origins[directions, discs]
+    order = np.lexsort((discs, moves))
+    return np.stack((moves[order], discs[order]))
+
+
+def _to_mask(discs: np.ndarray) -> int:
+    """Pack a disc array, without its sentinel, into an integer mask."""
+    packed = np.packbits(discs[:-1], bitorder="little")
+    return int.from_bytes(packed.tobytes(), "little")
+
+
+class NumpyBoard(Board):
+    """Othello board backed by one flat boolean NumPy array per player.
+
+    Behaves like Board, but legal moves and flips are computed for all 8
+    directions at once with array operations, which pays off on large
+    boards.
+
+    Attributes:
+        size: Board size.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Default constructor for NumpyBoard.
+
+        Args:
+            size: Board size.
+        """
+        validate_size(size)
+
+        self.size = size
+
+        center = size // 2 - 1
+        self._black = np.zeros(size * size + 1, dtype=bool)
+        self._white = np.zeros(size * size + 1, dtype=bool)
+        for row, col in ((center, center + 1), (center + 1, center)):
+            self._black[row * size + col] = True
+        for row, col in ((center, center), (center + 1, center + 1)):
+            self._white[row * size + col] = True
+        self.zobrist_hash = self._hash_discs()
+
+    def _rows(self) -> List[List[Disc]]:
+        discs = [disc.get_disc(), disc.get_disc(Player.BLACK)]
+        discs.append(disc.get_disc(Player.WHITE))
+        cells = (self._black[:-1] + 2 * self._white[:-1]).reshape(self.size, -1)
+        return [[discs[cell] for cell in row] for row in cells.tolist()]
+
+    def get_arrays(self, player: Player) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the disc arrays from the given player's point of view.
+
+        Square (row, col) has index ``row * size + col``; the last element
+        is an always empty off-board sentinel.
+
+        Args:
+            player: Player whose discs make up the first array.
+
+        Returns:
+            Tuple of player's disc array and opponent's disc array.
+        """
+        if player == Player.BLACK:
+            return self._black, self._white
+        return self._white, self._black
+
+    def get_masks(self, player: Player) -> Tuple[int, int]:
+        """Returns the disc masks from the given player's point of view.
+
+        Square (row, col) is stored in bit ``row * size + col``.
+
+        Args:
+            player: Player whose discs make up the first mask.
+
+        Returns:
+            Tuple of player's disc mask and opponent's disc mask.
+        """
+        own, opp = self.get_arrays(player)
+        return _to_mask(own), _to_mask(opp)
+
+    def count_discs(self, player: Player) -> int:
+        """Count discs on board corresponding to the given player.
+
+        Args:
+            player: Player whose discs are counted.
+
+        Returns:
+            Disc count.
+        """
+        return int(np.count_nonzero(self.get_arrays(player)[0]))
+
+    def get_player(self, point: Point) -> Optional[Player]:
+        """Returns the player whose disc is at the given point.
+
+        Args:
+            point: Point on the board.
+
+        Returns:
+            Player owning the disc, None if the point is empty.
+        """
+        index = point.row * self.size + point.col
+        if self._black[index]:
+            return Player.BLACK
+        if self._white[index]:
+            return Player.WHITE
+        return None
+
+    def copy(self) -> NumpyBoard:
+        """Returns an independent copy of the board.
+
+        Returns:
+            NumpyBoard instance with the same discs.
+        """
+        clone = copy.copy(self)
+        clone._black = self._black.copy()
+        clone._white = self._white.copy()
+        return clone
+
+    def place_disc(
+        self, player: Player, point: Point, flips: Optional[List[Point]] = None
+    ) -> List[Point]:
+        """Place disc corresponding to player at the given point.
+
+        Args:
+            player: The disc placed corresponds to this player.
+            point: The disc will be placed at this point.
+            flips: Discs flipped by the placement if already known from
+                get_valid_moves.
+
+        Returns:
+            Points of the discs that were flipped.
+
+        Raises:
+            InvalidDiscPlacementError: If disc cannot legally be placed
+                at the given point.
+        """
+        own, opp = self.get_arrays(player)
+        discs = np.empty(0, dtype=np.intp)
+        index = point.row * self.size + point.col
+        if flips is not None:
+            discs = np.array([row * self.size + col for row, col in flips], np.intp)
+        elif self._is_on_grid(point) and not (own[index] or opp[index]):
+            rays = get_rays(self.size)[index]
+            runs = np.logical_and.accumulate(opp[rays], axis=1)
+            lengths = runs.sum(axis=1)
+            captures = own[rays[np.arange(len(rays)), lengths]]
+            discs = np.sort(rays[runs & captures[:, np.newaxis]])
+        if not len(discs):
+            raise InvalidDiscPlacementError(f"{point} is not a valid move!")
+
+        own[index] = True
+        own[discs] = True
+        opp[discs] = False
+        if flips is None:
+            flips = self._to_points(discs.tolist())
+        self._update_hash(player, point, flips)
+        return flips
+
+    def undo_move(self, undo: Undo) -> None:
+        """Take back a placement made with make_move.
+
+        Args:
+            undo: Token returned by make_move.
+        """
+        own, opp = self.get_arrays(undo.player)
+        discs = [row * self.size + col for row, col in undo.flips]
+        own[undo.point.row * self.size + undo.point.col] = False
+        own[discs] = False
+        opp[discs] = True
+        self._update_hash(undo.player, undo.point, undo.flips)
+
+    def get_valid_moves(self, player: Player) -> Dict[Point, List[Point]]:
+        """Get valid moves and their captures.
+
+        Args:
+            player: Player whose moves are considered.
+
+        Returns:
+            Dictionary mapping valid disc placements to discs captured by the
+            move.
+        """
+        moves, discs = get_flips(*self.get_arrays(player), self.size)
+        if not len(moves):
+            return {}
+        starts = np.flatnonzero(np.diff(moves)) + 1
+        groups = np.split(discs, starts)
+        return {
+            self._to_point(move): self._to_points(group.tolist())
+            for move, group in zip(moves[np.r_[0, starts]].tolist(), groups)
+        }
+
+    def _to_point(self, index: int) -> Point:
+        return get_points(self.size)[index]
+
+    def _to_points(self, indices: List[int]) -> List[Point]:
+        points = get_points(self.size)
+        return [points[index] for index in indices]
@@ -0,0 +1,61 @@
+"""Perft module.
+
+Perft counts the leaf nodes of the game tree below a position, which
+checks move generation against known counts and measures its speed.
+A pass is a move like any other when no disc can be placed, and a game
+that is over is a leaf whatever depth remains.
+"""
+from typing import List, Tuple
+
+from othello.game.game_state import GameState
+from othello.game.move import Move
+
+
+def perft(game_state: GameState, depth: int) -> int:
+    """Count leaf nodes of the game tree to the given depth.
+
+    Args:
+        game_state: Root game state, left unchanged.
+        depth: Number of plies to expand.
+
+    Returns:
+        Leaf node count.
+    """
+    return _perft(game_state.copy(), depth)
+
+
+def divide(game_state: GameState, depth: int) -> List[Tuple[Move, int]]:
+    """Count leaf nodes below each root move.
+
+    Args:
+        game_state: Root game state, left unchanged.
+        depth: Number of plies to expand, including the root move.
+
+    Returns:
+        List of root moves and their leaf node counts.
+    """
+    state = game_state.copy()
+    counts = []
+    for move in _get_moves(state):
+        undo = state.make_move(move)
+        counts.append((move, _perft(state, depth - 1)))
+        state.unmake_move(undo)
+    return counts
+
+
+def _perft(state: GameState, depth: int) -> int:
+    if depth <= 0 or state.is_over():
+        return 1
+    moves = _get_moves(state)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        undo = state.make_move(move)
+        nodes += _perft(state, depth - 1)
+        state.unmake_move(undo)
+    return nodes
+
+
+def _get_moves(state: GameState) -> List[Move]:
+    return [Move.play(point) for point in state.legal_moves()] or [Move.pass_turn()]
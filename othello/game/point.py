@@ -1,5 +1,6 @@
 """Point module."""
-from typing import NamedTuple
+import functools
+from typing import NamedTuple, Tuple
 
 
 class Point(NamedTuple):
@@ -7,3 +8,20 @@ class Point(NamedTuple):
 
     row: int
     col: int
+
+
+@functools.lru_cache(maxsize=None)
+def get_points(size: int) -> Tuple[Point, ...]:
+    """Returns every point of a board, built once per board size.
+
+    Point (row, col) is at index ``row * size + col``, so code working
+    with square indices can share these instances instead of allocating
+    new points.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of all points in row-major order.
+    """
+    return tuple(Point(row, col) for row in range(size) for col in range(size))
@@ -0,0 +1,240 @@
+"""Board symmetry module.
+
+The square board has 8 symmetries: the identity, three rotations, two
+mirrors and two diagonal reflections. Positions that are images of each
+other under a symmetry play the same, so caches, opening books and
+datasets can store them once under a canonical form: the image with the
+smallest disc masks.
+
+Symmetries are numbered in the order of get_permutations. Disc masks are
+transformed with lookup tables, one per symmetry and byte of the mask,
+so canonicalizing a position costs a few table lookups per byte rather
+than a walk over every square.
+"""
+import functools
+from typing import List, Tuple
+
+from othello.game import zobrist
+from othello.game.game_state import GameState
+from othello.game.player import Player
+from othello.game.point import get_points, Point
+
+IDENTITY = 0
+# Symmetry undoing each symmetry: rotations by a quarter turn undo each
+# other, the rest undo themselves.
+INVERSES = (0, 3, 2, 1, 4, 5, 6, 7)
+
+ChunkTables = Tuple[Tuple[int, ...], ...]
+
+
+@functools.lru_cache(maxsize=None)
+def get_permutations(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """Returns where each of the 8 board symmetries moves every square.
+
+    Square (row, col) has index ``row * size + col``.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of 8 permutations mapping square indices to square indices.
+    """
+    last = size - 1
+    transforms = [
+        lambda row, col: (row, col),
+        lambda row, col: (col, last - row),
+        lambda row, col: (last - row, last - col),
+        lambda row, col: (last - col, row),
+        lambda row, col: (row, last - col),
+        lambda row, col: (last - row, col),
+        lambda row, col: (col, row),
+        lambda row, col: (last - col, last - row),
+    ]
+    permutations = []
+    for transform in transforms:
+        squares = (transform(*point) for point in get_points(size))
+        permutations.append(tuple(row * size + col for row, col in squares))
+    return tuple(permutations)
+
+
+def _chunk_tables(size: int, values: List[int]) -> ChunkTables:
+    """Tabulate the XOR of values[square] over the set bits of every byte."""
+    tables = []
+    for start in range(0, size * size, 8):
+        chunk = values[start : start + 8]
+        table = [0] * 256
+        for byte in range(1, 256):
+            low = byte & -byte
+            table[byte] = table[byte ^ low] ^ chunk[low.bit_length() - 1]
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+@functools.lru_cache(maxsize=None)
+def get_mask_tables(size: int) -> Tuple[ChunkTables, ...]:
+    """Returns the lookup tables transforming disc masks by each symmetry.
+
+    Entry ``[symmetry][chunk][byte]`` is the image of the discs given by
+    byte at bits ``8 * chunk`` to ``8 * chunk + 7`` of a mask.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of tables per symmetry.
+    """
+    padding = [0] * 7
+    return tuple(
+        _chunk_tables(size, [1 << square for square in permutation] + padding)
+        for permutation in get_permutations(size)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_hash_tables(size: int) -> Tuple[ChunkTables, ChunkTables]:
+    """Returns the lookup tables giving the Zobrist hash of disc masks.
+
+    Entry ``[chunk][byte]`` is the XOR of the keys of the discs given by
+    byte, for black and white discs respectively.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        Tuple of black and white tables.
+    """
+    keys = zobrist.get_keys(size)
+    padding = [0] * 7
+    black = _chunk_tables(size, keys.black + padding)
+    white = _chunk_tables(size, keys.white + padding)
+    return black, white
+
+
+def _lookup(mask: int, tables: ChunkTables) -> int:
+    image = 0
+    for table in tables:
+        if not mask:
+            break
+        image |= table[mask & 255]
+        mask >>= 8
+    return image
+
+
+def transform_mask(mask: int, symmetry: int, size: int) -> int:
+    """Returns the image of a disc mask under a symmetry.
+
+    Args:
+        mask: Disc mask, square (row, col) at bit ``row * size + col``.
+        symmetry: Index of the symmetry.
+        size: Board size.
+
+    Returns:
+        Transformed mask.
+    """
+    if symmetry == IDENTITY:
+        return mask
+    return _lookup(mask, get_mask_tables(size)[symmetry])
+
+
+def canonical_masks(black: int, white: int, size: int) -> Tuple[int, int, int]:
+    """Returns the canonical form of a position given by its disc masks.
+
+    Args:
+        black: Mask of black discs.
+        white: Mask of white discs.
+        size: Board size.
+
+    Returns:
+        Tuple of the canonical black and white masks and the first
+        symmetry mapping the position to them.
+    """
+    best = (black, white)
+    best_symmetry = IDENTITY
+    for symmetry, tables in enumerate(get_mask_tables(size)[1:], 1):
+        image_black = _lookup(black, tables)
+        if image_black > best[0]:
+            continue
+        image = (image_black, _lookup(white, tables))
+        if image < best:
+            best = image
+            best_symmetry = symmetry
+    return best[0], best[1], best_symmetry
+
+
+def get_symmetries(black: int, white: int, size: int) -> List[int]:
+    """Returns every symmetry mapping a position to its canonical form.
+
+    Positions such as the initial one are their own image under some
+    symmetries, so more than one symmetry can lead to the canonical form.
+
+    Args:
+        black: Mask of black discs.
+        white: Mask of white discs.
+        size: Board size.
+
+    Returns:
+        List of symmetry indices in increasing order.
+    """
+    images = [
+        (_lookup(black, tables), _lookup(white, tables))
+        for tables in get_mask_tables(size)
+    ]
+    best = min(images)
+    return [symmetry for symmetry, image in enumerate(images) if image == best]
+
+
+def canonical_key(game_state: GameState) -> Tuple[int, int]:
+    """Returns the canonical Zobrist hash of a position and its symmetry.
+
+    Symmetric positions with the same player to move get the same key.
+
+    Args:
+        game_state: Position to hash.
+
+    Returns:
+        Tuple of the Zobrist hash of the canonical form, including the
+        player to move, and the symmetry mapping the position to it.
+    """
+    size = game_state.board.size
+    black, white = game_state.board.get_masks(Player.BLACK)
+    black, white, symmetry = canonical_masks(black, white, size)
+    black_tables, white_tables = get_hash_tables(size)
+    key = 0
+    for black_table, white_table in zip(black_tables, white_tables):
+        key ^= black_table[black & 255] ^ white_table[white & 255]
+        black >>= 8
+        white >>= 8
+    if game_state.current_player == Player.WHITE:
+        key ^= zobrist.get_keys(size).side
+    return key, symmetry
+
+
+def transform_point(point: Point, symmetry: int, size: int) -> Point:
+    """Returns the image of a point under a symmetry.
+
+    Args:
+        point: Point on the board.
+        symmetry: Index of the symmetry.
+        size: Board size.
+
+    Returns:
+        Transformed point.
+    """
+    square = get_permutations(size)[symmetry][point.row * size + point.col]
+    return get_points(size)[square]
+
+
+def inverse_point(point: Point, symmetry: int, size: int) -> Point:
+    """Returns the point that a symmetry maps to the given point.
+
+    Maps points of a canonical position back to the original position.
+
+    Args:
+        point: Point on the transformed board.
+        symmetry: Index of the symmetry.
+        size: Board size.
+
+    Returns:
+        Point on the original board.
+    """
+    return transform_point(point, INVERSES[symmetry], size)
@@ -0,0 +1,61 @@
+"""Zobrist hashing module."""
+import functools
+import random
+from typing import List, NamedTuple
+
+from othello.game.player import Player
+from othello.game.point import Point
+
+
+class ZobristKeys(NamedTuple):
+    """Random keys used to hash positions of one board size.
+
+    Square (row, col) has index ``row * size + col`` in each list.
+
+    Attributes:
+        black: Key for a black disc on each square.
+        white: Key for a white disc on each square.
+        flip: Key for flipping the disc on each square, black XOR white.
+        side: Key toggled when white is to move.
+    """
+
+    black: List[int]
+    white: List[int]
+    flip: List[int]
+    side: int
+
+
+@functools.lru_cache(maxsize=None)
+def get_keys(size: int) -> ZobristKeys:
+    """Returns the Zobrist keys for the given board size.
+
+    Keys are drawn from a generator seeded with the board size, so hashes
+    are stable across runs and processes.
+
+    Args:
+        size: Board size.
+
+    Returns:
+        ZobristKeys instance.
+    """
+    rng = random.Random(size)
+    black = [rng.getrandbits(64) for _ in range(size * size)]
+    white = [rng.getrandbits(64) for _ in range(size * size)]
+    flip = [b ^ w for b, w in zip(black, white)]
+    return ZobristKeys(black, white, flip, rng.getrandbits(64))
+
+
+def disc_key(size: int, player: Player, point: Point) -> int:
+    """Returns the key for a disc of the given player at the given point.
+
+    Args:
+        size: Board size.
+        player: Owner of the disc.
+        point: Point of the disc.
+
+    Returns:
+        64-bit key.
+    """
+    keys = get_keys(size)
+    index = point.row * size + point.col
+    return keys.black[index] if player == Player.BLACK else keys.white[index]
@@ -0,0 +1,295 @@
+"""Agent instrumentation module.
+
+An Instrument records statistics about every move selected by the agents
+it wraps: wall time, the agent's own search statistics, how often the
+game core generated moves and copied boards, and transposition table
+hits. Statistics are written one move per line as JSON objects, for
+example::
+
+    {"game": 0, "ply": 1, "player": "black", "agent": "alphabeta",
+     "move": "d3", "seconds": 0.98, "nodes": 5120, "depth": 5, ...}
+
+Move generations and board copies are counted by replacing the board
+methods for as long as the instrument is open, so nothing is counted,
+and nothing slows down, when no instrument is in use.
+
+One ply of every game can also be run under cProfile, accumulating the
+profiles of all games in one file that can be read with pstats.
+"""
+from __future__ import annotations
+
+from collections import Counter
+import cProfile
+from dataclasses import asdict, dataclass
+import functools
+import json
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from othello.agent.base import Agent
+from othello.agent.human import Human
+from othello.agent.transposition import TranspositionTable
+from othello.game.board import Board
+from othello.game.game_state import GameState
+from othello.game.move import Move
+
+# Board methods counted while an instrument is open, by counter name.
+COUNTED_METHODS = {"move_generations": "get_valid_moves", "board_copies": "copy"}
+
+
+@dataclass
+class MoveStats:
+    """Statistics about one selected move.
+
+    Attributes:
+        game: Game number.
+        ply: Number of the move in the game, starting from 1.
+        player: Color of the mover.
+        agent: Name of the mover.
+        move: Selected move in the notation of the human agent.
+        seconds: Wall time spent selecting the move.
+        nodes: Positions visited by the agent's search, None if the agent
+            does not search.
+        depth: Deepest completed search depth, if applicable.
+        score: Score of the selected move from the mover's point of view.
+        move_generations: Number of legal move generations on boards.
+        board_copies: Number of board copies.
+        cache_hits: Transposition table probes that found the position,
+            None if the agent has no table.
+        cache_misses: Transposition table probes that did not.
+        profiled: Whether the move was selected under the profiler.
+    """
+
+    game: int
+    ply: int
+    player: str
+    agent: str
+    move: str
+    seconds: float
+    nodes: Optional[int] = None
+    depth: Optional[int] = None
+    score: Optional[float] = None
+    move_generations: int = 0
+    board_copies: int = 0
+    cache_hits: Optional[int] = None
+    cache_misses: Optional[int] = None
+    profiled: bool = False
+
+    def to_line(self) -> str:
+        """Returns the statistics as one line of JSON.
+
+        Returns:
+            JSON object without a trailing newline.
+        """
+        return json.dumps(asdict(self))
+
+
+def _board_types() -> Iterator[Type[Board]]:
+    """Board and every subclass imported so far."""
+    pending: List[Type[Board]] = [Board]
+    while pending:
+        board_type = pending.pop()
+        yield board_type
+        pending.extend(board_type.__subclasses__())
+
+
+def _table_counts(agent: Agent) -> Optional[Tuple[int, int]]:
+    table = getattr(agent, "table", None)
+    if isinstance(table, TranspositionTable):
+        return table.hits, table.misses
+    return None
+
+
+class Instrument:
+    """Collects statistics about the moves of wrapped agents.
+
+    Use it as a context manager: board methods are only counted, and
+    statistics only written, while it is open.
+
+    Attributes:
+        path: Path of the statistics file.
+        profile_ply: Ply of every game to run under cProfile, None to
+            profile nothing.
+        profile_path: Path of the profile file.
+        counts: Number of calls of every counted board method so far.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        profile_ply: Optional[int] = None,
+        profile_path: Optional[str] = None,
+    ) -> None:
+        """Default constructor for Instrument.
+
+        Args:
+            path: Path of the statistics file.
+            profile_ply: Ply of every game to run under cProfile.
+            profile_path: Path of the profile file, the statistics path
+                followed by .prof by default.
+        """
+        self.path = path
+        self.profile_ply = profile_ply
+        self.profile_path = profile_path or f"{path}.prof"
+        self.counts: Counter[str] = Counter()
+        self._plies: Dict[int, int] = {}
+        self._profiler: Optional[cProfile.Profile] = None
+        self._originals: List[Tuple[Type[Board], str, Callable[..., Any]]] = []
+        self._file: Optional[Any] = None
+
+    def __enter__(self) -> Instrument:
+        """Open the statistics file and start counting board methods.
+
+        Returns:
+            The instrument itself.
+        """
+        self._file = open(self.path, "w", encoding="utf-8")
+        for board_type in _board_types():
+            for counter, name in COUNTED_METHODS.items():
+                if name in vars(board_type):
+                    method = vars(board_type)[name]
+                    self._originals.append((board_type, name, method))
+                    setattr(board_type, name, self._counted(counter, method))
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Restore the board methods and write the files."""
+        for board_type, name, method in reversed(self._originals):
+            setattr(board_type, name, method)
+        self._originals.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._profiler is not None:
+            self._profiler.dump_stats(self.profile_path)
+
+    def _counted(self, counter: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        counts = self.counts
+
+        @functools.wraps(method)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            counts[counter] += 1
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    def wrap(self, agent: Agent, name: str, game: int) -> InstrumentedAgent:
+        """Wrap an agent so that its moves are recorded.
+
+        Args:
+            agent: Agent to wrap.
+            name: Name of the agent in the statistics.
+            game: Number of the game the agent plays.
+
+        Returns:
+            InstrumentedAgent instance.
+        """
+        return InstrumentedAgent(agent, self, name, game)
+
+    def select_move(
+        self, agent: Agent, name: str, game: int, game_state: GameState
+    ) -> Move:
+        """Let an agent select a move and record statistics about it.
+
+        Args:
+            agent: Agent to ask.
+            name: Name of the agent in the statistics.
+            game: Game number.
+            game_state: Current game state.
+
+        Returns:
+            Move selected by the agent.
+        """
+        ply = self._plies.get(game, 0) + 1
+        self._plies[game] = ply
+        profiled = ply == self.profile_ply
+        counts = self.counts.copy()
+        table_counts = _table_counts(agent)
+        if profiled:
+            if self._profiler is None:
+                self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        start = time.perf_counter()
+        try:
+            move = agent.select_move(game_state)
+        finally:
+            seconds = time.perf_counter() - start
+            if profiled and self._profiler is not None:
+                self._profiler.disable()
+        calls = self.counts - counts
+        stats = MoveStats(
+            game,
+            ply,
+            game_state.current_player.name.lower(),
+            name,
+            Human.move_to_notation(move),
+            seconds,
+            move_generations=calls["move_generations"],
+            board_copies=calls["board_copies"],
+            profiled=profiled,
+        )
+        search = agent.last_search
+        if search is not None:
+            stats.nodes = search.nodes
+            stats.depth = search.depth
+            stats.score = search.score
+        new_table_counts = _table_counts(agent)
+        if table_counts is not None and new_table_counts is not None:
+            stats.cache_hits = new_table_counts[0] - table_counts[0]
+            stats.cache_misses = new_table_counts[1] - table_counts[1]
+        self.write(stats)
+        return move
+
+    def write(self, stats: MoveStats) -> None:
+        """Write the statistics of one move.
+
+        Args:
+            stats: Statistics to write.
+
+        Raises:
+            ValueError: If the instrument is not open.
+        """
+        if self._file is None:
+            raise ValueError("Instrument is not open")
+        self._file.write(stats.to_line() + "\n")
+
+
+class InstrumentedAgent(Agent):
+    """Agent whose moves are recorded by an instrument.
+
+    Attributes:
+        agent: Wrapped agent.
+        instrument: Instrument recording the moves.
+        name: Name of the agent in the statistics.
+        game: Number of the game the agent plays.
+    """
+
+    def __init__(
+        self, agent: Agent, instrument: Instrument, name: str, game: int
+    ) -> None:
+        """Default constructor for InstrumentedAgent.
+
+        Args:
+            agent: Agent to wrap.
+            instrument: Instrument recording the moves.
+            name: Name of the agent in the statistics.
+            game: Number of the game the agent plays.
+        """
+        super().__init__(agent.time_limit)
+        self.agent = agent
+        self.instrument = instrument
+        self.name = name
+        self.game = game
+
+    def select_move(self, game_state: GameState) -> Move:
+        """Select a move with the wrapped agent and record it.
+
+        Args:
+            game_state: Current game state.
+
+        Returns:
+            Move selected by the wrapped agent.
+        """
+        move = self.instrument.select_move(self.agent, self.name, self.game, game_state)
+        self.last_search = self.agent.last_search
+        return move
@@ -0,0 +1,182 @@
+"""Load generator module.
+
+Opens many concurrent sessions against a game server, each playing games
+of random legal moves against a bot, and measures the throughput of the
+server. The games are mirrored locally to know which moves are legal.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import random
+import time
+from typing import List, Optional, Tuple
+
+from othello.agent.human import Human
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.server import DEFAULT_PORT
+
+
+class ServerError(Exception):
+    """Raised when the server replies with an error or unexpectedly."""
+
+    pass
+
+
+@dataclass
+class LoadResult:
+    """Throughput of a load test.
+
+    Attributes:
+        sessions: Sessions that played all their games.
+        games: Games finished.
+        moves: Moves played by the clients and the bots.
+        seconds: Wall time of the load test.
+    """
+
+    sessions: int = 0
+    games: int = 0
+    moves: int = 0
+    seconds: float = field(default=0.0, compare=False)
+
+    @property
+    def sessions_per_second(self) -> float:
+        """Returns the session throughput.
+
+        Returns:
+            Sessions completed per second.
+        """
+        return self.sessions / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def moves_per_second(self) -> float:
+        """Returns the move throughput.
+
+        Returns:
+            Moves played per second.
+        """
+        return self.moves / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        """Summary of the load test.
+
+        Returns:
+            String representation.
+        """
+        return (
+            f"{self.sessions} sessions, {self.games} games, {self.moves} moves "
+            f"in {self.seconds:.2f}s\n"
+            f"{self.sessions_per_second:.1f} sessions/s, "
+            f"{self.moves_per_second:.0f} moves/s"
+        )
+
+
+async def _expect(reader: asyncio.StreamReader, keyword: str) -> List[str]:
+    """Read a reply and check its keyword."""
+    line = (await reader.readline()).decode()
+    words = line.split()
+    if not words or words[0] != keyword:
+        raise ServerError(f"expected {keyword}, got {line.strip()!r}")
+    return words[1:]
+
+
+async def play_session(
+    host: str,
+    port: int,
+    agent: str,
+    games: int,
+    board_size: int = 8,
+    rng: Optional[random.Random] = None,
+) -> Tuple[int, int]:
+    """Play games of random moves in one session, alternating colors.
+
+    Args:
+        host: Address of the server.
+        port: Port of the server.
+        agent: Name of the bot to play against.
+        games: Number of games to play.
+        board_size: Board size.
+        rng: Random number generator choosing the moves.
+
+    Returns:
+        Number of games finished and moves played.
+    """
+    rng = rng or random.Random()
+    reader, writer = await asyncio.open_connection(host, port)
+    moves = 0
+    try:
+        await _expect(reader, "ready")
+        for game in range(games):
+            color = Player.BLACK if game % 2 == 0 else Player.WHITE
+            writer.write(f"new {agent} {color.name.lower()} {board_size}\n".encode())
+            await _expect(reader, "start")
+            moves += await _play_game(reader, writer, color, board_size, rng)
+        writer.write(b"quit\n")
+        await writer.drain()
+    finally:
+        writer.close()
+    return games, moves
+
+
+async def _play_game(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    color: Player,
+    board_size: int,
+    rng: random.Random,
+) -> int:
+    """Play one game of random moves and return the number of moves."""
+    game_state = GameState.new_game(board_size)
+    moves = 0
+    while not game_state.is_over():
+        if game_state.current_player == color:
+            points = game_state.legal_moves()
+            move = Move.play(rng.choice(points)) if points else Move.pass_turn()
+            writer.write(f"{Human.move_to_notation(move)}\n".encode())
+            await writer.drain()
+        else:
+            (notation,) = await _expect(reader, "move")
+            move = Human.notation_to_move(notation)
+        game_state = game_state.apply_move(move)
+        moves += 1
+    await _expect(reader, "over")
+    return moves
+
+
+async def run_load(
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    sessions: int = 100,
+    games: int = 1,
+    agent: str = "random",
+    board_size: int = 8,
+    seed: Optional[int] = None,
+) -> LoadResult:
+    """Play concurrent sessions against a server and measure throughput.
+
+    Args:
+        host: Address of the server.
+        port: Port of the server.
+        sessions: Number of concurrent sessions.
+        games: Games played by every session.
+        agent: Name of the bot to play against.
+        board_size: Board size.
+        seed: Base seed of the random moves.
+
+    Returns:
+        LoadResult instance.
+    """
+    rngs = [random.Random(None if seed is None else seed + n) for n in range(sessions)]
+    start = time.perf_counter()
+    counts = await asyncio.gather(
+        *(play_session(host, port, agent, games, board_size, rng) for rng in rngs)
+    )
+    result = LoadResult(
+        sessions,
+        sum(finished for finished, _ in counts),
+        sum(moves for _, moves in counts),
+    )
+    result.seconds = time.perf_counter() - start
+    return result
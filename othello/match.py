@@ -0,0 +1,191 @@
+"""Headless match module."""
+from dataclasses import dataclass, field
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type
+
+from othello.agent.base import Agent, create_agent
+from othello.game.board import Board
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.instrument import Instrument
+from othello.record import GameRecord
+
+
+def play_game(
+    black: Agent,
+    white: Agent,
+    board_size: int = 8,
+    board_type: Type[Board] = Board,
+    moves: Optional[List[Move]] = None,
+) -> GameState:
+    """Play one game between two agents without any output.
+
+    Args:
+        black: Agent playing black.
+        white: Agent playing white.
+        board_size: Board size.
+        board_type: Board implementation to play on.
+        moves: List to append the moves played to, if given.
+
+    Returns:
+        Final game state.
+    """
+    players: Dict[Player, Agent] = {Player.BLACK: black, Player.WHITE: white}
+    game_state = GameState.new_game(board_size, board_type)
+    while not game_state.is_over():
+        move = players[game_state.current_player].select_move(game_state)
+        game_state = game_state.apply_move(move)
+        if moves is not None:
+            moves.append(move)
+    return game_state
+
+
+@dataclass
+class MatchResult:
+    """Results of a match from the first agent's point of view.
+
+    Attributes:
+        first: Name of the first agent.
+        second: Name of the second agent.
+        wins: Games won by the first agent.
+        losses: Games lost by the first agent.
+        draws: Drawn games.
+        disc_differential: Sum over games of the first agent's discs minus
+            the second agent's discs.
+        seconds: Wall time spent playing.
+    """
+
+    first: str
+    second: str
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    disc_differential: int = 0
+    seconds: float = field(default=0.0, compare=False)
+
+    @property
+    def games(self) -> int:
+        """Returns the number of games played.
+
+        Returns:
+            Game count.
+        """
+        return self.wins + self.losses + self.draws
+
+    @property
+    def average_differential(self) -> float:
+        """Returns the average disc differential per game.
+
+        Returns:
+            Average of the first agent's discs minus the second's.
+        """
+        return self.disc_differential / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Returns the match throughput.
+
+        Returns:
+            Games played per second.
+        """
+        return self.games / self.seconds if self.seconds > 0 else 0.0
+
+    def add_game(self, game_state: GameState, first_player: Player) -> None:
+        """Record the result of a finished game.
+
+        Args:
+            game_state: Final game state.
+            first_player: Color played by the first agent.
+        """
+        winner = game_state.winner()
+        if winner is None:
+            self.draws += 1
+        elif winner == first_player:
+            self.wins += 1
+        else:
+            self.losses += 1
+        board = game_state.board
+        self.disc_differential += board.count_discs(
+            first_player
+        ) - board.count_discs(first_player.other)
+
+    def __str__(self) -> str:
+        """Summary of the match.
+
+        Returns:
+            String representation.
+        """
+        return (
+            f"{self.first} vs {self.second}: "
+            f"{self.wins} wins, {self.losses} losses, {self.draws} draws\n"
+            f"Average disc differential: {self.average_differential:+.2f}\n"
+            f"{self.games} games in {self.seconds:.2f}s "
+            f"({self.games_per_second:.2f} games/s)"
+        )
+
+
+def run_match(
+    first: Type[Agent],
+    second: Type[Agent],
+    games: int,
+    board_size: int = 8,
+    time_limit: Optional[float] = None,
+    on_game: Optional[Callable[[GameRecord], None]] = None,
+    instrument: Optional[Instrument] = None,
+    names: Optional[Tuple[str, str]] = None,
+    options: Optional[Mapping[str, Any]] = None,
+) -> MatchResult:
+    """Play a series of headless games between two agent types.
+
+    The first agent plays black in even-numbered games and white in
+    odd-numbered ones. Fresh agent instances are created for every game,
+    and closed once it ends.
+
+    Args:
+        first: First agent type.
+        second: Second agent type.
+        games: Number of games to play.
+        board_size: Board size.
+        time_limit: Seconds per move for searching agents.
+        on_game: Called with the record of every game as soon as it ends.
+        instrument: Open instrument recording every move, None to record
+            nothing.
+        names: Names of the first and second agent in the result and the
+            records, None to use the class names.
+        options: Options offered to the agent constructors, see
+            create_agent.
+
+    Returns:
+        MatchResult instance.
+    """
+    first_name, second_name = names or (first.__name__, second.__name__)
+    result = MatchResult(first_name, second_name)
+    start = time.perf_counter()
+    for game in range(games):
+        created = [
+            create_agent(first, time_limit, options),
+            create_agent(second, time_limit, options),
+        ]
+        agents = created.copy()
+        players = [first_name, second_name]
+        first_player = Player.BLACK
+        if game % 2 == 1:
+            agents.reverse()
+            players.reverse()
+            first_player = Player.WHITE
+        if instrument is not None:
+            agents = [
+                instrument.wrap(agent, name, game)
+                for agent, name in zip(agents, players)
+            ]
+        moves: List[Move] = []
+        game_state = play_game(agents[0], agents[1], board_size, moves=moves)
+        for agent in created:
+            agent.close()
+        result.add_game(game_state, first_player)
+        if on_game is not None:
+            record = GameRecord.from_game(game_state, moves, players[0], players[1])
+            on_game(record)
+    result.seconds = time.perf_counter() - start
+    return result
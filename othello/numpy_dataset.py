@@ -0,0 +1,80 @@
+"""Memory-mapped position dataset module.
+
+Maps dataset files written by othello.dataset as NumPy structured arrays
+and draws shuffled mini-batches from them for training. Only the
+positions of each batch are read from disk. Requires the optional numpy
+dependency, installed with the numpy extra.
+"""
+from typing import Iterator, Optional
+
+import numpy as np
+
+from othello.dataset import HEADER, read_header
+
+# Same layout as dataset.RECORD.
+DTYPE = np.dtype([("own", "<u8"), ("opp", "<u8"), ("player", "u1"), ("score", "i1")])
+
+
+def load_dataset(path: str) -> np.ndarray:
+    """Map the positions of a dataset file without reading them.
+
+    Args:
+        path: Path of a dataset file written by write_dataset.
+
+    Returns:
+        Read-only structured array with fields own, opp, player and score,
+        one entry per position.
+    """
+    _, count = read_header(path)
+    if not count:
+        return np.zeros(0, DTYPE)
+    return np.memmap(path, DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def iter_batches(
+    data: np.ndarray,
+    batch_size: int,
+    seed: Optional[int] = None,
+    drop_last: bool = False,
+) -> Iterator[np.ndarray]:
+    """Yield the positions of a dataset in shuffled mini-batches.
+
+    Every position appears in exactly one batch. Each batch is gathered
+    from the array in file order, which keeps reads from a memory-mapped
+    file local, and then shuffled in memory.
+
+    Args:
+        data: Dataset array, usually from load_dataset.
+        batch_size: Number of positions per batch.
+        seed: Seed for the random number generator.
+        drop_last: Whether to leave out the last batch when it is smaller
+            than batch_size.
+
+    Yields:
+        Structured arrays holding copies of the positions of each batch.
+    """
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(data))
+    for start in range(0, len(data), batch_size):
+        indices = order[start : start + batch_size]
+        if drop_last and len(indices) < batch_size:
+            break
+        batch = data[np.sort(indices)]
+        rng.shuffle(batch)
+        yield batch
+
+
+def unpack_masks(masks: np.ndarray, size: int = 8) -> np.ndarray:
+    """Expand disc masks into one 0 or 1 feature per square.
+
+    Args:
+        masks: Array of disc masks.
+        size: Board size.
+
+    Returns:
+        Array of shape (len(masks), size * size) of uint8, square
+        (row, col) at column ``row * size + col``.
+    """
+    as_bytes = np.ascontiguousarray(masks, dtype="<u8").view(np.uint8)
+    bits = np.unpackbits(as_bytes.reshape(-1, 8), axis=1, bitorder="little")
+    return bits[:, : size * size]
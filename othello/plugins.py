@@ -0,0 +1,190 @@
+"""Agent plugin module.
+
+Agent types are registered as entry points in the agents group, see
+pyproject.toml. Finding entry points with importlib.metadata scans every
+installed distribution, and importing importlib.metadata alone takes
+longer than starting the rest of the command-line interface, so the
+agent entry points and the package version are cached in an index file.
+The index is rebuilt whenever the distribution metadata found on sys.path
+changes, as installing, upgrading or removing a distribution does.
+
+Agent modules are only imported once their agent is used.
+"""
+import functools
+import importlib
+import json
+import os
+import sys
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Type
+
+from othello.agent.base import Agent
+
+GROUP = "agents"
+# Where to keep the index, instead of the user's cache directory.
+CACHE_DIR_VARIABLE = "OTHELLO_CACHE_DIR"
+INDEX_FILE = "plugins.json"
+INDEX_FORMAT = 1
+# Suffixes of the metadata directories and files of installed distributions.
+METADATA_SUFFIXES = (".dist-info", ".egg-info", ".egg-link")
+
+
+class Index(NamedTuple):
+    """Cached plugin information.
+
+    Attributes:
+        version: Installed version of the package, "unknown" if it is not
+            installed.
+        agents: Dictionary mapping agent names to the ``module:attribute``
+            path of their type.
+    """
+
+    version: str
+    agents: Dict[str, str]
+
+
+def get_cache_dir() -> str:
+    """Returns the directory holding the index file.
+
+    Returns:
+        Path given by OTHELLO_CACHE_DIR, or the othello-cli directory of
+        the user's cache directory.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_VARIABLE)
+    if cache_dir:
+        return cache_dir
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return os.path.join(os.path.expanduser(base), "othello-cli")
+
+
+def _path_stamps() -> List[List[Any]]:
+    """Names and modification times of the distributions on sys.path."""
+    stamps = []
+    for entry in sys.path:
+        try:
+            with os.scandir(entry or ".") as directory:
+                found = sorted(
+                    [item.name, item.stat().st_mtime_ns]
+                    for item in directory
+                    if item.name.endswith(METADATA_SUFFIXES)
+                )
+        except OSError:
+            continue
+        stamps.append([entry, found])
+    return stamps
+
+
+def find_plugins() -> Index:
+    """Look the package version and agent entry points up.
+
+    Returns:
+        Index instance.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:  # pragma: no cover
+        import importlib_metadata as metadata  # type: ignore
+
+    try:
+        version = metadata.version("othello")
+    except metadata.PackageNotFoundError:  # pragma: no cover
+        version = "unknown"
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        group = entry_points.select(group=GROUP)
+    else:  # pragma: no cover
+        group = entry_points.get(GROUP, [])  # type: ignore
+    agents = {entry_point.name: entry_point.value for entry_point in group}
+    return Index(version, agents)
+
+
+@functools.lru_cache(maxsize=None)
+def get_index() -> Index:
+    """Returns the plugin index, rebuilding the cached one if stale.
+
+    The cache is only an optimization: if it cannot be read or written,
+    the plugins are looked up every time.
+
+    Returns:
+        Index instance.
+    """
+    path = os.path.join(get_cache_dir(), INDEX_FILE)
+    stamps = _path_stamps()
+    try:
+        with open(path, encoding="utf-8") as index_file:
+            cached = json.load(index_file)
+        if cached["format"] == INDEX_FORMAT and cached["path"] == stamps:
+            return Index(cached["version"], cached["agents"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    index = find_plugins()
+    contents = {"format": INDEX_FORMAT, "path": stamps, **index._asdict()}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as index_file:
+            json.dump(contents, index_file)
+    except OSError:
+        pass
+    return index
+
+
+def load_agent(target: str) -> Type[Agent]:
+    """Import an agent type.
+
+    Args:
+        target: ``module:attribute`` path of the agent type.
+
+    Returns:
+        Agent type.
+    """
+    module_name, _, attribute = target.partition(":")
+    agent_type = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        agent_type = getattr(agent_type, name)
+    return agent_type  # type: ignore[return-value]
+
+
+class Agents(Mapping[str, Type[Agent]]):
+    """Read-only mapping of agent names to agent types.
+
+    The names come from the index, and each agent type is imported on
+    first access.
+    """
+
+    def __init__(self, targets: Mapping[str, str]) -> None:
+        """Default constructor for Agents.
+
+        Args:
+            targets: Dictionary mapping agent names to the
+                ``module:attribute`` path of their type.
+        """
+        self._targets = dict(targets)
+        self._loaded: Dict[str, Type[Agent]] = {}
+
+    def __getitem__(self, name: str) -> Type[Agent]:
+        """Returns the agent type registered under a name, importing it.
+
+        Args:
+            name: Agent name.
+
+        Returns:
+            Agent type.
+        """
+        if name not in self._loaded:
+            self._loaded[name] = load_agent(self._targets[name])
+        return self._loaded[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the agent names.
+
+        Returns:
+            Iterator of names.
+        """
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        """Number of agents.
+
+        Returns:
+            Agent count.
+        """
+        return len(self._targets)
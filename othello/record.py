@@ -0,0 +1,224 @@
+"""Game record module.
+
+Games are stored one per line as JSON objects, with the moves written in
+the notation of the human agent, separated by spaces, for example::
+
+    {"size": 8, "black": "random", "white": "alphabeta", "black_discs": 20,
+     "white_discs": 44, "moves": "d3 c5 f6 ... pass b8", "metadata": {}}
+
+Records are written as soon as each game finishes and read back one line
+at a time, so files of any length can be replayed without loading them
+into memory. Paths ending in ``.gz`` are compressed with gzip.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import gzip
+import json
+from typing import Any, Dict, IO, Iterator, List, Optional, Type
+
+from othello.agent.human import Human, InvalidInputError
+from othello.game.board import Board
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+
+
+class RecordFormatError(Exception):
+    """Raised when reading a line that is not a game record."""
+
+    pass
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8")
+
+
+def _to_move(notation: str) -> Move:
+    Human.validate_input(notation)
+    return Human.notation_to_move(notation)
+
+
+@dataclass
+class GameRecord:
+    """A finished game.
+
+    Attributes:
+        board_size: Board size.
+        black: Name of the agent that played black.
+        white: Name of the agent that played white.
+        moves: Moves played from the initial position.
+        black_discs: Black discs at the end of the game.
+        white_discs: White discs at the end of the game.
+        metadata: Any other JSON serializable information about the game.
+    """
+
+    board_size: int
+    black: str
+    white: str
+    moves: List[Move]
+    black_discs: int
+    white_discs: int
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_game(
+        cls,
+        game_state: GameState,
+        moves: List[Move],
+        black: str,
+        white: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> GameRecord:
+        """Constructor for the record of a game that was played.
+
+        Args:
+            game_state: Final game state.
+            moves: Moves played from the initial position.
+            black: Name of the agent that played black.
+            white: Name of the agent that played white.
+            metadata: Any other information about the game.
+
+        Returns:
+            GameRecord instance.
+        """
+        board = game_state.board
+        return cls(
+            board.size,
+            black,
+            white,
+            list(moves),
+            board.count_discs(Player.BLACK),
+            board.count_discs(Player.WHITE),
+            metadata or {},
+        )
+
+    def states(self, board_type: Type[Board] = Board) -> Iterator[GameState]:
+        """Replay the game one move at a time.
+
+        Args:
+            board_type: Board implementation to replay on.
+
+        Yields:
+            The initial game state, then the game state after every move.
+        """
+        game_state = GameState.new_game(self.board_size, board_type)
+        yield game_state
+        for move in self.moves:
+            game_state = game_state.apply_move(move)
+            yield game_state
+
+    def to_line(self) -> str:
+        """Serialize the record as one line of JSON.
+
+        Returns:
+            JSON text without a trailing newline.
+        """
+        return json.dumps(
+            {
+                "size": self.board_size,
+                "black": self.black,
+                "white": self.white,
+                "black_discs": self.black_discs,
+                "white_discs": self.white_discs,
+                "moves": " ".join(map(Human.move_to_notation, self.moves)),
+                "metadata": self.metadata,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_line(cls, line: str) -> GameRecord:
+        """Constructor for a record serialized with to_line.
+
+        Args:
+            line: JSON text.
+
+        Returns:
+            GameRecord instance.
+
+        Raises:
+            RecordFormatError: If the line is not a valid record.
+        """
+        try:
+            fields = json.loads(line)
+            return cls(
+                int(fields["size"]),
+                str(fields["black"]),
+                str(fields["white"]),
+                [_to_move(notation) for notation in fields["moves"].split()],
+                int(fields["black_discs"]),
+                int(fields["white_discs"]),
+                dict(fields.get("metadata", {})),
+            )
+        except (ValueError, KeyError, TypeError, AttributeError, InvalidInputError):
+            raise RecordFormatError(f"Not a game record: {line.strip()[:80]}")
+
+
+class RecordWriter:
+    """Writes game records to a file as they come in.
+
+    Attributes:
+        path: Path of the record file.
+    """
+
+    def __init__(self, path: str, append: bool = False) -> None:
+        """Default constructor for RecordWriter.
+
+        Args:
+            path: Path of the record file, compressed if it ends in .gz.
+            append: Whether to add to an existing file instead of
+                replacing it.
+        """
+        self.path = path
+        self._file = _open(path, "a" if append else "w")
+
+    def write(self, record: GameRecord) -> None:
+        """Write one record.
+
+        Args:
+            record: Record to write.
+        """
+        self._file.write(record.to_line() + "\n")
+
+    def close(self) -> None:
+        """Close the record file."""
+        self._file.close()
+
+    def __enter__(self) -> RecordWriter:
+        """Use the writer as a context manager that closes it on exit.
+
+        Returns:
+            The writer itself.
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the record file."""
+        self.close()
+
+
+def read_records(path: str) -> Iterator[GameRecord]:
+    """Read the records of a file one at a time.
+
+    Blank lines are skipped.
+
+    Args:
+        path: Path of the record file, compressed if it ends in .gz.
+
+    Yields:
+        GameRecord instances in file order.
+
+    Raises:
+        RecordFormatError: If a line is not a valid record.
+    """
+    with _open(path, "r") as record_file:
+        for number, line in enumerate(record_file, 1):
+            if not line.strip():
+                continue
+            try:
+                yield GameRecord.from_line(line)
+            except RecordFormatError as error:
+                raise RecordFormatError(f"{path}:{number}: {error}")
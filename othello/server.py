@@ -0,0 +1,380 @@
+"""Game server module.
+
+The server hosts games between remote clients and bots over TCP, every
+connection being one session that can play any number of games in turn.
+The protocol is line-based, with moves in the notation of the human
+agent. On connection the server lists its agents::
+
+    ready alphabeta mcts random
+
+A game is started by naming an agent, the client's color and optionally
+the board size, and the server confirms it::
+
+    new random black 8
+    start black 8
+
+The client then sends its moves, such as ``d3``, ``pass`` or ``resign``,
+and the server replies to every move of the bot with, for example,
+``move c5``, including the bot's first move when the client plays white.
+Malformed commands and illegal moves are answered with ``error`` followed
+by a description, leaving the game as it was. When the game is over the
+server sends the final disc counts, after which the client may start
+another game or send ``quit``::
+
+    over 40 24
+
+If the bot fails to select a move, the server answers with ``error bot
+failed`` and a description, and the game ends.
+
+All sessions run on one event loop. Bots select their moves in a pool of
+worker processes, so a slow bot only delays its own session and never
+holds up the event loop. A fresh bot is created in the worker for every
+move, so bots keep nothing, such as search trees, from one move to the
+next.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from typing import Any, List, Mapping, Optional, Type
+
+from othello.agent.base import Agent, create_agent
+from othello.agent.human import Human, InvalidInputError
+from othello.game.board import BoardSizeError
+from othello.game.game_state import GameState, InvalidMoveError
+from othello.game.move import Move
+from othello.game.player import Player
+
+DEFAULT_PORT = 7654
+# Pending connections the listening socket queues before refusing more.
+BACKLOG = 4096
+
+
+class ProtocolError(Exception):
+    """Raised when a client sends a command that cannot be carried out."""
+
+    pass
+
+
+def to_move(notation: str) -> Move:
+    """Parse the notation of a move.
+
+    Args:
+        notation: Notation of the human agent, pass or resign.
+
+    Returns:
+        Move instance.
+
+    Raises:
+        ProtocolError: If the notation is not valid.
+    """
+    try:
+        Human.validate_input(notation)
+    except InvalidInputError:
+        raise ProtocolError(f"invalid move {notation}")
+    return Human.notation_to_move(notation)
+
+
+def select_move(
+    agent_type: Type[Agent],
+    time_limit: Optional[float],
+    options: Optional[Mapping[str, Any]],
+    game_state: GameState,
+) -> Move:
+    """Create a bot and let it select a move.
+
+    Module-level so that it can be sent to worker processes.
+
+    Args:
+        agent_type: Agent type of the bot.
+        time_limit: Seconds to think for searching bots.
+        options: Options offered to the agent constructor, see create_agent.
+        game_state: Current game state.
+
+    Returns:
+        Move selected by the bot.
+    """
+    agent = create_agent(agent_type, time_limit, options)
+    try:
+        return agent.select_move(game_state)
+    finally:
+        agent.close()
+
+
+class Session:
+    """A game between a client and a bot.
+
+    Attributes:
+        agent_type: Agent type of the bot playing against the client.
+        color: Color played by the client.
+        game_state: Current game state.
+    """
+
+    def __init__(
+        self, agent_type: Type[Agent], color: Player, game_state: GameState
+    ) -> None:
+        """Default constructor for Session.
+
+        Args:
+            agent_type: Agent type of the bot playing against the client.
+            color: Color played by the client.
+            game_state: Initial game state.
+        """
+        self.agent_type = agent_type
+        self.color = color
+        self.game_state = game_state
+
+    @property
+    def bot_to_move(self) -> bool:
+        """Returns whether the bot has to move next.
+
+        Returns:
+            True if the game is not over and it is the bot's turn.
+        """
+        return (
+            not self.game_state.is_over()
+            and self.game_state.current_player != self.color
+        )
+
+    def play(self, move: Move) -> None:
+        """Apply a move of the client.
+
+        Args:
+            move: Move of the client.
+
+        Raises:
+            ProtocolError: If the move is illegal.
+        """
+        try:
+            self.game_state = self.game_state.apply_move(move)
+        except InvalidMoveError as error:
+            raise ProtocolError(str(error))
+
+    def result(self) -> str:
+        """Returns the message announcing the end of the game.
+
+        Returns:
+            over followed by the black and white disc counts.
+        """
+        board = self.game_state.board
+        black = board.count_discs(Player.BLACK)
+        white = board.count_discs(Player.WHITE)
+        return f"over {black} {white}"
+
+
+class GameServer:
+    """Hosts games between remote clients and bots.
+
+    Attributes:
+        agents: Mapping of the names clients may use to agent types.
+        time_limit: Seconds per move for searching bots.
+        options: Options offered to the agent constructors, sent to the
+            worker processes with every move.
+        executor: Worker processes selecting the moves of the bots.
+        sessions: Number of connected clients.
+        games: Number of games started.
+        moves: Number of moves played by clients and bots.
+    """
+
+    def __init__(
+        self,
+        agents: Mapping[str, Type[Agent]],
+        time_limit: Optional[float] = None,
+        workers: Optional[int] = None,
+        options: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Default constructor for GameServer.
+
+        Args:
+            agents: Mapping of the names clients may use to agent types.
+            time_limit: Seconds per move for searching bots.
+            workers: Number of worker processes, None for one per core.
+            options: Options offered to the agent constructors, see
+                create_agent. They must be picklable.
+        """
+        self.agents = agents
+        self.time_limit = time_limit
+        self.options = options
+        # Forked workers would keep the sockets of connected clients open.
+        spawn = multiprocessing.get_context("spawn")
+        self.executor = ProcessPoolExecutor(workers, mp_context=spawn)
+        self.sessions = 0
+        self.games = 0
+        self.moves = 0
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = DEFAULT_PORT
+    ) -> asyncio.base_events.Server:
+        """Start listening for clients.
+
+        Args:
+            host: Address to listen on.
+            port: Port to listen on, 0 for any free port.
+
+        Returns:
+            Server accepting connections.
+        """
+        return await asyncio.start_server(self.handle, host, port, backlog=BACKLOG)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client until it quits or disconnects.
+
+        Args:
+            reader: Stream of the client's commands.
+            writer: Stream of the replies.
+        """
+        self.sessions += 1
+        session: Optional[Session] = None
+        writer.write(f"ready {' '.join(self.agents)}\n".encode())
+        try:
+            while True:
+                line = await reader.readline()
+                command = line.decode(errors="replace").strip().lower()
+                if not line or command == "quit":
+                    break
+                try:
+                    session = await self.respond(session, command, writer)
+                except ProtocolError as error:
+                    writer.write(f"error {error}\n".encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    async def respond(
+        self, session: Optional[Session], command: str, writer: asyncio.StreamWriter
+    ) -> Optional[Session]:
+        """Carry out one command of a client.
+
+        Args:
+            session: Game in progress, None if there is none.
+            command: Command sent by the client.
+            writer: Stream of the replies.
+
+        Returns:
+            Game in progress after the command, None if there is none.
+
+        Raises:
+            ProtocolError: If the command cannot be carried out.
+        """
+        words = command.split()
+        if words and words[0] == "new":
+            if session is not None:
+                raise ProtocolError("a game is already in progress")
+            session = self.new_session(words[1:])
+            color = session.color.name.lower()
+            writer.write(f"start {color} {session.game_state.board.size}\n".encode())
+        elif session is None:
+            raise ProtocolError("no game in progress")
+        else:
+            session.play(to_move(command))
+            self.moves += 1
+        while session.bot_to_move:
+            try:
+                move = await self.select_move(session)
+            except Exception as error:
+                writer.write(f"error bot failed: {error!r}\n".encode())
+                return None
+            self.moves += 1
+            writer.write(f"move {Human.move_to_notation(move)}\n".encode())
+        if session.game_state.is_over():
+            writer.write(f"{session.result()}\n".encode())
+            return None
+        return session
+
+    async def select_move(self, session: Session) -> Move:
+        """Let the bot of a session select and play its move.
+
+        Args:
+            session: Game in which the bot is to move.
+
+        Returns:
+            Move played by the bot.
+        """
+        move = await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            select_move,
+            session.agent_type,
+            self.time_limit,
+            self.options,
+            session.game_state,
+        )
+        session.play(move)
+        return move
+
+    def new_session(self, arguments: List[str]) -> Session:
+        """Start a game from the arguments of a new command.
+
+        Args:
+            arguments: Agent name, client color and optional board size.
+
+        Returns:
+            Session instance.
+
+        Raises:
+            ProtocolError: If the arguments do not describe a game.
+        """
+        if len(arguments) not in (2, 3):
+            raise ProtocolError("usage: new <agent> <black|white> [<size>]")
+        name, color = arguments[:2]
+        if name not in self.agents:
+            raise ProtocolError(f"unknown agent {name}")
+        agent_type = self.agents[name]
+        if issubclass(agent_type, Human):
+            raise ProtocolError(f"agent {name} cannot play remotely")
+        if color not in ("black", "white"):
+            raise ProtocolError(f"unknown color {color}")
+        try:
+            size = int(arguments[2]) if len(arguments) == 3 else 8
+            game_state = GameState.new_game(size)
+        except (ValueError, BoardSizeError):
+            raise ProtocolError(f"invalid board size {arguments[2]}")
+        self.games += 1
+        return Session(agent_type, Player[color.upper()], game_state)
+
+    async def serve(self, host: str, port: int) -> None:
+        """Serve clients until cancelled.
+
+        Args:
+            host: Address to listen on.
+            port: Port to listen on.
+        """
+        server = await self.start(host, port)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"Serving on {host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=False)
+
+
+def serve(
+    agents: Mapping[str, Type[Agent]],
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    time_limit: Optional[float] = None,
+    workers: Optional[int] = None,
+    options: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """Run a game server until interrupted.
+
+    Args:
+        agents: Mapping of the names clients may use to agent types.
+        host: Address to listen on.
+        port: Port to listen on.
+        time_limit: Seconds per move for searching bots.
+        workers: Number of worker processes for the bots.
+        options: Options offered to the agent constructors.
+    """
+    server = GameServer(agents, time_limit, workers, options)
+    try:
+        asyncio.run(server.serve(host, port))
+    except KeyboardInterrupt:
+        pass
+    print(f"Played {server.moves} moves in {server.games} games")
@@ -0,0 +1,363 @@
+"""Tournament module."""
+from concurrent.futures import as_completed, Future
+from dataclasses import dataclass, field
+import itertools
+import math
+import random
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from othello.agent.base import Agent, create_agent
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.match import play_game
+from othello.record import GameRecord
+
+# Two-sided 95% normal quantile for the Elo confidence intervals.
+Z_95 = 1.959964
+
+
+class GameTask(NamedTuple):
+    """A scheduled tournament game.
+
+    Attributes:
+        number: Position of the game in the schedule.
+        black: Name of the agent playing black.
+        white: Name of the agent playing white.
+        black_type: Agent type playing black.
+        white_type: Agent type playing white.
+        seed: Seed for the random number generator of the game.
+        board_size: Board size.
+        time_limit: Seconds per move for searching agents.
+        options: Options offered to the agent constructors, see
+            create_agent. They are sent to the worker processes, so they
+            must be picklable.
+    """
+
+    number: int
+    black: str
+    white: str
+    black_type: Type[Agent]
+    white_type: Type[Agent]
+    seed: int
+    board_size: int = 8
+    time_limit: Optional[float] = None
+    options: Optional[Mapping[str, Any]] = None
+
+
+class GameOutcome(NamedTuple):
+    """Final disc counts of a tournament game.
+
+    Attributes:
+        number: Position of the game in the schedule.
+        black: Name of the agent that played black.
+        white: Name of the agent that played white.
+        black_discs: Black discs at the end of the game.
+        white_discs: White discs at the end of the game.
+        moves: Moves played from the initial position.
+    """
+
+    number: int
+    black: str
+    white: str
+    black_discs: int
+    white_discs: int
+    moves: Tuple[Move, ...] = ()
+
+    @property
+    def black_score(self) -> float:
+        """Returns the game score for black.
+
+        Returns:
+            1 for a win, 0.5 for a draw and 0 for a loss.
+        """
+        if self.black_discs > self.white_discs:
+            return 1.0
+        if self.black_discs < self.white_discs:
+            return 0.0
+        return 0.5
+
+    def to_record(self, board_size: int) -> GameRecord:
+        """Returns the game record of the outcome.
+
+        Args:
+            board_size: Board size the game was played on.
+
+        Returns:
+            GameRecord instance, with the game number as metadata.
+        """
+        return GameRecord(
+            board_size,
+            self.black,
+            self.white,
+            list(self.moves),
+            self.black_discs,
+            self.white_discs,
+            {"game": self.number},
+        )
+
+
+def schedule(
+    agents: Dict[str, Type[Agent]],
+    games_per_pair: int,
+    gauntlet: Optional[str] = None,
+    seed: int = 0,
+    board_size: int = 8,
+    time_limit: Optional[float] = None,
+    options: Optional[Mapping[str, Any]] = None,
+) -> List[GameTask]:
+    """Create the list of games to play.
+
+    In a round robin every pair of agents plays; in a gauntlet only the
+    gauntlet agent plays, against every other agent. Colors alternate
+    between the games of a pair, and every game gets its own seed derived
+    from the base seed so results can be reproduced.
+
+    Args:
+        agents: Dictionary mapping agent names to agent types.
+        games_per_pair: Number of games each pairing plays.
+        gauntlet: Name of the gauntlet agent, None for a round robin.
+        seed: Base seed.
+        board_size: Board size.
+        time_limit: Seconds per move for searching agents.
+        options: Options offered to the agent constructors.
+
+    Returns:
+        List of GameTask instances.
+    """
+    names = list(agents)
+    if gauntlet is None:
+        pairs = list(itertools.combinations(names, 2))
+    else:
+        pairs = [(gauntlet, name) for name in names if name != gauntlet]
+    tasks: List[GameTask] = []
+    for first, second in pairs:
+        for game in range(games_per_pair):
+            black, white = (first, second) if game % 2 == 0 else (second, first)
+            number = len(tasks)
+            tasks.append(
+                GameTask(
+                    number,
+                    black,
+                    white,
+                    agents[black],
+                    agents[white],
+                    seed + number,
+                    board_size,
+                    time_limit,
+                    options,
+                )
+            )
+    return tasks
+
+
+def play_task(task: GameTask) -> GameOutcome:
+    """Play a scheduled game.
+
+    Module-level so that it can be sent to worker processes.
+
+    Args:
+        task: Game to play.
+
+    Returns:
+        GameOutcome instance.
+    """
+    random.seed(task.seed)
+    moves: List[Move] = []
+    black = create_agent(task.black_type, task.time_limit, task.options)
+    white = create_agent(task.white_type, task.time_limit, task.options)
+    game_state = play_game(black, white, task.board_size, moves=moves)
+    black.close()
+    white.close()
+    board = game_state.board
+    return GameOutcome(
+        task.number,
+        task.black,
+        task.white,
+        board.count_discs(Player.BLACK),
+        board.count_discs(Player.WHITE),
+        tuple(moves),
+    )
+
+
+def run_tournament(
+    tasks: List[GameTask], jobs: Optional[int] = None
+) -> Iterator[GameOutcome]:
+    """Play scheduled games, yielding outcomes as they complete.
+
+    Games are spread over a pool of worker processes, one per core by
+    default. With a single job the games are played in this process.
+
+    Args:
+        tasks: Games to play.
+        jobs: Number of worker processes, None for one per core.
+
+    Yields:
+        GameOutcome instances in completion order.
+    """
+    if jobs == 1:
+        for task in tasks:
+            yield play_task(task)
+        return
+    # Imported here as it pulls in multiprocessing, which slows down startup.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures: List[Future] = [executor.submit(play_task, task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def elo_difference(score: float) -> float:
+    """Convert an expected score to an Elo rating difference.
+
+    Args:
+        score: Expected score between 0 and 1.
+
+    Returns:
+        Elo difference, infinite for perfect scores.
+    """
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+@dataclass
+class Crosstable:
+    """Results of a tournament by pairing.
+
+    Attributes:
+        names: Agent names in display order.
+        scores: Game scores keyed by (agent, opponent), one per game.
+    """
+
+    names: List[str]
+    scores: Dict[Tuple[str, str], List[float]] = field(default_factory=dict)
+
+    def add(self, outcome: GameOutcome) -> None:
+        """Record a game outcome.
+
+        Args:
+            outcome: Finished game.
+        """
+        score = outcome.black_score
+        self.scores.setdefault((outcome.black, outcome.white), []).append(score)
+        self.scores.setdefault((outcome.white, outcome.black), []).append(1 - score)
+
+    def results(self, name: str) -> List[float]:
+        """Returns all game scores of an agent.
+
+        Args:
+            name: Agent name.
+
+        Returns:
+            List of game scores.
+        """
+        return [
+            score
+            for (agent, _), scores in self.scores.items()
+            if agent == name
+            for score in scores
+        ]
+
+    def elo(self, name: str) -> Tuple[float, float, float]:
+        """Estimate an agent's performance rating against its opponents.
+
+        The rating is the Elo difference implied by the agent's mean score,
+        with a 95% confidence interval from the standard error of that
+        mean.
+
+        Args:
+            name: Agent name.
+
+        Returns:
+            Tuple of the estimate and the lower and upper interval bounds.
+        """
+        results = self.results(name)
+        if not results:
+            return 0.0, -math.inf, math.inf
+        games = len(results)
+        mean = sum(results) / games
+        variance = sum((score - mean) ** 2 for score in results) / games
+        margin = Z_95 * math.sqrt(variance / games)
+        return (
+            elo_difference(mean),
+            elo_difference(mean - margin),
+            elo_difference(mean + margin),
+        )
+
+    def __str__(self) -> str:
+        """Crosstable with scores against each opponent and Elo estimates.
+
+        Returns:
+            String representation.
+        """
+        width = max([len(name) for name in self.names] + [6])
+        header = " " * width
+        header += "".join(f" {name[:width]:>{width}}" for name in self.names)
+        lines = [header + "   score      elo  (95% CI)"]
+        for name in self.names:
+            cells = []
+            for opponent in self.names:
+                scores = self.scores.get((name, opponent))
+                if name == opponent or scores is None:
+                    cells.append(f" {'-':>{width}}")
+                else:
+                    cells.append(f" {f'{sum(scores):g}/{len(scores)}':>{width}}")
+            results = self.results(name)
+            elo, low, high = self.elo(name)
+            lines.append(
+                f"{name:<{width}}{''.join(cells)} {sum(results):7g} "
+                f"{elo:8.0f}  ({low:.0f}, {high:.0f})"
+            )
+        return "\n".join(lines)
+
+
+def run(
+    agents: Dict[str, Type[Agent]],
+    games_per_pair: int,
+    gauntlet: Optional[str] = None,
+    jobs: Optional[int] = None,
+    seed: int = 0,
+    board_size: int = 8,
+    time_limit: Optional[float] = None,
+    on_outcome: Optional[Callable[[GameOutcome], None]] = None,
+    options: Optional[Mapping[str, Any]] = None,
+) -> Crosstable:
+    """Schedule and play a tournament.
+
+    Args:
+        agents: Dictionary mapping agent names to agent types.
+        games_per_pair: Number of games each pairing plays.
+        gauntlet: Name of the gauntlet agent, None for a round robin.
+        jobs: Number of worker processes, None for one per core.
+        seed: Base seed.
+        board_size: Board size.
+        time_limit: Seconds per move for searching agents.
+        on_outcome: Called with every outcome as soon as it completes.
+        options: Options offered to the agent constructors, picklable.
+
+    Returns:
+        Crosstable of the tournament.
+    """
+    tasks = schedule(
+        agents, games_per_pair, gauntlet, seed, board_size, time_limit, options
+    )
+    crosstable = Crosstable(list(agents))
+    for outcome in run_tournament(tasks, jobs):
+        crosstable.add(outcome)
+        if on_outcome is not None:
+            on_outcome(outcome)
+    return crosstable
@@ -0,0 +1,135 @@
+"""Test cases for the alphabeta_bot module."""
+import random
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+from othello.agent.alphabeta_bot import AlphaBetaBot, evaluate, MAX_HEURISTIC
+from othello.agent.base import SearchInfo
+from othello.agent.pattern import default_weights, PatternEvaluator
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from tests.helpers import minimax
+
+
+@pytest.fixture
+def bot() -> AlphaBetaBot:
+    """Returns an AlphaBetaBot instance with a short time limit."""
+    return AlphaBetaBot(time_limit=0.2)
+
+
+def test_plays_legal_move(bot: AlphaBetaBot) -> None:
+    """It returns a legal Move and records search statistics."""
+    game_state = GameState.new_game()
+    selected = bot.select_move(game_state)
+    assert selected.point in game_state.legal_moves()
+    assert bot.last_search is not None and bot.last_search.nodes > 0
+
+
+def test_pass_when_no_plays(mocker: Mock, bot: AlphaBetaBot) -> None:
+    """It returns a pass Move when there are no legal moves."""
+    mocker.patch.object(GameState, "legal_moves", return_value=[])
+    game_state = GameState.new_game()
+    assert bot.select_move(game_state) == Move.pass_turn()
+
+
+def test_respects_max_depth() -> None:
+    """It stops deepening at the maximum depth."""
+    bot = AlphaBetaBot(time_limit=10, max_depth=2)
+    bot.select_move(GameState.new_game())
+    assert bot.last_search is not None and bot.last_search.depth == 2
+
+
+def test_leaves_game_state_untouched(bot: AlphaBetaBot) -> None:
+    """It does not modify the game state it searches from."""
+    game_state = GameState.new_game()
+    before = str(game_state.board)
+    bot.select_move(game_state)
+    assert str(game_state.board) == before and game_state.last_move is None
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_finds_best_endgame_move(seed: int) -> None:
+    """It plays a move that achieves the exact game result."""
+    rng = random.Random(seed)
+    game_state = GameState.new_game(4)
+    for _ in range(4):
+        game_state = game_state.apply_move(
+            Move.play(rng.choice(game_state.legal_moves()))
+        )
+    bot = AlphaBetaBot(time_limit=30, solve_empties=0)
+    move = bot.select_move(game_state)
+    assert -minimax(game_state.apply_move(move)) == minimax(game_state)
+
+
+def test_solves_endgame_exactly() -> None:
+    """It uses the endgame solver once few empty squares are left."""
+    rng = random.Random(0)
+    game_state = GameState.new_game(4)
+    for _ in range(4):
+        game_state = game_state.apply_move(
+            Move.play(rng.choice(game_state.legal_moves()))
+        )
+    bot = AlphaBetaBot(time_limit=30)
+    move = bot.select_move(game_state)
+    assert bot.last_search is not None and bot.last_search.depth == 8
+    assert bot.last_search.score == minimax(game_state)
+    assert -minimax(game_state.apply_move(move)) == minimax(game_state)
+
+
+def test_pattern_evaluator_indices() -> None:
+    """It scores leaves with indices kept in step with the searched board."""
+    evaluator = PatternEvaluator(default_weights(6))
+    leaves = []
+
+    def evaluate_leaf(state: GameState, indices: List[int]) -> int:
+        leaves.append(indices)
+        assert indices == evaluator.indices(*state.board.get_masks(Player.BLACK))
+        return PatternEvaluator.evaluate(evaluator, state, indices)
+
+    evaluator.evaluate = evaluate_leaf  # type: ignore[assignment]
+    bot = AlphaBetaBot(time_limit=10, max_depth=3, evaluator=evaluator)
+    game_state = GameState.new_game(6)
+    move = bot.select_move(game_state)
+    assert move.point in game_state.legal_moves()
+    assert leaves
+
+
+def test_pattern_evaluator_other_size() -> None:
+    """It scores boards the evaluator's weights do not fit with evaluate."""
+    evaluator = PatternEvaluator(default_weights(8))
+    bot = AlphaBetaBot(time_limit=10, max_depth=2, evaluator=evaluator)
+    game_state = GameState.new_game(6)
+    assert bot.select_move(game_state).point in game_state.legal_moves()
+
+
+def test_clamps_heuristic_scores(mocker: Mock) -> None:
+    """It keeps heuristic scores below the scores of won games."""
+    mocker.patch("othello.agent.alphabeta_bot.evaluate", return_value=-50000)
+    bot = AlphaBetaBot(time_limit=10, max_depth=1)
+    bot.select_move(GameState.new_game())
+    assert bot.last_search is not None and bot.last_search.score == MAX_HEURISTIC
+
+
+def test_evaluate_initial_position() -> None:
+    """It evaluates the symmetric initial position as even."""
+    assert evaluate(GameState.new_game()) == 0
+
+
+def test_search_info_nodes_per_second() -> None:
+    """It reports search throughput."""
+    info = SearchInfo(nodes=1000, seconds=0.5, depth=3)
+    assert info.nodes_per_second == 2000
+    assert str(info) == "1000 nodes in 0.50s (2000 nodes/s), depth 3"
+
+
+def test_plays_full_game() -> None:
+    """It only returns legal moves over a whole game."""
+    bot = AlphaBetaBot(time_limit=0.01)
+    game_state = GameState.new_game(6)
+    while not game_state.is_over():
+        move = bot.select_move(game_state)
+        assert move.is_pass or move.point in game_state.legal_moves()
+        game_state = game_state.apply_move(move)
@@ -0,0 +1,17 @@
+"""Test cases for the base module."""
+from othello.agent.alphabeta_bot import AlphaBetaBot
+from othello.agent.base import create_agent
+from othello.agent.random_bot import RandomBot
+
+
+def test_create_agent_passes_accepted_options() -> None:
+    """It passes the options named by the constructor's parameters."""
+    agent = create_agent(AlphaBetaBot, 0.5, {"max_depth": 2, "unknown": 1})
+    assert isinstance(agent, AlphaBetaBot)
+    assert agent.time_limit == 0.5 and agent.max_depth == 2
+
+
+def test_create_agent_ignores_other_options() -> None:
+    """It leaves out options the agent type does not take."""
+    agent = create_agent(RandomBot, None, {"max_depth": 2})
+    assert isinstance(agent, RandomBot)
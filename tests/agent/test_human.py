@@ -43,6 +43,13 @@ def test_invalid_point_to_notation(human: Human) -> None:
         Human.point_to_notation(point)
 
 
+def test_move_to_notation(human: Human) -> None:
+    """It returns notation for plays, passes and resignations."""
+    assert Human.move_to_notation(Move.play(Point(11, 2))) == "c12"
+    assert Human.move_to_notation(Move.pass_turn()) == "pass"
+    assert Human.move_to_notation(Move.resign()) == "resign"
+
+
 def test_notation_to_move_pass(human: Human) -> None:
     """It returns Move object on pass."""
     assert Human.notation_to_move("pass") == Move.pass_turn()
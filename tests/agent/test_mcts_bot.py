@@ -0,0 +1,152 @@
+"""Test cases for the mcts_bot module."""
+import random
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from othello.agent.mcts_bot import MCTSBot, Node, playout, search_worker
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from tests.helpers import minimax
+
+
+@pytest.fixture
+def bot() -> MCTSBot:
+    """Returns an MCTSBot instance with a playout budget."""
+    return MCTSBot(time_limit=10, playouts=100, seed=0)
+
+
+def test_plays_legal_move(bot: MCTSBot) -> None:
+    """It returns a legal Move and records search statistics."""
+    game_state = GameState.new_game()
+    selected = bot.select_move(game_state)
+    assert selected.point in game_state.legal_moves()
+    assert bot.last_search is not None and bot.last_search.nodes == 100
+
+
+def test_pass_when_no_plays(mocker: Mock, bot: MCTSBot) -> None:
+    """It returns a pass Move when there are no legal moves."""
+    mocker.patch.object(GameState, "legal_moves", return_value=[])
+    assert bot.select_move(GameState.new_game()) == Move.pass_turn()
+
+
+def test_leaves_game_state_untouched(bot: MCTSBot) -> None:
+    """It does not modify the game state it searches from."""
+    game_state = GameState.new_game()
+    before = str(game_state.board)
+    bot.select_move(game_state)
+    assert str(game_state.board) == before and game_state.last_move is None
+
+
+def test_playout_restores_state() -> None:
+    """It plays a game to the end and takes all moves back."""
+    game_state = GameState.new_game(4)
+    winner = playout(game_state, random.Random(0))
+    assert winner in (Player.BLACK, Player.WHITE, None)
+    assert str(game_state.board) == str(GameState.new_game(4).board)
+
+
+def test_visits_add_up(bot: MCTSBot) -> None:
+    """It counts every playout once at the root and once below it."""
+    bot.select_move(GameState.new_game())
+    assert bot.root is not None
+    assert bot.root.visits == sum(child.visits for child in bot.root.children.values())
+
+
+def test_reuses_subtree(bot: MCTSBot) -> None:
+    """It continues from the subtree of the moves played since its last search."""
+    game_state = GameState.new_game(6)
+    move = bot.select_move(game_state)
+    game_state = game_state.apply_move(move)
+    reply = Move.play(game_state.legal_moves()[0])
+    assert bot.root is not None
+    subtree = bot.root.children[move.point].children.get(reply.point)
+    game_state = game_state.apply_move(reply)
+    bot.select_move(game_state)
+    assert subtree is not None and bot.root is subtree
+    assert bot.root.visits > 100
+
+
+def test_new_tree_for_unknown_position(bot: MCTSBot) -> None:
+    """It starts a new tree when the position is not below the last root."""
+    bot.select_move(GameState.new_game())
+    game_state = GameState.new_game(6)
+    bot.select_move(game_state)
+    assert bot.root is not None and bot.root.visits == 100
+
+
+def test_finds_winning_move() -> None:
+    """It plays a winning move in an endgame where one move loses."""
+    rng = random.Random(2)
+    game_state = GameState.new_game(4)
+    for _ in range(5):
+        game_state = game_state.apply_move(
+            Move.play(rng.choice(game_state.legal_moves()))
+        )
+    bot = MCTSBot(time_limit=30, playouts=1000, seed=0)
+    move = bot.select_move(game_state)
+    assert minimax(game_state.apply_move(move)) < 0
+    assert bot.last_search is not None and bot.last_search.score is not None
+
+
+def test_root_parallel() -> None:
+    """It adds up the playouts of worker processes."""
+    with MCTSBot(time_limit=10, playouts=40, jobs=2, seed=0) as bot:
+        game_state = GameState.new_game()
+        assert bot.select_move(game_state).point in game_state.legal_moves()
+        assert bot.last_search is not None and bot.last_search.nodes == 40
+        executor = bot._executor
+        game_state = game_state.apply_move(Move.play(game_state.legal_moves()[0]))
+        bot.select_move(game_state)
+        assert bot._executor is executor
+    assert bot._executor is None
+
+
+def test_root_parallel_deadline() -> None:
+    """It stops the worker processes at the deadline of the move."""
+    with MCTSBot(time_limit=0.5, jobs=2, seed=0) as bot:
+        bot.select_move(GameState.new_game())
+    assert bot.last_search is not None and bot.last_search.seconds < 1.5
+
+
+def test_seed_from_random_module() -> None:
+    """It draws its seed from the random module when none is given."""
+    scores = []
+    for _ in range(2):
+        random.seed(5)
+        bot = MCTSBot(time_limit=10, playouts=50)
+        bot.select_move(GameState.new_game())
+        assert bot.last_search is not None
+        scores.append(bot.last_search.score)
+    assert scores[0] == scores[1]
+
+
+def test_single_job_without_workers(mocker: Mock) -> None:
+    """It searches without starting worker processes when it has one job."""
+    executor = mocker.patch("othello.agent.mcts_bot.ProcessPoolExecutor")
+    with MCTSBot(time_limit=10, playouts=10, seed=0) as bot:
+        bot.select_move(GameState.new_game())
+    executor.assert_not_called()
+
+
+def test_search_worker_deadline() -> None:
+    """It plays a single playout when the deadline has passed."""
+    stats = search_worker(GameState.new_game(), 1.4, time.time() - 1, None, 0)
+    assert sum(visits for visits, _ in stats.values()) == 1
+
+
+def test_select_child_prefers_wins() -> None:
+    """It picks the child with the highest UCT value."""
+    game_state = GameState.new_game()
+    root = Node(game_state)
+    root.visits = 10
+    points = game_state.legal_moves()
+    for index, point in enumerate(points):
+        child = Node(game_state.apply_move(Move.play(point)), root)
+        child.visits = 5
+        child.wins = float(index)
+        root.children[point] = child
+    move, _ = root.select_child(1.4)
+    assert move == points[-1]
@@ -0,0 +1,102 @@
+"""Test cases for the pattern module."""
+from pathlib import Path
+import random
+
+import pytest
+
+from othello.agent.pattern import (
+    default_weights,
+    get_patterns,
+    PatternEvaluator,
+    read_weights,
+    WeightsFormatError,
+    write_weights,
+)
+from othello.game.bitboard import BitBoard
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+
+
+@pytest.fixture(scope="module")
+def evaluator() -> PatternEvaluator:
+    """Returns an evaluator with the default weights of 6x6 boards."""
+    return PatternEvaluator(default_weights(6))
+
+
+def ternary_index(game_state: GameState, squares: tuple) -> int:
+    """Returns the configuration index of squares, digit by digit."""
+    board = game_state.board
+    black, white = board.get_masks(Player.BLACK)
+    index = 0
+    for square in reversed(squares):
+        index = 3 * index + (black >> square & 1) + 2 * (white >> square & 1)
+    return index
+
+
+def test_get_patterns() -> None:
+    """It places every instance of a pattern on distinct squares."""
+    patterns = get_patterns(8)
+    assert patterns.names == ("edge", "corner", "diagonal", "rectangle")
+    assert patterns.lengths == (10, 9, 8, 10)
+    counts = [0] * len(patterns.names)
+    for number, squares in patterns.instances:
+        assert len(set(squares)) == patterns.lengths[number]
+        counts[number] += 1
+    assert counts == [4, 4, 2, 8]
+
+
+def test_indices_follow_moves(evaluator: PatternEvaluator) -> None:
+    """It updates indices move by move to the recounted ones."""
+    rng = random.Random(0)
+    game_state = GameState.new_game(6, BitBoard)
+    indices = evaluator.indices(*game_state.board.get_masks(Player.BLACK))
+    while not game_state.is_over():
+        legal_moves = game_state.legal_moves()
+        if not legal_moves:
+            game_state.make_move(Move.pass_turn())
+            continue
+        undo = game_state.make_move(Move.play(rng.choice(legal_moves)))
+        assert undo.board_undo is not None
+        indices = evaluator.update(indices, undo.board_undo)
+        masks = game_state.board.get_masks(Player.BLACK)
+        assert indices == evaluator.indices(*masks)
+        for index, (_, squares) in zip(indices, evaluator.patterns.instances):
+            assert index == ternary_index(game_state, squares)
+
+
+def test_evaluate_is_symmetric(evaluator: PatternEvaluator) -> None:
+    """It scores a position the same from either side's point of view."""
+    game_state = GameState.new_game(6)
+    for _ in range(3):
+        move = Move.play(game_state.legal_moves()[0])
+        game_state = game_state.apply_move(move)
+    score = evaluator.evaluate(game_state)
+    game_state.current_player = game_state.current_player.other
+    assert evaluator.evaluate(game_state) == -score
+
+
+def test_evaluate_prefers_corners(evaluator: PatternEvaluator) -> None:
+    """It scores corner discs above discs next to corners."""
+    corner = BitBoard.from_masks(6, 1, 0)
+    x_square = BitBoard.from_masks(6, 1 << 7, 0)
+    assert evaluator.evaluate(GameState(corner, Player.BLACK)) > evaluator.evaluate(
+        GameState(x_square, Player.BLACK)
+    )
+
+
+def test_weights_round_trip(tmp_path: Path) -> None:
+    """It reads back the weights it wrote."""
+    path = str(tmp_path / "weights.bin")
+    weights = default_weights(6)
+    write_weights(weights, path)
+    assert read_weights(path) == weights
+
+
+@pytest.mark.parametrize("data", [b"", b"OTHP\x06\x00\x0a\x00\x14\x00", b"OTHB" * 3])
+def test_read_weights_invalid(tmp_path: Path, data: bytes) -> None:
+    """It raises `WeightsFormatError` for files that are not weights files."""
+    path = tmp_path / "weights.bin"
+    path.write_bytes(data)
+    with pytest.raises(WeightsFormatError):
+        read_weights(str(path))
@@ -0,0 +1,86 @@
+"""Test cases for the transposition module."""
+import pytest
+
+from othello.agent.transposition import Bound, get_bound, TranspositionTable
+from othello.game.point import Point
+
+
+@pytest.fixture
+def table() -> TranspositionTable:
+    """Returns a TranspositionTable with few buckets."""
+    return TranspositionTable(memory_mb=0.001)
+
+
+def test_memory_cap() -> None:
+    """It sizes the table from the memory cap."""
+    assert TranspositionTable(memory_mb=2).buckets > TranspositionTable(1).buckets
+
+
+def test_probe_hit(table: TranspositionTable) -> None:
+    """It returns stored entries and counts hits."""
+    table.store(42, 3, 10, Bound.EXACT, Point(2, 3))
+    entry = table.probe(42)
+    assert entry is not None and entry.score == 10 and entry.move == Point(2, 3)
+    assert table.stats() == {"hits": 1, "misses": 0, "collisions": 0}
+
+
+def test_probe_miss(table: TranspositionTable) -> None:
+    """It returns None for unknown positions and counts misses."""
+    assert table.probe(42) is None
+    assert table.misses == 1 and table.collisions == 0
+
+
+def test_probe_collision(table: TranspositionTable) -> None:
+    """It counts misses on buckets holding other positions as collisions."""
+    table.store(1, 3, 10, Bound.EXACT, None)
+    assert table.probe(1 + table.buckets) is None
+    assert table.collisions == 1
+
+
+def test_depth_preferred_replacement(table: TranspositionTable) -> None:
+    """It keeps deeper results and puts shallower ones in the other slot."""
+    deep_key = 1
+    shallow_key = 1 + table.buckets
+    newest_key = 1 + 2 * table.buckets
+    table.store(deep_key, 5, 10, Bound.EXACT, None)
+    table.store(shallow_key, 2, 20, Bound.EXACT, None)
+    table.store(newest_key, 1, 30, Bound.EXACT, None)
+    assert table.probe(deep_key) is not None
+    assert table.probe(shallow_key) is None
+    assert table.probe(newest_key) is not None
+    assert len(table) == 2
+
+
+def test_clear(table: TranspositionTable) -> None:
+    """It removes all entries and resets counters."""
+    table.store(1, 3, 10, Bound.EXACT, None)
+    table.probe(1)
+    table.clear()
+    assert len(table) == 0 and table.hits == 0
+
+
+def test_narrow_exact(table: TranspositionTable) -> None:
+    """It closes the window on exact scores searched deep enough."""
+    table.store(1, 3, 10, Bound.EXACT, None)
+    entry = table.probe(1)
+    assert entry is not None
+    assert entry.narrow(3, -100, 100) == (10, 10)
+    assert entry.narrow(4, -100, 100) == (-100, 100)
+
+
+def test_narrow_bounds(table: TranspositionTable) -> None:
+    """It raises alpha on lower bounds and lowers beta on upper bounds."""
+    table.store(1, 3, 10, Bound.LOWER, None)
+    table.store(2, 3, 10, Bound.UPPER, None)
+    lower = table.probe(1)
+    upper = table.probe(2)
+    assert lower is not None and upper is not None
+    assert lower.narrow(3, -100, 100) == (10, 100)
+    assert upper.narrow(3, -100, 100) == (-100, 10)
+
+
+def test_get_bound() -> None:
+    """It classifies scores against the search window."""
+    assert get_bound(-5, 0, 10) == Bound.UPPER
+    assert get_bound(15, 0, 10) == Bound.LOWER
+    assert get_bound(5, 0, 10) == Bound.EXACT
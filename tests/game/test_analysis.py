@@ -0,0 +1,102 @@
+"""Test cases for the analysis module."""
+import random
+
+import pytest
+
+from othello.game.analysis import (
+    Analysis,
+    Features,
+    full_lines,
+    get_features,
+    neighbours,
+    stable_discs,
+)
+from othello.game.bitboard import BitBoard
+from othello.game.endgame import parse_position
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+
+
+def test_stable_discs_never_flip() -> None:
+    """It only reports discs that keep their color until the end."""
+    for seed in range(5):
+        rng = random.Random(seed)
+        game_state = GameState.new_game(6, BitBoard)
+        stable = {Player.BLACK: 0, Player.WHITE: 0}
+        while not game_state.is_over():
+            board = BitBoard.from_board(game_state.board)
+            for player in Player:
+                own, opp = board.get_masks(player)
+                assert own & stable[player] == stable[player]
+                stable[player] = stable_discs(own, opp, 6)
+            legal_moves = game_state.legal_moves()
+            move = (
+                Move.play(rng.choice(legal_moves)) if legal_moves else Move.pass_turn()
+            )
+            game_state = game_state.apply_move(move)
+
+
+def test_full_board_is_stable() -> None:
+    """It reports every disc of a full board as stable."""
+    board = BitBoard.from_board(parse_position("XOXO OXXO XXOO OOOX").board)
+    own, opp = board.get_masks(Player.BLACK)
+    assert stable_discs(own, opp, 4) == own
+
+
+def test_stable_discs_known() -> None:
+    """It keeps known stable discs and grows from them."""
+    board = BitBoard.from_board(parse_position("XXXX -O-- ---- ----").board)
+    own, opp = board.get_masks(Player.BLACK)
+    assert stable_discs(own, opp, 4) == own
+    assert stable_discs(own, opp, 4, known=0b1) == own
+    assert stable_discs(own, opp, 4, known=own | opp) == own
+
+
+def test_neighbours() -> None:
+    """It finds the squares around a mask without wrapping around."""
+    assert neighbours(1 << 3, 4) == 1 << 2 | 1 << 6 | 1 << 7
+
+
+def test_features_new_game() -> None:
+    """It counts the features of the initial position."""
+    black, white = BitBoard(8).get_masks(Player.BLACK)
+    assert get_features(black, white, 8) == Features(4, 10, 2, 0)
+
+
+def test_analysis_follows_game() -> None:
+    """It matches a fresh analysis of every position of random games."""
+    for seed in range(5):
+        rng = random.Random(seed)
+        game_state = GameState.new_game(6, BitBoard)
+        analysis = Analysis(game_state.board)
+        while not game_state.is_over():
+            legal_moves = game_state.legal_moves()
+            if legal_moves:
+                move = Move.play(rng.choice(legal_moves))
+                undo = game_state.make_move(move)
+                assert undo.board_undo is not None
+                analysis.update(*undo.board_undo)
+            else:
+                game_state.make_move(Move.pass_turn())
+            for player in Player:
+                own, opp = game_state.board.get_masks(player)
+                assert analysis.get_masks(player) == (own, opp)
+                assert analysis.stable(player) == stable_discs(own, opp, 6)
+                assert analysis.features(player) == get_features(own, opp, 6)
+            assert analysis._positions[-1].full == full_lines(own | opp, 6)
+
+
+def test_analysis_take_back() -> None:
+    """It returns to the previous position when a placement is undone."""
+    game_state = GameState.new_game(8, BitBoard)
+    analysis = Analysis(game_state.board)
+    before = analysis.features(Player.BLACK)
+    undo = game_state.make_move(Move.play(game_state.legal_moves()[0]))
+    assert undo.board_undo is not None
+    analysis.update(*undo.board_undo)
+    assert analysis.features(Player.BLACK) != before
+    analysis.take_back()
+    assert analysis.features(Player.BLACK) == before
+    with pytest.raises(ValueError):
+        analysis.take_back()
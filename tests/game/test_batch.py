@@ -0,0 +1,81 @@
+"""Test cases for the batch module."""
+from typing import List
+
+import pytest
+
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.game.point import Point
+
+pytest.importorskip("numpy")
+
+from othello.game.batch import random_games, simulate  # noqa: E402,I100,I202
+
+
+def replay(game_state: GameState, moves: List[Move]) -> GameState:
+    """Apply moves to a game state, checking them against Board's rules."""
+    for move in moves:
+        game_state = game_state.apply_move(move)
+    return game_state
+
+
+@pytest.mark.parametrize("size", [4, 8, 12])
+def test_random_games_follow_board_rules(size: int) -> None:
+    """It plays legal games to the end with the disc counts of Board."""
+    result = random_games(20, size, seed=size, record=True)
+    for game in range(20):
+        game_state = replay(GameState.new_game(size), result.game_moves(game))
+        assert game_state.is_over()
+        board = game_state.board
+        assert board.count_discs(Player.BLACK) == result.black_discs[game]
+        assert board.count_discs(Player.WHITE) == result.white_discs[game]
+
+
+def test_simulate_from_positions() -> None:
+    """It continues games from positions with either player to move."""
+    opening = GameState.new_game().apply_move(Move.play(Point(2, 3)))
+    for start in [opening, opening.apply_move(Move.play(Point(2, 2)))]:
+        result = simulate([start] * 5, seed=1, record=True)
+        for game in range(5):
+            game_state = replay(start, result.game_moves(game))
+            assert game_state.is_over()
+            assert game_state.board.count_discs(Player.WHITE) == (
+                result.white_discs[game]
+            )
+
+
+def test_simulate_finished_game() -> None:
+    """It leaves games that are already over untouched."""
+    game_state = GameState.new_game(4).apply_move(Move.resign())
+    result = simulate([game_state], record=True)
+    assert result.game_moves(0) == []
+    assert result.black_discs[0] == result.white_discs[0] == 2
+
+
+def test_seed_is_reproducible() -> None:
+    """It plays the same games for the same seed."""
+    first = random_games(10, seed=3, record=True)
+    second = random_games(10, seed=3, record=True)
+    assert first.moves is not None and second.moves is not None
+    assert (first.moves == second.moves).all()
+
+
+def test_scores() -> None:
+    """It scores games from either player's point of view."""
+    result = random_games(50, 6, seed=0)
+    black = result.scores(Player.BLACK)
+    assert ((black + result.scores(Player.WHITE)) == 1).all()
+    assert ((black == 1) == (result.black_discs > result.white_discs)).all()
+
+
+def test_mixed_board_sizes() -> None:
+    """It raises `ValueError` for games with different board sizes."""
+    with pytest.raises(ValueError):
+        simulate([GameState.new_game(4), GameState.new_game(6)])
+
+
+def test_moves_not_recorded() -> None:
+    """It raises `ValueError` for moves of a batch played without recording."""
+    with pytest.raises(ValueError):
+        random_games(1, seed=0).game_moves(0)
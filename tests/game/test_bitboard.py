@@ -0,0 +1,130 @@
+"""Test cases for the bitboard module."""
+import random
+
+import pytest
+
+from othello.game.bitboard import BitBoard
+from othello.game.board import Board
+from othello.game.board import BoardSizeError, InvalidDiscPlacementError
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.game.point import Point
+
+
+@pytest.fixture
+def board() -> BitBoard:
+    """Returns a BitBoard instance with size 8."""
+    return BitBoard(8)
+
+
+def test_invalid_board_size() -> None:
+    """It raises `BoardSizeError` when size is invalid."""
+    with pytest.raises(BoardSizeError):
+        BitBoard(9)
+
+
+def test_initial_valid_moves_black(board: BitBoard) -> None:
+    """It returns black valid moves in the initial game state."""
+    valid_moves = board.get_valid_moves(Player.BLACK)
+    assert valid_moves == {
+        Point(3, 2): [Point(3, 3)],
+        Point(2, 3): [Point(3, 3)],
+        Point(5, 4): [Point(4, 4)],
+        Point(4, 5): [Point(4, 4)],
+    }
+
+
+def test_valid_disc_placement(board: BitBoard) -> None:
+    """It returns white valid moves after black's first move."""
+    board.place_disc(Player.BLACK, Point(2, 3))
+    valid_moves = board.get_valid_moves(Player.WHITE)
+    assert valid_moves == {
+        Point(2, 2): [Point(3, 3)],
+        Point(2, 4): [Point(3, 4)],
+        Point(4, 2): [Point(4, 3)],
+    }
+
+
+def test_invalid_disc_placement(board: BitBoard) -> None:
+    """It raises `InvalidDiscPlacementError` on invalid move for place_disc."""
+    with pytest.raises(InvalidDiscPlacementError):
+        board.place_disc(Player.BLACK, Point(0, 0))
+
+
+def test_occupied_disc_placement(board: BitBoard) -> None:
+    """It raises `InvalidDiscPlacementError` on an occupied square."""
+    with pytest.raises(InvalidDiscPlacementError):
+        board.place_disc(Player.BLACK, Point(3, 3))
+
+
+def test_off_grid_disc_placement(board: BitBoard) -> None:
+    """It raises `InvalidDiscPlacementError` off the board."""
+    with pytest.raises(InvalidDiscPlacementError):
+        board.place_disc(Player.BLACK, Point(8, 3))
+
+
+def test_count_discs(board: BitBoard) -> None:
+    """It counts the number of discs of each player on board."""
+    assert board.count_discs(Player.BLACK) == 2
+    assert board.count_discs(Player.WHITE) == 2
+
+
+def test_board_str_matches_board(board: BitBoard) -> None:
+    """It returns the same str representation as Board."""
+    assert str(board) == str(Board(8))
+
+
+@pytest.mark.parametrize("size", [4, 6, 8, 12, 18, 26])
+def test_random_games_match_board(size: int) -> None:
+    """It agrees with Board on every position of a random game."""
+    rng = random.Random(size)
+    reference = GameState.new_game(size)
+    game = GameState.new_game(size, BitBoard)
+    while not reference.is_over():
+        expected = reference.board.get_valid_moves(reference.current_player)
+        actual = game.board.get_valid_moves(game.current_player)
+        assert {point: sorted(flips) for point, flips in expected.items()} == {
+            point: sorted(flips) for point, flips in actual.items()
+        }
+        if expected:
+            move = Move.play(rng.choice(sorted(expected)))
+        else:
+            move = Move.pass_turn()
+        reference = reference.apply_move(move)
+        game = game.apply_move(move)
+    assert str(reference.board) == str(game.board)
+    for player in Player:
+        assert game.board.count_discs(player) == reference.board.count_discs(player)
+        assert game.board.get_masks(player) == reference.board.get_masks(player)
+
+
+def test_undo_move_restores_board(board: BitBoard) -> None:
+    """It restores the previous position when undoing moves."""
+    first = board.make_move(Player.BLACK, Point(2, 3))
+    second = board.make_move(Player.WHITE, Point(2, 2))
+    assert second.flips == [Point(3, 3)]
+    board.undo_move(second)
+    board.undo_move(first)
+    assert str(board) == str(BitBoard(8))
+
+
+def test_copy_is_independent(board: BitBoard) -> None:
+    """It returns a copy that is not affected by placements on the original."""
+    clone = board.copy()
+    board.place_disc(Player.BLACK, Point(2, 3))
+    assert clone.count_discs(Player.BLACK) == 2
+
+
+def test_get_player(board: BitBoard) -> None:
+    """It returns the owner of the disc at a point."""
+    assert board.get_player(Point(3, 3)) == Player.WHITE
+    assert board.get_player(Point(3, 4)) == Player.BLACK
+    assert board.get_player(Point(0, 0)) is None
+
+
+def test_from_board() -> None:
+    """It copies the discs of a Board."""
+    board = Board(6)
+    board.place_disc(Player.BLACK, Point(1, 2))
+    assert str(BitBoard.from_board(board)) == str(board)
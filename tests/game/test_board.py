@@ -1,10 +1,14 @@
 """Test cases for the board module."""
+import random
+import tracemalloc
+from typing import Callable, Tuple
+
 import pytest
 
-from othello.game.board import Board
+from othello.game.board import Board, get_rays, MAX_BOARD_SIZE, MIN_BOARD_SIZE
 from othello.game.board import BoardSizeError, InvalidDiscPlacementError
 from othello.game.player import Player
-from othello.game.point import Point
+from othello.game.point import get_points, Point
 
 
 @pytest.fixture
@@ -121,3 +125,143 @@ def test_board_str_size_8(board: Board) -> None:
  +---------------+
   a b c d e f g h """
     )
+
+
+def test_make_move_returns_flips(board: Board) -> None:
+    """It returns an undo token listing the flipped discs."""
+    undo = board.make_move(Player.BLACK, Point(2, 3))
+    assert undo.flips == [Point(3, 3)]
+    assert board.count_discs(Player.BLACK) == 4
+
+
+def test_undo_move_restores_board(board: Board) -> None:
+    """It restores the previous position when undoing moves."""
+    before = str(board)
+    first = board.make_move(Player.BLACK, Point(2, 3))
+    second = board.make_move(Player.WHITE, Point(2, 2))
+    board.undo_move(second)
+    board.undo_move(first)
+    assert str(board) == before
+    assert board.count_discs(Player.BLACK) == 2
+
+
+def test_copy_is_independent(board: Board) -> None:
+    """It returns a copy that is not affected by placements on the original."""
+    clone = board.copy()
+    board.place_disc(Player.BLACK, Point(2, 3))
+    assert str(clone) == str(Board(8))
+
+
+def test_count_discs_after_placement(board: Board) -> None:
+    """It keeps disc counts up to date after placements."""
+    board.place_disc(Player.BLACK, Point(2, 3))
+    board.place_disc(Player.WHITE, Point(2, 2))
+    assert board.count_discs(Player.BLACK) == 3
+    assert board.count_discs(Player.WHITE) == 3
+
+
+def test_valid_moves_after_undoing_random_game() -> None:
+    """It generates the initial moves again after a whole game is undone."""
+    rng = random.Random(0)
+    board = Board(6)
+    player = Player.BLACK
+    undos = []
+    passed = False
+    while True:
+        valid_moves = board.get_valid_moves(player)
+        if valid_moves:
+            undos.append(board.make_move(player, rng.choice(sorted(valid_moves))))
+            passed = False
+        elif passed:
+            break
+        else:
+            passed = True
+        player = player.other
+    for undo in reversed(undos):
+        board.undo_move(undo)
+    assert board.get_valid_moves(Player.BLACK) == Board(6).get_valid_moves(
+        Player.BLACK
+    )
+    assert board.count_discs(Player.BLACK) == 2
+
+
+def test_get_player(board: Board) -> None:
+    """It returns the owner of the disc at a point."""
+    assert board.get_player(Point(3, 3)) == Player.WHITE
+    assert board.get_player(Point(3, 4)) == Player.BLACK
+    assert board.get_player(Point(0, 0)) is None
+
+
+def test_get_masks(board: Board) -> None:
+    """It returns one bit per disc, from the given player's point of view."""
+    black = 1 << 28 | 1 << 35
+    white = 1 << 27 | 1 << 36
+    assert board.get_masks(Player.BLACK) == (black, white)
+    assert board.get_masks(Player.WHITE) == (white, black)
+
+
+def midgame_board() -> Tuple[Board, Player]:
+    """Returns an 8x8 board after 20 random moves and the player to move."""
+    rng = random.Random(0)
+    board = Board(8)
+    player = Player.BLACK
+    for _ in range(20):
+        board.place_disc(player, rng.choice(sorted(board.get_valid_moves(player))))
+        player = player.other
+    return board, player
+
+
+def count_live_blocks(function: Callable[[], object]) -> int:
+    """Returns the number of memory blocks allocated and kept alive by a call."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = function()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(filters).compare_to(
+        before.filter_traces(filters), "filename"
+    )
+    return sum(stat.count_diff for stat in stats)
+
+
+def test_valid_moves_allocations() -> None:
+    """It allocates only the result dict and flip lists for valid moves."""
+    board, player = midgame_board()
+    valid_moves = board.get_valid_moves(player)
+    blocks = count_live_blocks(lambda: board.get_valid_moves(player))
+    assert blocks <= len(valid_moves) + 2
+
+
+def test_make_move_allocations() -> None:
+    """It allocates little more than the undo token for a placement."""
+    board, player = midgame_board()
+    point, flips = max(board.get_valid_moves(player).items(), key=lambda m: len(m[1]))
+    assert len(flips) > 1
+    assert count_live_blocks(lambda: board.make_move(player, point)) <= 4
+
+
+def test_valid_moves_share_points(board: Board) -> None:
+    """It returns the cached Point instances of the board size."""
+    points = set(map(id, get_points(8)))
+    for point, flips in board.get_valid_moves(Player.BLACK).items():
+        assert id(point) in points
+        assert all(id(flip) in points for flip in flips)
+
+
+def test_rays_from_corner() -> None:
+    """It lists the squares towards each edge, nearest first."""
+    assert get_rays(4)[0] == ((1, 2, 3), (5, 10, 15), (4, 8, 12))
+
+
+@pytest.mark.parametrize("size", range(MIN_BOARD_SIZE, MAX_BOARD_SIZE + 1, 2))
+def test_rays_reach_edges(size: int) -> None:
+    """It builds rays for every square that reach every square in line."""
+    rays = get_rays(size)
+    assert len(rays) == size * size
+    corner = size * size - 1
+    assert sorted(map(len, rays[corner])) == [size - 1] * 3
+    if size > MIN_BOARD_SIZE:
+        center = size // 2 * size + size // 2
+        assert sum(map(len, rays[center])) == 4 * size - 5
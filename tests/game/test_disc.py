@@ -16,3 +16,9 @@ def test_get_black_disc() -> None:
 def test_get_white_disc() -> None:
     """It returns a black circle when passed white player."""
     assert get_disc(Player.WHITE) == "●"
+
+
+def test_discs_are_interned() -> None:
+    """It returns the same Disc instance on every call."""
+    assert get_disc(Player.BLACK) is get_disc(Player.BLACK)
+    assert get_disc() is get_disc()
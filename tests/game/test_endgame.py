@@ -0,0 +1,89 @@
+"""Test cases for the endgame module."""
+import random
+
+import pytest
+
+from othello.game.bitboard import BitBoard, flips_mask
+from othello.game.endgame import get_flips, parse_position, solve
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.game.point import Point
+from tests.helpers import minimax
+
+
+def random_position(size: int, empties: int, seed: int) -> GameState:
+    """Returns a position with the given number of empties from random play."""
+    rng = random.Random(seed)
+    game_state = GameState.new_game(size, BitBoard)
+    for _ in range(size * size - 4 - empties):
+        legal_moves = game_state.legal_moves()
+        move = Move.play(rng.choice(legal_moves)) if legal_moves else Move.pass_turn()
+        game_state = game_state.apply_move(move)
+    return game_state
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_solve_matches_minimax(seed: int) -> None:
+    """It finds the exact score and a move achieving it."""
+    game_state = random_position(6, 8, seed)
+    solution = solve(game_state)
+    assert solution.score == minimax(game_state)
+    assert solution.nodes > 0
+    assert solution.move is not None
+    next_state = game_state.apply_move(Move.play(solution.move))
+    assert -minimax(next_state) == solution.score
+
+
+def test_solve_pass() -> None:
+    """It scores a forced pass from the opponent's point of view."""
+    game_state = parse_position("XXXXXXXXXXXXXXO-", Player.WHITE)
+    solution = solve(game_state)
+    assert solution.move is None
+    assert solution.score == -16
+
+
+def test_solve_finished_game() -> None:
+    """It returns the disc difference when neither player can move."""
+    game_state = parse_position("XXXXXXXXXXXXOOO-")
+    assert solve(game_state) == (9, None, 1)
+    for _ in range(2):
+        game_state = game_state.apply_move(Move.pass_turn())
+    assert solve(game_state) == (9, None, 0)
+
+
+def test_solve_leaves_game_state_untouched() -> None:
+    """It does not modify the game state it solves."""
+    game_state = random_position(6, 8, 0)
+    before = str(game_state.board)
+    solve(game_state)
+    assert str(game_state.board) == before
+
+
+def test_get_flips_matches_bitboard() -> None:
+    """It finds the same flips as the bitboard move generator."""
+    for seed in range(5):
+        game_state = random_position(8, 20, seed)
+        own, opp = BitBoard.from_board(game_state.board).get_masks(Player.BLACK)
+        for square in range(64):
+            if not (own | opp) >> square & 1:
+                expected = flips_mask(own, opp, 1 << square, 8)
+                assert get_flips(own, opp, square, 8) == expected
+
+
+def test_parse_position() -> None:
+    """It reads discs row by row, ignoring whitespace."""
+    game_state = parse_position("-OX- ---- ---- ---X", Player.WHITE)
+    board = game_state.board
+    assert board.get_player(Point(0, 1)) == Player.WHITE
+    assert board.get_player(Point(0, 2)) == Player.BLACK
+    assert board.get_player(Point(3, 3)) == Player.BLACK
+    assert board.count_discs(Player.BLACK) == 2
+    assert game_state.current_player == Player.WHITE
+
+
+@pytest.mark.parametrize("text", ["XXX", "XOX?" * 4])
+def test_parse_invalid_position(text: str) -> None:
+    """It raises `ValueError` for text that is not a square board."""
+    with pytest.raises(ValueError):
+        parse_position(text)
@@ -1,6 +1,13 @@
 """Test cases for the board module."""
+import random
+from typing import Type
+from unittest.mock import Mock
+
 import pytest
 
+from othello.agent.random_bot import RandomBot
+from othello.game.backends import BACKENDS
+from othello.game.board import Board
 from othello.game.game_state import GameState, InvalidMoveError
 from othello.game.move import Move
 from othello.game.player import Player
@@ -119,3 +126,109 @@ def test_white_wins_with_more_discs(new_game: GameState) -> None:
 def test_game_draw(new_game: GameState) -> None:
     """It declares draw when same amount of white and black discs."""
     assert new_game.winner() is None
+
+
+def test_make_move_updates_in_place(new_game: GameState) -> None:
+    """It updates the GameState in place on make_move."""
+    board = new_game.board
+    new_game.make_move(Move.play(Point(3, 2)))
+    assert (
+        new_game.current_player == Player.WHITE
+        and new_game.board is board
+        and new_game.last_move == Move.play(Point(3, 2))
+        and board.count_discs(Player.BLACK) == 4
+    )
+
+
+def test_unmake_move_restores_state(new_game: GameState) -> None:
+    """It restores the GameState when unmaking moves."""
+    before = str(new_game.board)
+    first = new_game.make_move(Move.play(Point(3, 2)))
+    second = new_game.make_move(Move.play(Point(2, 2)))
+    new_game.unmake_move(second)
+    new_game.unmake_move(first)
+    assert (
+        str(new_game.board) == before
+        and new_game.current_player == Player.BLACK
+        and new_game.last_move is None
+        and new_game.second_last_move is None
+    )
+
+
+def test_make_move_illegal_play(new_game: GameState) -> None:
+    """It raises `InvalidMoveError` on illegal play in make_move."""
+    with pytest.raises(InvalidMoveError):
+        new_game.make_move(Move.play(Point(0, 0)))
+
+
+def test_make_move_illegal_pass(new_game: GameState) -> None:
+    """It raises `InvalidMoveError` on illegal pass in make_move."""
+    with pytest.raises(InvalidMoveError):
+        new_game.make_move(Move.pass_turn())
+
+
+def test_copy_has_own_board(new_game: GameState) -> None:
+    """It returns a copy whose board can be modified independently."""
+    game = new_game.copy()
+    game.make_move(Move.play(Point(3, 2)))
+    assert new_game.board.count_discs(Player.BLACK) == 2
+
+
+def test_valid_moves_generated_once(mocker: Mock, new_game: GameState) -> None:
+    """It generates the moves of a position once for every consumer."""
+    get_valid_moves = mocker.spy(new_game.board, "get_valid_moves")
+    new_game.legal_moves()
+    move = RandomBot().select_move(new_game)
+    next_game = new_game.apply_move(move)
+    new_game.legal_moves()
+    assert get_valid_moves.call_count == 1
+    assert str(next_game.board) == str(new_game.copy().apply_move(move).board)
+
+
+def test_pass_check_uses_valid_moves(mocker: Mock) -> None:
+    """It checks passes against the memoized moves."""
+    game = GameState.new_game(4)
+    assert game.legal_moves()
+    get_valid_moves = mocker.spy(game.board, "get_valid_moves")
+    with pytest.raises(InvalidMoveError):
+        game.apply_move(Move.pass_turn())
+    assert get_valid_moves.call_count == 0
+
+
+def test_memoized_illegal_play(new_game: GameState) -> None:
+    """It rejects plays missing from the memoized moves."""
+    new_game.legal_moves()
+    with pytest.raises(InvalidMoveError):
+        new_game.apply_move(Move.play(Point(3, 3)))
+    with pytest.raises(InvalidMoveError):
+        new_game.make_move(Move.play(Point(0, 0)))
+
+
+def test_unmake_move_restores_valid_moves(new_game: GameState) -> None:
+    """It memoizes moves per position across make_move and unmake_move."""
+    moves = new_game.valid_moves()
+    undo = new_game.make_move(Move.play(Point(3, 2)))
+    assert sorted(new_game.valid_moves()) == [Point(2, 2), Point(2, 4), Point(4, 2)]
+    new_game.unmake_move(undo)
+    assert new_game.valid_moves() is moves
+
+
+@pytest.mark.parametrize("board_type", BACKENDS.values())
+def test_known_flips_match_search(board_type: Type[Board]) -> None:
+    """It places discs with memoized flips exactly like without them."""
+    rng = random.Random(0)
+    game = GameState.new_game(6, board_type)
+    while not game.is_over():
+        points = game.legal_moves()
+        if not points:
+            game = game.apply_move(Move.pass_turn())
+            continue
+        point = rng.choice(points)
+        searched = game.board.copy()
+        searched.place_disc(game.current_player, point)
+        game = game.apply_move(Move.play(point))
+        assert str(game.board) == str(searched)
+        assert game.board.zobrist_hash == searched.zobrist_hash
+        assert sorted(game.board.get_valid_moves(Player.BLACK)) == sorted(
+            searched.get_valid_moves(Player.BLACK)
+        )
@@ -0,0 +1,80 @@
+"""Test cases for the perft module."""
+from typing import List, Type
+
+import pytest
+
+from othello.game.backends import BACKENDS
+from othello.game.board import Board
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.perft import divide, perft
+from othello.game.point import Point
+
+# Leaf node counts from the initial position at depths 1, 2, ...
+REFERENCE_COUNTS = {
+    4: [4, 12, 44, 128, 424, 1256, 3624, 9116],
+    6: [4, 12, 56, 244, 1364, 7604],
+    8: [4, 12, 56, 244, 1396, 8200],
+}
+
+
+@pytest.mark.parametrize("board_type", BACKENDS.values())
+@pytest.mark.parametrize("size", REFERENCE_COUNTS)
+def test_reference_counts(size: int, board_type: Type[Board]) -> None:
+    """It matches the reference leaf node counts."""
+    game_state = GameState.new_game(size, board_type)
+    counts: List[int] = [
+        perft(game_state, depth) for depth in range(1, len(REFERENCE_COUNTS[size]) + 1)
+    ]
+    assert counts == REFERENCE_COUNTS[size]
+
+
+def test_depth_zero() -> None:
+    """It counts the root as the only leaf at depth zero."""
+    assert perft(GameState.new_game(), 0) == 1
+
+
+def test_full_game_tree_4x4() -> None:
+    """It stops at finished games, so deep counts stop growing."""
+    game_state = GameState.new_game(4)
+    for point in [Point(1, 0), Point(0, 0), Point(0, 1), Point(0, 2)]:
+        game_state = game_state.apply_move(Move.play(point))
+    assert perft(game_state, 12) == perft(game_state, 20)
+
+
+def test_divide() -> None:
+    """It splits the leaf count between root moves."""
+    game_state = GameState.new_game()
+    counts = divide(game_state, 3)
+    assert [move.point for move, _ in counts] == game_state.legal_moves()
+    assert sum(nodes for _, nodes in counts) == 56
+
+
+def test_leaves_game_state_untouched() -> None:
+    """It does not modify the root game state."""
+    game_state = GameState.new_game()
+    perft(game_state, 3)
+    assert game_state.board.count_discs(game_state.current_player) == 2
+    assert game_state.last_move is None
+
+
+def test_counts_passes() -> None:
+    """It expands a pass when no disc can be placed."""
+    game_state = GameState.new_game(4)
+    for point in [
+        Point(1, 0),
+        Point(0, 0),
+        Point(0, 1),
+        Point(0, 2),
+        Point(1, 3),
+        Point(2, 0),
+        Point(3, 0),
+        Point(3, 2),
+        Point(3, 1),
+        Point(0, 3),
+        Point(3, 3),
+        Point(2, 3),
+    ]:
+        game_state = game_state.apply_move(Move.play(point))
+    assert not game_state.legal_moves()
+    assert divide(game_state, 2) == [(Move.pass_turn(), 1)]
@@ -0,0 +1,97 @@
+"""Test cases for the symmetry module."""
+import random
+
+from othello.game.bitboard import BitBoard
+from othello.game.game_state import GameState
+from othello.game.player import Player
+from othello.game.point import Point
+from othello.game.symmetry import (
+    canonical_key,
+    canonical_masks,
+    get_permutations,
+    get_symmetries,
+    inverse_point,
+    INVERSES,
+    transform_mask,
+    transform_point,
+)
+from tests.helpers import play
+
+
+def test_permutations_are_symmetries() -> None:
+    """It maps every square to a distinct square for all 8 symmetries."""
+    permutations = get_permutations(8)
+    assert len(set(permutations)) == 8
+    assert all(sorted(permutation) == list(range(64)) for permutation in permutations)
+
+
+def test_inverses() -> None:
+    """It undoes every symmetry with its inverse."""
+    permutations = get_permutations(6)
+    for symmetry, inverse in enumerate(INVERSES):
+        for square in range(36):
+            assert permutations[inverse][permutations[symmetry][square]] == square
+
+
+def test_transform_mask_matches_permutations() -> None:
+    """It moves every disc of a mask like the square permutations."""
+    rng = random.Random(0)
+    for size in (4, 8, 10):
+        mask = rng.getrandbits(size * size)
+        for symmetry, permutation in enumerate(get_permutations(size)):
+            expected = sum(
+                1 << permutation[square]
+                for square in range(size * size)
+                if mask >> square & 1
+            )
+            assert transform_mask(mask, symmetry, size) == expected
+
+
+def test_canonical_masks_of_images() -> None:
+    """It gives all 8 images of a position the same canonical form."""
+    rng = random.Random(1)
+    black = rng.getrandbits(64)
+    white = rng.getrandbits(64) & ~black
+    canonical = canonical_masks(black, white, 8)
+    assert canonical[:2] == (
+        transform_mask(black, canonical[2], 8),
+        transform_mask(white, canonical[2], 8),
+    )
+    for symmetry in range(8):
+        image = transform_mask(black, symmetry, 8), transform_mask(white, symmetry, 8)
+        assert canonical_masks(*image, 8)[:2] == canonical[:2]
+
+
+def test_symmetries_of_initial_position() -> None:
+    """It finds the symmetries leaving the initial position unchanged."""
+    black, white = GameState.new_game().board.get_masks(Player.BLACK)
+    assert get_symmetries(black, white, 8) == [0, 2, 6, 7]
+
+
+def test_canonical_key_of_symmetric_openings() -> None:
+    """It gives the four symmetric opening moves the same key."""
+    openings = [Point(2, 3), Point(3, 2), Point(4, 5), Point(5, 4)]
+    keys = {canonical_key(play([point]))[0] for point in openings}
+    assert len(keys) == 1
+
+
+def test_canonical_key_includes_side() -> None:
+    """It tells positions apart by the player to move."""
+    game_state = play([Point(2, 3)])
+    passed = GameState(game_state.board, game_state.current_player.other)
+    assert canonical_key(game_state)[0] != canonical_key(passed)[0]
+
+
+def test_canonical_key_of_any_board() -> None:
+    """It gives the same key whatever the board implementation."""
+    game_state = play([Point(2, 3), Point(2, 2)])
+    bitboard = BitBoard.from_board(game_state.board)
+    assert canonical_key(game_state) == canonical_key(GameState(bitboard, Player.BLACK))
+
+
+def test_inverse_point() -> None:
+    """It maps transformed points back to where they came from."""
+    for symmetry in range(8):
+        for point in (Point(0, 1), Point(2, 5), Point(7, 7)):
+            image = transform_point(point, symmetry, 8)
+            assert inverse_point(image, symmetry, 8) == point
@@ -0,0 +1,66 @@
+"""Test cases for the zobrist module."""
+import random
+
+from othello.game import zobrist
+from othello.game.bitboard import BitBoard
+from othello.game.board import Board
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.game.point import Point
+
+
+def test_keys_are_stable() -> None:
+    """It returns the same keys for the same board size."""
+    zobrist.get_keys.cache_clear()
+    first = zobrist.get_keys(8)
+    zobrist.get_keys.cache_clear()
+    assert zobrist.get_keys(8) == first
+
+
+def test_disc_key() -> None:
+    """It returns the key of a disc on a point."""
+    keys = zobrist.get_keys(8)
+    assert zobrist.disc_key(8, Player.WHITE, Point(1, 2)) == keys.white[10]
+
+
+def test_hash_follows_moves_and_undos() -> None:
+    """It updates the hash incrementally as moves are made and undone."""
+    rng = random.Random(1)
+    board = Board(8)
+    bitboard = BitBoard(8)
+    initial = board.zobrist_hash
+    player = Player.BLACK
+    undos = []
+    for _ in range(20):
+        valid_moves = board.get_valid_moves(player)
+        if not valid_moves:
+            break
+        point = rng.choice(sorted(valid_moves))
+        undos.append(board.make_move(player, point))
+        bitboard.place_disc(player, point)
+        assert board.zobrist_hash == bitboard.zobrist_hash == board._hash_discs()
+        player = player.other
+    for undo in reversed(undos):
+        board.undo_move(undo)
+    assert board.zobrist_hash == initial
+
+
+def test_game_state_hash_includes_side_to_move() -> None:
+    """It hashes the same board differently for each player to move."""
+    game = GameState.new_game()
+    passed = GameState(game.board, Player.WHITE)
+    assert game.zobrist_hash != passed.zobrist_hash
+    assert game.zobrist_hash == game.board.zobrist_hash
+
+
+def test_transposed_move_orders_hash_equal() -> None:
+    """It gives the same hash to positions reached by different move orders."""
+    first = GameState.new_game()
+    second = GameState.new_game()
+    for point in [Point(2, 3), Point(2, 2), Point(3, 2)]:
+        first = first.apply_move(Move.play(point))
+    for point in [Point(3, 2), Point(2, 2), Point(2, 3)]:
+        second = second.apply_move(Move.play(point))
+    assert str(first.board) == str(second.board)
+    assert first.zobrist_hash == second.zobrist_hash
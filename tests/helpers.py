@@ -0,0 +1,38 @@
+"""Helpers shared by the test cases."""
+from typing import Any, Dict, List, Optional
+
+from othello.agent.random_bot import RandomBot
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.point import Point
+from othello.match import play_game
+from othello.record import GameRecord
+
+
+def minimax(game_state: GameState) -> int:
+    """Returns the exact final disc difference for the player to move."""
+    player = game_state.current_player
+    if game_state.is_over():
+        board = game_state.board
+        return board.count_discs(player) - board.count_discs(player.other)
+    moves = [Move.play(point) for point in game_state.legal_moves()]
+    return max(
+        -minimax(game_state.apply_move(move)) for move in moves or [Move.pass_turn()]
+    )
+
+
+def play(points: List[Point], board_size: int = 8) -> GameState:
+    """Returns the game state after playing the given points."""
+    game_state = GameState.new_game(board_size)
+    for point in points:
+        game_state = game_state.apply_move(Move.play(point))
+    return game_state
+
+
+def play_record(
+    board_size: int = 6, metadata: Optional[Dict[str, Any]] = None
+) -> GameRecord:
+    """Returns the record of a random game."""
+    moves: List[Move] = []
+    game_state = play_game(RandomBot(), RandomBot(), board_size, moves=moves)
+    return GameRecord.from_game(game_state, moves, "random", "random", metadata)
@@ -0,0 +1,102 @@
+"""Test cases for the book module."""
+from pathlib import Path
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from othello.agent.alphabeta_bot import AlphaBetaBot
+from othello.agent.random_bot import RandomBot
+from othello.book import BookFormatError, OpeningBook, self_play, write_book
+from othello.game.game_state import GameState
+from othello.game.point import Point
+from tests.helpers import play
+
+
+@pytest.fixture
+def book_path(tmp_path: Path) -> str:
+    """Returns the path of a book built from random self-play games."""
+    path = str(tmp_path / "book.bin")
+    write_book(self_play(RandomBot, 20, seed=1), path, plies=6)
+    return path
+
+
+def test_lookup_initial_position(book_path: str) -> None:
+    """It merges the symmetric opening moves into one book move."""
+    with OpeningBook(book_path) as book:
+        moves = book.lookup(GameState.new_game())
+        assert len(moves) == 1 and moves[0].games == 20
+        assert moves[0].point in GameState.new_game().legal_moves()
+
+
+def test_book_moves_are_legal_in_every_orientation(book_path: str) -> None:
+    """It maps book moves back to legal moves of the position looked up."""
+    with OpeningBook(book_path) as book:
+        for points in ([Point(2, 3)], [Point(5, 4)], [Point(4, 5), Point(5, 5)]):
+            game_state = play(points)
+            moves = book.lookup(game_state)
+            assert moves
+            assert all(move.point in game_state.legal_moves() for move in moves)
+
+
+def test_lookup_missing_position(book_path: str) -> None:
+    """It returns no moves for positions outside the book."""
+    with OpeningBook(book_path) as book:
+        assert book.lookup(GameState.new_game(6)) == []
+        assert book.best_move(GameState.new_game(6)) is None
+
+
+def test_records_sorted_by_key(book_path: str) -> None:
+    """It writes records sorted by key so they can be binary searched."""
+    with OpeningBook(book_path) as book:
+        keys = [book._record_at(position)[0] for position in range(len(book))]
+    assert keys == sorted(keys)
+
+
+def test_not_a_book(tmp_path: Path) -> None:
+    """It raises `BookFormatError` for files that are not books."""
+    path = tmp_path / "book.bin"
+    path.write_bytes(b"not a book at all")
+    with pytest.raises(BookFormatError):
+        OpeningBook(str(path))
+
+
+def test_empty_file_not_a_book(tmp_path: Path) -> None:
+    """It raises `BookFormatError` for empty files."""
+    path = tmp_path / "book.bin"
+    path.write_bytes(b"")
+    with pytest.raises(BookFormatError):
+        OpeningBook(str(path))
+
+
+def test_counts_saturate_together(mocker: Mock, tmp_path: Path) -> None:
+    """It stops counting a move once its game count saturates."""
+    mocker.patch("othello.book.MAX_COUNT", 3)
+    path = str(tmp_path / "book.bin")
+    records = list(self_play(RandomBot, 8, seed=1))
+    write_book(records, path, plies=1)
+    with OpeningBook(path) as book:
+        (move,) = book.lookup(GameState.new_game())
+    write_book(records[:3], path, plies=1)
+    with OpeningBook(path) as book:
+        assert book.lookup(GameState.new_game()) == [move]
+
+
+def test_pickle_reopens_book(book_path: str) -> None:
+    """It sends the book to other processes by its path."""
+    with OpeningBook(book_path) as book:
+        with pickle.loads(pickle.dumps(book)) as copy:
+            assert copy.path == book_path
+            assert copy.lookup(GameState.new_game()) == book.lookup(
+                GameState.new_game()
+            )
+
+
+def test_agent_plays_book_move(book_path: str) -> None:
+    """It plays the book move without searching."""
+    with OpeningBook(book_path) as book:
+        game_state = GameState.new_game()
+        bot = AlphaBetaBot(time_limit=10, book=book)
+        move = bot.select_move(game_state)
+        assert move.point == book.best_move(game_state)
+        assert bot.last_search is not None and bot.last_search.nodes == 0
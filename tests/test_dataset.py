@@ -0,0 +1,62 @@
+"""Test cases for the dataset module."""
+from pathlib import Path
+
+import pytest
+
+from othello.dataset import (
+    DatasetFormatError,
+    HEADER,
+    positions,
+    read_header,
+    RECORD,
+    write_dataset,
+)
+from othello.game.player import Player
+from tests.helpers import play_record
+
+
+def test_positions_replay_game() -> None:
+    """It yields every position before the end from the mover's side."""
+    record = play_record()
+    states = list(record.states())[:-1]
+    rows = list(positions(record))
+    assert len(rows) == len(states)
+    difference = record.black_discs - record.white_discs
+    for game_state, (own, opp, player, score) in zip(states, rows):
+        mover = game_state.current_player
+        assert player == mover.value
+        assert (own, opp) == game_state.board.get_masks(mover)
+        assert score == (difference if mover == Player.BLACK else -difference)
+
+
+def test_write_dataset(tmp_path: Path) -> None:
+    """It writes a header and one fixed-width record per position."""
+    path = str(tmp_path / "positions.bin")
+    records = [play_record() for _ in range(3)]
+    count = write_dataset(records, path, board_size=6)
+    assert count == sum(len(list(positions(record))) for record in records)
+    assert read_header(path) == (6, count)
+    data = Path(path).read_bytes()
+    assert len(data) == HEADER.size + count * RECORD.size
+    first = next(positions(records[0]))
+    assert RECORD.unpack_from(data, HEADER.size) == first
+
+
+def test_write_dataset_rejects_other_sizes(tmp_path: Path) -> None:
+    """It raises `ValueError` for games that do not fit the dataset."""
+    path = str(tmp_path / "positions.bin")
+    with pytest.raises(ValueError):
+        write_dataset([play_record(4)], path, board_size=6)
+    with pytest.raises(ValueError):
+        write_dataset([], path, board_size=10)
+
+
+@pytest.mark.parametrize(
+    "data", [b"", b"OTHB\x08\x00\x00\x00", b"OTHD\x08\x00\x00\x00x"]
+)
+def test_read_header_invalid(tmp_path: Path, data: bytes) -> None:
+    """It raises `DatasetFormatError` for files that are not datasets."""
+    path = tmp_path / "positions.bin"
+    path.write_bytes(data)
+    with pytest.raises(DatasetFormatError):
+        read_header(str(path))
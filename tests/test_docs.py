@@ -0,0 +1,32 @@
+"""Test cases for the reference documentation."""
+import importlib.util
+from pathlib import Path
+import re
+from typing import List
+
+import pytest
+
+REFERENCE = Path(__file__).parent.parent / "docs" / "reference"
+
+
+def automodules(path: Path) -> List[str]:
+    """Return the modules documented by a reference page."""
+    return re.findall(r"^\.\. automodule:: (\S+)$", path.read_text(), re.MULTILINE)
+
+
+@pytest.mark.parametrize(
+    "path", sorted(REFERENCE.glob("*.rst")), ids=lambda path: path.name
+)
+def test_automodules_exist(path: Path) -> None:
+    """It documents only modules that exist."""
+    for module in automodules(path):
+        assert importlib.util.find_spec(module) is not None, module
+
+
+@pytest.mark.parametrize(
+    "path", sorted(REFERENCE.glob("*.rst")), ids=lambda path: path.name
+)
+def test_automodules_unique(path: Path) -> None:
+    """It documents each module once."""
+    modules = automodules(path)
+    assert len(modules) == len(set(modules))
@@ -0,0 +1,111 @@
+"""Test cases for the instrument module."""
+import io
+import json
+from pathlib import Path
+import pstats
+from typing import Any, Dict, List
+
+import pytest
+
+from othello.agent.alphabeta_bot import AlphaBetaBot
+from othello.agent.random_bot import RandomBot
+from othello.game.bitboard import BitBoard
+from othello.game.board import Board
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.instrument import Instrument, InstrumentedAgent, MoveStats
+from othello.match import play_game
+
+
+def read_stats(path: Path) -> List[Dict[str, Any]]:
+    """Read the statistics file written by an instrument."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_records_every_move(tmp_path: Path) -> None:
+    """It writes one line per selected move, numbering the plies."""
+    path = tmp_path / "stats.jsonl"
+    moves: List[Move] = []
+    with Instrument(str(path)) as instrument:
+        black = instrument.wrap(RandomBot(), "black bot", 0)
+        white = instrument.wrap(RandomBot(), "white bot", 0)
+        play_game(black, white, board_size=4, moves=moves)
+    stats = read_stats(path)
+    assert [line["ply"] for line in stats] == list(range(1, len(moves) + 1))
+    assert stats[0]["player"] == "black" and stats[0]["agent"] == "black bot"
+    assert stats[1]["player"] == "white" and stats[1]["agent"] == "white bot"
+    assert all(line["move_generations"] >= 1 for line in stats)
+    assert stats[0]["nodes"] is None and stats[0]["cache_hits"] is None
+
+
+def test_records_search_statistics(tmp_path: Path) -> None:
+    """It copies the search statistics and table probes of the agent."""
+    path = tmp_path / "stats.jsonl"
+    agent = AlphaBetaBot(max_depth=3, solve_empties=0)
+    with Instrument(str(path)) as instrument:
+        wrapped = instrument.wrap(agent, "alphabeta", 0)
+        wrapped.select_move(GameState.new_game(6, BitBoard))
+    (line,) = read_stats(path)
+    assert agent.last_search is not None
+    assert wrapped.last_search is agent.last_search
+    assert line["nodes"] == agent.last_search.nodes
+    assert line["depth"] == 3
+    assert line["cache_hits"] + line["cache_misses"] > 0
+    assert line["cache_hits"] == agent.table.hits
+
+
+def test_counts_board_copies(tmp_path: Path) -> None:
+    """It counts board copies made while selecting a move."""
+
+    class CopyingBot(RandomBot):
+        def select_move(self, game_state: GameState) -> Move:
+            game_state.board.copy().copy()
+            return super().select_move(game_state)
+
+    path = tmp_path / "stats.jsonl"
+    with Instrument(str(path)) as instrument:
+        instrument.wrap(CopyingBot(), "copier", 0).select_move(GameState.new_game())
+    assert read_stats(path)[0]["board_copies"] == 2
+
+
+def test_restores_board_methods(tmp_path: Path) -> None:
+    """It leaves the board methods untouched once closed."""
+    methods = [Board.copy, Board.get_valid_moves, BitBoard.get_valid_moves]
+    with Instrument(str(tmp_path / "stats.jsonl")):
+        assert Board.copy is not methods[0]
+        assert BitBoard.get_valid_moves is not methods[2]
+    assert [Board.copy, Board.get_valid_moves, BitBoard.get_valid_moves] == methods
+
+
+def test_profiles_selected_ply(tmp_path: Path) -> None:
+    """It runs the selected ply of every game under the profiler."""
+    path = tmp_path / "stats.jsonl"
+    with Instrument(str(path), profile_ply=2) as instrument:
+        for game in range(2):
+            play_game(
+                instrument.wrap(RandomBot(), "first", game),
+                instrument.wrap(RandomBot(), "second", game),
+                board_size=4,
+            )
+    stats = read_stats(path)
+    assert [(line["game"], line["ply"]) for line in stats if line["profiled"]] == [
+        (0, 2),
+        (1, 2),
+    ]
+    output = io.StringIO()
+    pstats.Stats(str(path) + ".prof", stream=output).print_stats()
+    assert "select_move" in output.getvalue()
+
+
+def test_write_requires_open_instrument(tmp_path: Path) -> None:
+    """It refuses to write statistics before it is opened."""
+    instrument = Instrument(str(tmp_path / "stats.jsonl"))
+    with pytest.raises(ValueError):
+        instrument.write(MoveStats(0, 1, "black", "random", "d3", 0.0))
+
+
+def test_instrumented_agent_time_limit(tmp_path: Path) -> None:
+    """It keeps the time limit of the wrapped agent."""
+    instrument = Instrument(str(tmp_path / "stats.jsonl"))
+    wrapped = InstrumentedAgent(RandomBot(time_limit=2.0), instrument, "random", 0)
+    assert wrapped.time_limit == 2.0
@@ -0,0 +1,18 @@
+"""Test cases for the loadgen module."""
+from othello.loadgen import LoadResult
+
+
+def test_load_result_rates() -> None:
+    """It divides sessions and moves by the elapsed time."""
+    result = LoadResult(10, 20, 1200, seconds=2.0)
+    assert result.sessions_per_second == 5.0
+    assert result.moves_per_second == 600.0
+    assert str(result).splitlines() == [
+        "10 sessions, 20 games, 1200 moves in 2.00s",
+        "5.0 sessions/s, 600 moves/s",
+    ]
+
+
+def test_load_result_without_time() -> None:
+    """It reports no throughput before any time has passed."""
+    assert LoadResult().moves_per_second == LoadResult().sessions_per_second == 0.0
@@ -0,0 +1,261 @@
+"""Test cases for the command-line interface."""
+from pathlib import Path
+from unittest.mock import Mock
+
+from _pytest.capture import CaptureFixture
+import pytest
+
+from othello import __main__, loadgen, server
+from othello.agent.pattern import default_weights, write_weights
+from othello.agent.random_bot import RandomBot
+from othello.dataset import read_header
+from othello.record import read_records
+
+
+@pytest.fixture
+def agents(mocker: Mock) -> None:
+    """Registers the random bot as the only agent."""
+    mocker.patch.object(__main__, "get_agents", return_value={"random": RandomBot})
+
+
+def test_parser_defaults() -> None:
+    """It defaults to an interactive game between humans."""
+    args = __main__.get_parser(["human"]).parse_args([])
+    assert args.command is None
+    assert args.black == args.white == "human"
+
+
+def test_match_command(
+    mocker: Mock, capsys: CaptureFixture, agents: None
+) -> None:
+    """It plays headless games and prints the results."""
+    mocker.patch("sys.argv", ["othello", "match", "random", "random", "-n", "2"])
+    __main__.main()
+    output = capsys.readouterr().out
+    assert output.startswith("random vs random:")
+    assert "2 games in" in output
+
+
+def test_match_command_record(mocker: Mock, agents: None, tmp_path: Path) -> None:
+    """It appends the games played to a record file."""
+    path = str(tmp_path / "games.jsonl")
+    argv = ["othello", "match", "random", "random", "-n", "2", "-s", "4"]
+    for _ in range(2):
+        mocker.patch("sys.argv", argv + ["--record", path])
+        __main__.main()
+    records = list(read_records(path))
+    assert len(records) == 4
+    assert all(record.black == record.white == "random" for record in records)
+
+
+def test_match_command_stats(mocker: Mock, agents: None, tmp_path: Path) -> None:
+    """It writes per-move statistics and the profile of the selected ply."""
+    path = tmp_path / "stats.jsonl"
+    argv = ["othello", "match", "random", "random", "-n", "1", "-s", "4"]
+    mocker.patch("sys.argv", argv + ["--stats", str(path), "--profile-ply", "1"])
+    __main__.main()
+    assert path.read_text().startswith('{"game": 0, "ply": 1')
+    assert (tmp_path / "stats.jsonl.prof").exists()
+
+
+def test_match_command_profile_without_stats(mocker: Mock, agents: None) -> None:
+    """It exits when asked to profile without a statistics file."""
+    argv = ["othello", "match", "random", "random", "--profile-ply", "1"]
+    mocker.patch("sys.argv", argv)
+    with pytest.raises(SystemExit, match="requires --stats"):
+        __main__.main()
+
+
+def test_match_time_limit(mocker: Mock, agents: None) -> None:
+    """It passes the time limit given after the match command."""
+    run_match = mocker.patch.object(__main__, "run_match")
+    mocker.patch("sys.argv", ["othello", "match", "random", "random", "-t", "0.5"])
+    __main__.main()
+    assert run_match.call_args.args[4] == 0.5
+
+
+def test_perft_command(mocker: Mock, capsys: CaptureFixture) -> None:
+    """It prints leaf counts per root move and the total."""
+    mocker.patch.object(__main__, "get_agents", return_value={})
+    mocker.patch(
+        "sys.argv", ["othello", "perft", "-d", "2", "--backend", "bitboard", "--divide"]
+    )
+    __main__.main()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:5] == ["d3: 3", "c4: 3", "f5: 3", "e6: 3", "Nodes: 12"]
+
+
+def test_simulate_command(mocker: Mock, capsys: CaptureFixture) -> None:
+    """It plays random games one at a time and prints the results."""
+    mocker.patch.object(__main__, "get_agents", return_value={})
+    mocker.patch(
+        "sys.argv", ["othello", "simulate", "-n", "3", "-s", "4", "--sequential"]
+    )
+    __main__.main()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("Black wins: ")
+    assert lines[1] == "Games: 3"
+
+
+def test_simulate_command_record(mocker: Mock, tmp_path: Path) -> None:
+    """It records random games played one at a time."""
+    mocker.patch.object(__main__, "get_agents", return_value={})
+    path = str(tmp_path / "games.jsonl.gz")
+    mocker.patch(
+        "sys.argv",
+        ["othello", "simulate", "-n", "3", "-s", "4", "--sequential", "--record", path],
+    )
+    __main__.main()
+    records = list(read_records(path))
+    assert len(records) == 3
+    assert all(record.black == record.white == "random" for record in records)
+
+
+def test_dataset_command(
+    mocker: Mock, capsys: CaptureFixture, tmp_path: Path
+) -> None:
+    """It exports the positions of recorded games."""
+    mocker.patch.object(__main__, "get_agents", return_value={})
+    records = str(tmp_path / "games.jsonl")
+    output = str(tmp_path / "positions.bin")
+    argv = ["othello", "simulate", "-n", "2", "-s", "4", "--sequential"]
+    mocker.patch("sys.argv", argv + ["--record", records])
+    __main__.main()
+    capsys.readouterr()
+    mocker.patch("sys.argv", ["othello", "dataset", records, output, "-s", "4"])
+    __main__.main()
+    assert capsys.readouterr().out.startswith("Wrote ")
+    assert read_header(output)[0] == 4
+
+
+def test_dataset_command_invalid_records(mocker: Mock, tmp_path: Path) -> None:
+    """It exits with an error when the records cannot be read."""
+    mocker.patch.object(__main__, "get_agents", return_value={})
+    records = tmp_path / "games.jsonl"
+    records.write_text("not json\n")
+    output = str(tmp_path / "positions.bin")
+    mocker.patch("sys.argv", ["othello", "dataset", str(records), output])
+    with pytest.raises(SystemExit, match="games.jsonl:1"):
+        __main__.main()
+
+
+def test_book_command(
+    mocker: Mock, capsys: CaptureFixture, agents: None, tmp_path: Path
+) -> None:
+    """It builds an opening book from self-play games."""
+    path = str(tmp_path / "book.bin")
+    mocker.patch("sys.argv", ["othello", "book", path, "-n", "2", "-p", "4"])
+    __main__.main()
+    assert capsys.readouterr().out.startswith("Wrote ")
+    assert (tmp_path / "book.bin").stat().st_size > 0
+
+
+def test_match_command_book(mocker: Mock, agents: None, tmp_path: Path) -> None:
+    """It opens the opening book and offers it to the agents."""
+    path = str(tmp_path / "book.bin")
+    mocker.patch("sys.argv", ["othello", "book", path, "-n", "2", "-p", "4"])
+    __main__.main()
+    run_match = mocker.patch.object(__main__, "run_match")
+    mocker.patch("sys.argv", ["othello", "match", "random", "random", "--book", path])
+    __main__.main()
+    assert run_match.call_args.kwargs["options"]["book"].path == path
+
+
+def test_match_command_invalid_book(
+    mocker: Mock, agents: None, tmp_path: Path
+) -> None:
+    """It exits with an error for files that are not opening books."""
+    path = tmp_path / "book.bin"
+    path.write_bytes(b"")
+    argv = ["othello", "match", "random", "random", "--book", str(path)]
+    mocker.patch("sys.argv", argv)
+    with pytest.raises(SystemExit, match="Cannot read opening book"):
+        __main__.main()
+
+
+def test_match_command_weights(mocker: Mock, agents: None, tmp_path: Path) -> None:
+    """It loads the pattern weights into an evaluator for the agents."""
+    path = str(tmp_path / "weights.bin")
+    write_weights(default_weights(6), path)
+    run_match = mocker.patch.object(__main__, "run_match")
+    argv = ["othello", "match", "random", "random", "--weights", path]
+    mocker.patch("sys.argv", argv)
+    __main__.main()
+    evaluator = run_match.call_args.kwargs["options"]["evaluator"]
+    assert evaluator.weights.size == 6
+
+
+def test_match_command_invalid_weights(
+    mocker: Mock, agents: None, tmp_path: Path
+) -> None:
+    """It exits with an error for files that are not weights files."""
+    path = tmp_path / "weights.bin"
+    path.write_bytes(b"")
+    argv = ["othello", "match", "random", "random", "--weights", str(path)]
+    mocker.patch("sys.argv", argv)
+    with pytest.raises(SystemExit, match="Cannot read pattern weights"):
+        __main__.main()
+
+
+def test_match_command_search_jobs(mocker: Mock, agents: None) -> None:
+    """It offers the number of search processes to the agents."""
+    run_match = mocker.patch.object(__main__, "run_match")
+    argv = ["othello", "match", "random", "random", "--search-jobs", "2"]
+    mocker.patch("sys.argv", argv)
+    __main__.main()
+    assert run_match.call_args.kwargs["options"] == {"jobs": 2}
+
+
+def test_solve_command(mocker: Mock, capsys: CaptureFixture) -> None:
+    """It prints the best move and exact score of a position."""
+    mocker.patch.object(__main__, "get_agents", return_value={})
+    mocker.patch("sys.argv", ["othello", "solve", "XXXXXXXXXXXXXXO-"])
+    __main__.main()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:2] == ["Best move: d4", "Score: +16"]
+
+
+def test_solve_command_invalid_position(mocker: Mock) -> None:
+    """It exits with an error for positions that are not square boards."""
+    mocker.patch.object(__main__, "get_agents", return_value={})
+    mocker.patch("sys.argv", ["othello", "solve", "XXX"])
+    with pytest.raises(SystemExit):
+        __main__.main()
+
+
+def test_serve_command(mocker: Mock, agents: None) -> None:
+    """It serves the registered agents on the default port."""
+    serve = mocker.patch("othello.server.serve")
+    mocker.patch("sys.argv", ["othello", "serve", "--workers", "4"])
+    __main__.main()
+    assert serve.call_args.args == (
+        {"random": RandomBot},
+        "127.0.0.1",
+        server.DEFAULT_PORT,
+        None,
+        4,
+        {},
+    )
+
+
+def test_loadgen_command(mocker: Mock, capsys: CaptureFixture) -> None:
+    """It prints the throughput of the load test."""
+    mocker.patch.object(__main__, "get_agents", return_value={})
+
+    async def load(*args: object) -> loadgen.LoadResult:
+        return loadgen.LoadResult(2, 2, 120, seconds=1.0)
+
+    run_load = mocker.patch("othello.loadgen.run_load", side_effect=load)
+    mocker.patch("sys.argv", ["othello", "loadgen", "-c", "2", "-p", "9000"])
+    __main__.main()
+    assert run_load.call_args.args[:3] == ("127.0.0.1", 9000, 2)
+    assert "120 moves/s" in capsys.readouterr().out
+
+
+def test_loadgen_command_unreachable(mocker: Mock) -> None:
+    """It exits with an error when the server cannot be reached."""
+    mocker.patch.object(__main__, "get_agents", return_value={})
+    mocker.patch("asyncio.open_connection", side_effect=ConnectionRefusedError())
+    mocker.patch("sys.argv", ["othello", "loadgen", "-c", "1"])
+    with pytest.raises(SystemExit, match="Load test failed"):
+        __main__.main()
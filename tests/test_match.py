@@ -0,0 +1,118 @@
+"""Test cases for the match module."""
+import json
+from pathlib import Path
+from typing import List
+from unittest.mock import Mock
+
+from othello.agent.random_bot import RandomBot
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.game.point import Point
+from othello.instrument import Instrument
+from othello.match import MatchResult, play_game, run_match
+from othello.record import GameRecord
+
+
+def test_play_game_finishes() -> None:
+    """It plays a game to the end."""
+    game_state = play_game(RandomBot(), RandomBot(), board_size=6)
+    assert game_state.is_over()
+
+
+def test_run_match_counts_games() -> None:
+    """It records the result of every game."""
+    result = run_match(RandomBot, RandomBot, games=6, board_size=4)
+    assert result.games == 6
+    assert result.first == result.second == "RandomBot"
+    assert result.seconds > 0 and result.games_per_second > 0
+
+
+def test_run_match_names() -> None:
+    """It reports the agents under the given names."""
+    records: List[GameRecord] = []
+    result = run_match(
+        RandomBot,
+        RandomBot,
+        games=2,
+        board_size=4,
+        on_game=records.append,
+        names=("first", "second"),
+    )
+    assert (result.first, result.second) == ("first", "second")
+    assert {(record.black, record.white) for record in records} == {
+        ("first", "second"),
+        ("second", "first"),
+    }
+
+
+def test_run_match_closes_agents(mocker: Mock) -> None:
+    """It closes both agents after every game."""
+    close = mocker.patch.object(RandomBot, "close")
+    run_match(RandomBot, RandomBot, games=2, board_size=4)
+    assert close.call_count == 4
+
+
+def test_play_game_records_moves() -> None:
+    """It appends every move played to the given list."""
+    moves: List[Move] = []
+    game_state = play_game(RandomBot(), RandomBot(), board_size=4, moves=moves)
+    replayed = GameState.new_game(4)
+    for move in moves:
+        replayed = replayed.apply_move(move)
+    assert replayed.is_over()
+    assert str(replayed.board) == str(game_state.board)
+
+
+def test_run_match_on_game() -> None:
+    """It passes the record of every game as soon as it ends."""
+    records: List[GameRecord] = []
+    run_match(RandomBot, RandomBot, games=2, board_size=4, on_game=records.append)
+    assert len(records) == 2
+    assert all(record.board_size == 4 and record.moves for record in records)
+
+
+def test_run_match_alternates_colors(mocker: Mock) -> None:
+    """It swaps colors between consecutive games."""
+    play = mocker.patch("othello.match.play_game", return_value=Mock())
+    mocker.patch.object(MatchResult, "add_game")
+    run_match(RandomBot, Mock, games=2)
+    first_game, second_game = play.call_args_list
+    assert isinstance(first_game.args[0], RandomBot)
+    assert isinstance(second_game.args[1], RandomBot)
+
+
+def test_add_game_win() -> None:
+    """It counts a win and the disc differential for the first agent."""
+    game_state = GameState.new_game().apply_move(Move.play(Point(3, 2)))
+    result = MatchResult("first", "second")
+    result.add_game(game_state, Player.BLACK)
+    assert (result.wins, result.losses, result.draws) == (1, 0, 0)
+    assert result.average_differential == 3
+
+
+def test_add_game_loss_and_draw() -> None:
+    """It counts losses and draws for the first agent."""
+    result = MatchResult("first", "second")
+    result.add_game(GameState.new_game().apply_move(Move.resign()), Player.BLACK)
+    result.add_game(GameState.new_game(), Player.WHITE)
+    assert (result.wins, result.losses, result.draws) == (0, 1, 1)
+
+
+def test_str() -> None:
+    """It summarizes the match."""
+    result = MatchResult("first", "second", 2, 1, 1, 8, seconds=2.0)
+    assert str(result) == (
+        "first vs second: 2 wins, 1 losses, 1 draws\n"
+        "Average disc differential: +2.00\n"
+        "4 games in 2.00s (2.00 games/s)"
+    )
+
+
+def test_run_match_instrument(tmp_path: Path) -> None:
+    """It records the moves of both agents in every game."""
+    path = tmp_path / "stats.jsonl"
+    with Instrument(str(path)) as instrument:
+        run_match(RandomBot, RandomBot, games=2, board_size=4, instrument=instrument)
+    games = {json.loads(line)["game"] for line in path.read_text().splitlines()}
+    assert games == {0, 1}
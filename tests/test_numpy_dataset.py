@@ -0,0 +1,103 @@
+"""Test cases for the numpy_dataset module."""
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from othello.agent.random_bot import RandomBot
+from othello.dataset import positions, RECORD, write_dataset
+from othello.game.move import Move
+from othello.match import play_game
+from othello.record import GameRecord
+
+np = pytest.importorskip("numpy")
+
+from othello.numpy_dataset import (  # noqa: E402,I100,I202
+    DTYPE,
+    iter_batches,
+    load_dataset,
+    unpack_masks,
+)
+
+
+@pytest.fixture
+def records() -> List[GameRecord]:
+    """Returns the records of a few random games."""
+    records = []
+    for _ in range(4):
+        moves: List[Move] = []
+        game_state = play_game(RandomBot(), RandomBot(), 6, moves=moves)
+        records.append(GameRecord.from_game(game_state, moves, "a", "b"))
+    return records
+
+
+def test_dtype_matches_record() -> None:
+    """It maps every field of a record at the offset it is packed at."""
+    packed = RECORD.pack(2 ** 64 - 1, 5, 2, -64)
+    (record,) = np.frombuffer(packed, DTYPE)
+    assert DTYPE.itemsize == RECORD.size
+    assert record.tolist() == (2 ** 64 - 1, 5, 2, -64)
+
+
+def test_load_dataset(tmp_path: Path, records: List[GameRecord]) -> None:
+    """It maps every position written, field by field."""
+    path = str(tmp_path / "positions.bin")
+    count = write_dataset(records, path, board_size=6)
+    data = load_dataset(path)
+    assert isinstance(data, np.memmap)
+    assert len(data) == count
+    expected = [row for record in records for row in positions(record)]
+    actual = list(
+        zip(
+            data["own"].tolist(),
+            data["opp"].tolist(),
+            data["player"].tolist(),
+            data["score"].tolist(),
+        )
+    )
+    assert actual == expected
+
+
+def test_load_empty_dataset(tmp_path: Path) -> None:
+    """It returns an empty array for a dataset without positions."""
+    path = str(tmp_path / "positions.bin")
+    write_dataset([], path)
+    assert len(load_dataset(path)) == 0
+
+
+def test_iter_batches(tmp_path: Path, records: List[GameRecord]) -> None:
+    """It yields every position once, in shuffled batches."""
+    path = str(tmp_path / "positions.bin")
+    count = write_dataset(records, path, board_size=6)
+    data = load_dataset(path)
+    batches = list(iter_batches(data, 16, seed=1))
+    assert all(len(batch) == 16 for batch in batches[:-1])
+    assert sum(len(batch) for batch in batches) == count
+    merged = np.sort(np.concatenate(batches))
+    assert (merged == np.sort(np.asarray(data))).all()
+    assert not (np.concatenate(batches) == data).all()
+    again = list(iter_batches(data, 16, seed=1))
+    assert all((a == b).all() for a, b in zip(batches, again))
+
+
+def test_iter_batches_shuffles_within_batches() -> None:
+    """It does not yield the positions of a batch in file order."""
+    data = np.arange(1000)
+    batches = list(iter_batches(data, 100, seed=1))
+    assert not any((batch[1:] > batch[:-1]).all() for batch in batches)
+
+
+def test_iter_batches_drop_last() -> None:
+    """It leaves out a smaller last batch when asked to."""
+    data = np.arange(10)
+    assert [len(batch) for batch in iter_batches(data, 4)] == [4, 4, 2]
+    assert [len(batch) for batch in iter_batches(data, 4, drop_last=True)] == [4, 4]
+
+
+def test_unpack_masks() -> None:
+    """It sets one feature per disc, square by square."""
+    masks = np.array([0b101, 1 << 35], dtype=np.uint64)
+    features = unpack_masks(masks, 6)
+    assert features.shape == (2, 36)
+    assert features[0].nonzero()[0].tolist() == [0, 2]
+    assert features[1].nonzero()[0].tolist() == [35]
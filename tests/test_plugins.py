@@ -0,0 +1,101 @@
+"""Test cases for the plugins module."""
+import json
+from pathlib import Path
+import sys
+from typing import Iterator
+from unittest.mock import Mock
+
+from _pytest.monkeypatch import MonkeyPatch
+import pytest
+
+import othello
+from othello import plugins
+from othello.agent.random_bot import RandomBot
+
+
+@pytest.fixture
+def cache_dir(monkeypatch: MonkeyPatch, tmp_path: Path) -> Iterator[Path]:
+    """Keeps the plugin index in a temporary directory."""
+    monkeypatch.setenv(plugins.CACHE_DIR_VARIABLE, str(tmp_path))
+    plugins.get_index.cache_clear()
+    yield tmp_path
+    plugins.get_index.cache_clear()
+
+
+@pytest.fixture
+def find_plugins(mocker: Mock) -> Mock:
+    """Replaces the entry point lookup with a fixed index."""
+    index = plugins.Index("1.2.3", {"random": "othello.agent.random_bot:RandomBot"})
+    return mocker.patch.object(plugins, "find_plugins", return_value=index)
+
+
+def test_find_plugins() -> None:
+    """It returns the package version and the agent entry point paths."""
+    index = plugins.find_plugins()
+    assert isinstance(index.version, str)
+    assert all(":" in target for target in index.agents.values())
+
+
+def test_get_index_uses_cache(cache_dir: Path, find_plugins: Mock) -> None:
+    """It only looks entry points up until they are cached."""
+    first = plugins.get_index()
+    plugins.get_index.cache_clear()
+    assert plugins.get_index() == first == find_plugins.return_value
+    assert find_plugins.call_count == 1
+    cached = json.loads((cache_dir / plugins.INDEX_FILE).read_text())
+    assert cached["agents"] == first.agents
+
+
+def test_get_index_rebuilds_stale_cache(
+    cache_dir: Path, find_plugins: Mock, mocker: Mock
+) -> None:
+    """It looks entry points up again once distributions change."""
+    plugins.get_index()
+    plugins.get_index.cache_clear()
+    mocker.patch.object(sys, "path", sys.path + [str(cache_dir)])
+    (cache_dir / "other-1.0.dist-info").mkdir()
+    plugins.get_index()
+    assert find_plugins.call_count == 2
+
+
+def test_get_index_ignores_broken_cache(cache_dir: Path, find_plugins: Mock) -> None:
+    """It rebuilds an index file that cannot be parsed."""
+    (cache_dir / plugins.INDEX_FILE).write_text("[")
+    assert plugins.get_index() == find_plugins.return_value
+
+
+def test_get_index_without_cache(
+    monkeypatch: MonkeyPatch, tmp_path: Path, find_plugins: Mock
+) -> None:
+    """It works when the index cannot be written."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv(plugins.CACHE_DIR_VARIABLE, str(blocker / "cache"))
+    plugins.get_index.cache_clear()
+    try:
+        assert plugins.get_index() == find_plugins.return_value
+    finally:
+        plugins.get_index.cache_clear()
+
+
+def test_version(cache_dir: Path, find_plugins: Mock) -> None:
+    """It reads the package version from the index."""
+    assert othello.__version__ == "1.2.3"
+    with pytest.raises(AttributeError):
+        othello.missing  # noqa: B018
+
+
+def test_agents_load_lazily(mocker: Mock) -> None:
+    """It imports agent types on first lookup only."""
+    load_agent = mocker.spy(plugins, "load_agent")
+    agents = plugins.Agents({"random": "othello.agent.random_bot:RandomBot"})
+    assert list(agents) == ["random"] and len(agents) == 1
+    assert load_agent.call_count == 0
+    assert agents["random"] is RandomBot
+    assert agents["random"] is RandomBot
+    assert load_agent.call_count == 1
+
+
+def test_load_agent_nested_attribute() -> None:
+    """It follows dotted attribute paths."""
+    assert plugins.load_agent("othello:plugins.Agents") is plugins.Agents
@@ -0,0 +1,96 @@
+"""Test cases for the record module."""
+from pathlib import Path
+
+import pytest
+
+from othello.game.bitboard import BitBoard
+from othello.game.game_state import InvalidMoveError
+from othello.game.move import Move
+from othello.game.player import Player
+from othello.game.point import Point
+from othello.record import GameRecord, read_records, RecordFormatError, RecordWriter
+from tests.helpers import play_record
+
+
+def test_to_line_round_trip() -> None:
+    """It reads back the record it wrote."""
+    record = play_record(metadata={"id": 1})
+    line = record.to_line()
+    assert "\n" not in line
+    assert GameRecord.from_line(line) == record
+
+
+def test_to_line_notation() -> None:
+    """It writes moves in the notation of the human agent."""
+    moves = [Move.play(Point(2, 3)), Move.pass_turn(), Move.resign()]
+    record = GameRecord(8, "a", "b", moves, 4, 1)
+    assert '"moves":"d3 pass resign"' in record.to_line()
+
+
+def test_states_replay_game() -> None:
+    """It rebuilds every game state up to the final position."""
+    record = play_record()
+    states = list(record.states(BitBoard))
+    assert len(states) == len(record.moves) + 1
+    final = states[-1]
+    assert final.is_over()
+    assert final.board.count_discs(Player.BLACK) == record.black_discs
+    assert final.board.count_discs(Player.WHITE) == record.white_discs
+
+
+def test_states_are_lazy() -> None:
+    """It only applies moves as the states are consumed."""
+    moves = [Move.play(Point(2, 3)), Move.play(Point(0, 0))]
+    states = GameRecord(8, "a", "b", moves, 0, 0).states()
+    next(states)
+    next(states)
+    with pytest.raises(InvalidMoveError):
+        next(states)
+
+
+@pytest.mark.parametrize("name", ["games.jsonl", "games.jsonl.gz"])
+def test_write_and_read_records(tmp_path: Path, name: str) -> None:
+    """It streams records to a file and back, plain or compressed."""
+    path = str(tmp_path / name)
+    records = [play_record(4) for _ in range(5)]
+    with RecordWriter(path) as writer:
+        for record in records[:3]:
+            writer.write(record)
+    with RecordWriter(path, append=True) as writer:
+        for record in records[3:]:
+            writer.write(record)
+    assert list(read_records(path)) == records
+
+
+def test_read_records_skips_blank_lines(tmp_path: Path) -> None:
+    """It ignores blank lines between records."""
+    record = play_record(4)
+    path = tmp_path / "games.jsonl"
+    path.write_text(f"\n{record.to_line()}\n\n")
+    assert list(read_records(str(path))) == [record]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "not json",
+        "[]",
+        '{"size": 8}',
+        '{"size": 8, "black": "a", "white": "b", "black_discs": 1, '
+        '"white_discs": 2, "moves": "d3 z99"}',
+    ],
+)
+def test_from_line_invalid(line: str) -> None:
+    """It raises `RecordFormatError` for lines that are not records."""
+    with pytest.raises(RecordFormatError):
+        GameRecord.from_line(line)
+
+
+def test_read_records_reports_line(tmp_path: Path) -> None:
+    """It names the file and line of an invalid record."""
+    path = tmp_path / "games.jsonl"
+    path.write_text(play_record(4).to_line() + "\nnot json\n")
+    records = read_records(str(path))
+    next(records)
+    with pytest.raises(RecordFormatError, match="games.jsonl:2"):
+        next(records)
@@ -0,0 +1,144 @@
+"""Test cases for the server module."""
+import asyncio
+from typing import Awaitable, Callable, List, Tuple, TypeVar
+
+import pytest
+
+from othello.agent.base import Agent
+from othello.agent.human import Human
+from othello.agent.random_bot import RandomBot
+from othello.game.game_state import GameState
+from othello.game.move import Move
+from othello.loadgen import run_load, ServerError
+from othello.server import GameServer
+
+T = TypeVar("T")
+Client = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class FailingBot(Agent):
+    """Bot that fails to select any move."""
+
+    def select_move(self, game_state: GameState) -> Move:
+        """Raises an error."""
+        raise RuntimeError("out of ideas")
+
+
+def run_with_server(
+    client: Callable[[GameServer, int], Awaitable[T]]
+) -> Tuple[GameServer, T]:
+    """Run a client coroutine against a server on a free port."""
+
+    async def run() -> Tuple[GameServer, T]:
+        agents = {"human": Human, "random": RandomBot, "failing": FailingBot}
+        game_server = GameServer(agents, workers=2)
+        server = await game_server.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            result = await client(game_server, port)
+            while game_server.sessions:
+                await asyncio.sleep(0.001)
+            return game_server, result
+        finally:
+            server.close()
+            await server.wait_closed()
+            game_server.executor.shutdown()
+
+    return asyncio.run(run())
+
+
+async def exchange(port: int, commands: List[str]) -> List[str]:
+    """Send commands one at a time and collect the first reply to each."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    replies = [(await reader.readline()).decode().strip()]
+    for command in commands:
+        writer.write(f"{command}\n".encode())
+        replies.append((await reader.readline()).decode().strip())
+    writer.close()
+    return replies
+
+
+def test_ready_lists_agents() -> None:
+    """It greets clients with the names of its agents."""
+    _, replies = run_with_server(lambda server, port: exchange(port, []))
+    assert replies == ["ready human random failing"]
+
+
+def test_new_game() -> None:
+    """It confirms new games with the client's color and board size."""
+    _, replies = run_with_server(
+        lambda server, port: exchange(port, ["new random black 6", "c2"])
+    )
+    assert replies[1] == "start black 6"
+    assert replies[2].startswith("move ")
+
+
+def test_bot_moves_first_for_white() -> None:
+    """It plays the bot's first move when the client plays white."""
+
+    async def client(server: GameServer, port: int) -> List[str]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await reader.readline()
+        writer.write(b"new random white\n")
+        replies = [(await reader.readline()).decode().strip() for _ in range(2)]
+        writer.close()
+        return replies
+
+    _, replies = run_with_server(client)
+    assert replies[0] == "start white 8"
+    assert replies[1] in {"move d3", "move c4", "move f5", "move e6"}
+
+
+@pytest.mark.parametrize(
+    "commands,error",
+    [
+        (["d3"], "error no game in progress"),
+        (["new"], "error usage: new <agent> <black|white> [<size>]"),
+        (["new alphabeta black"], "error unknown agent alphabeta"),
+        (["new human black"], "error agent human cannot play remotely"),
+        (["new random red"], "error unknown color red"),
+        (["new random black 3"], "error invalid board size 3"),
+        (["new random black", "new random black"], "error a game is already"),
+        (["new random black", "z99"], "error invalid move z99"),
+        (["new random black", "a1"], "error Cannot place the disc at"),
+        (["new random black", "pass"], "error Cannot pass when"),
+    ],
+)
+def test_errors(commands: List[str], error: str) -> None:
+    """It reports commands that cannot be carried out."""
+    _, replies = run_with_server(lambda server, port: exchange(port, commands))
+    assert replies[-1].startswith(error)
+
+
+def test_bot_failure_ends_game() -> None:
+    """It reports a bot that fails to move and ends the game."""
+    _, replies = run_with_server(
+        lambda server, port: exchange(port, ["new failing black", "d3", "c4"])
+    )
+    assert replies[2] == "error bot failed: RuntimeError('out of ideas')"
+    assert replies[3] == "error no game in progress"
+
+
+def test_resign_ends_game() -> None:
+    """It ends the game when the client resigns."""
+    _, replies = run_with_server(
+        lambda server, port: exchange(port, ["new random black", "resign"])
+    )
+    assert replies[-1] == "over 2 2"
+
+
+def test_concurrent_sessions() -> None:
+    """It plays many sessions at once to the end."""
+    server, result = run_with_server(
+        lambda server, port: run_load("127.0.0.1", port, 50, 2, "random", 4, seed=0)
+    )
+    assert result.sessions == 50 and result.games == 100
+    assert server.games == 100
+    assert server.moves == result.moves > 0
+    assert result.moves_per_second > 0
+
+
+def test_load_generator_reports_errors() -> None:
+    """It fails the load test when the server rejects a command."""
+    with pytest.raises(ServerError, match="unknown agent"):
+        run_with_server(lambda server, port: run_load("127.0.0.1", port, 2, 1, "x"))
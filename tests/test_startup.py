@@ -0,0 +1,47 @@
+"""Test cases for the startup time of the command-line interface."""
+import os
+from pathlib import Path
+import subprocess  # noqa: S404
+import sys
+from typing import List, Set
+
+import pytest
+
+# Modules that are slow to import and not needed to start the interface.
+SLOW_MODULES = [
+    "pkg_resources",
+    "numpy",
+    "importlib.metadata",
+    "multiprocessing",
+    "concurrent.futures.process",
+    "othello.tournament",
+    "othello.book",
+    "othello.game.endgame",
+]
+
+
+def imported_modules(cache_dir: Path, *args: str) -> Set[str]:
+    """Run the interface and return the names of the modules it imported."""
+    env = dict(os.environ, OTHELLO_CACHE_DIR=str(cache_dir))
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-m", "othello", *args],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return {
+        line.rpartition("|")[2].strip()
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize("args", [["--version"], ["match", "--help"]])
+def test_startup_skips_slow_imports(tmp_path: Path, args: List[str]) -> None:
+    """It starts without importing modules the command does not use."""
+    imported_modules(tmp_path, "--version")
+    modules = imported_modules(tmp_path, *args)
+    assert "othello.plugins" in modules
+    assert not modules.intersection(SLOW_MODULES)
@@ -0,0 +1,98 @@
+"""Test cases for the tournament module."""
+import math
+from typing import Dict, List, Type
+
+import pytest
+
+from othello import tournament
+from othello.agent.base import Agent
+from othello.agent.random_bot import RandomBot
+from othello.game.player import Player
+from othello.tournament import Crosstable, GameOutcome
+
+
+@pytest.fixture
+def entrants() -> Dict[str, Type[Agent]]:
+    """Returns three random bots under different names."""
+    return {"a": RandomBot, "b": RandomBot, "c": RandomBot}
+
+
+def test_round_robin_schedule(entrants: Dict[str, Type[Agent]]) -> None:
+    """It pairs every agent with every other agent."""
+    tasks = tournament.schedule(entrants, games_per_pair=2)
+    assert [(task.black, task.white) for task in tasks] == [
+        ("a", "b"),
+        ("b", "a"),
+        ("a", "c"),
+        ("c", "a"),
+        ("b", "c"),
+        ("c", "b"),
+    ]
+
+
+def test_gauntlet_schedule(entrants: Dict[str, Type[Agent]]) -> None:
+    """It only pairs the gauntlet agent with the others."""
+    tasks = tournament.schedule(entrants, games_per_pair=1, gauntlet="c", seed=5)
+    assert [(task.black, task.white) for task in tasks] == [("c", "a"), ("c", "b")]
+    assert [task.seed for task in tasks] == [5, 6]
+
+
+def test_play_task_is_deterministic(entrants: Dict[str, Type[Agent]]) -> None:
+    """It plays the same game for the same seed."""
+    task = tournament.schedule(entrants, games_per_pair=1, board_size=6)[0]
+    assert tournament.play_task(task) == tournament.play_task(task)
+
+
+def test_outcome_to_record(entrants: Dict[str, Type[Agent]]) -> None:
+    """It keeps the moves of the game to replay it."""
+    task = tournament.schedule(entrants, games_per_pair=1, board_size=6)[0]
+    outcome = tournament.play_task(task)
+    record = outcome.to_record(6)
+    final = list(record.states())[-1]
+    assert final.is_over()
+    assert final.board.count_discs(Player.BLACK) == outcome.black_discs
+    assert record.metadata == {"game": outcome.number}
+
+
+def test_run_serial_and_parallel_agree(entrants: Dict[str, Type[Agent]]) -> None:
+    """It produces the same results in one process and over a pool."""
+    serial = tournament.run(entrants, 2, jobs=1, board_size=4)
+    parallel = tournament.run(entrants, 2, jobs=2, board_size=4)
+    assert serial.scores.keys() == parallel.scores.keys()
+    for key, scores in serial.scores.items():
+        assert sorted(scores) == sorted(parallel.scores[key])
+
+
+def test_run_streams_outcomes(entrants: Dict[str, Type[Agent]]) -> None:
+    """It reports every outcome as it completes."""
+    outcomes: List[GameOutcome] = []
+    tournament.run(entrants, 2, jobs=1, board_size=4, on_outcome=outcomes.append)
+    assert sorted(outcome.number for outcome in outcomes) == list(range(6))
+
+
+def test_elo_difference() -> None:
+    """It converts scores to Elo differences."""
+    assert tournament.elo_difference(0.5) == 0
+    assert round(tournament.elo_difference(0.75)) == 191
+    assert tournament.elo_difference(1) == math.inf
+    assert tournament.elo_difference(0) == -math.inf
+
+
+def test_crosstable_elo() -> None:
+    """It estimates ratings with confidence intervals from game scores."""
+    crosstable = Crosstable(["a", "b"])
+    for number, (black_discs, white_discs) in enumerate([(40, 24), (30, 34)]):
+        crosstable.add(GameOutcome(number, "a", "b", black_discs, white_discs))
+    crosstable.add(GameOutcome(2, "b", "a", 32, 32))
+    assert crosstable.results("a") == [1.0, 0.0, 0.5]
+    elo, low, high = crosstable.elo("a")
+    assert elo == 0 and low < 0 < high
+
+
+def test_crosstable_str() -> None:
+    """It prints a score per pairing."""
+    crosstable = Crosstable(["a", "b"])
+    crosstable.add(GameOutcome(0, "a", "b", 40, 24))
+    lines = str(crosstable).splitlines()
+    assert lines[1].startswith("a           -    1/1")
+    assert lines[2].startswith("b         0/1      -")